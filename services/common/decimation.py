@@ -0,0 +1,122 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import numpy
+
+
+def unwrap_longitudes(longitudes):
+    """
+    Removes the jumps of the longitudes at the antimeridian, so that the
+    track is continuous: consecutive longitudes never differ in more than 180
+    degrees.
+    :param longitudes: NumPy array with the longitudes (degrees)
+    :return: NumPy array with the unwrapped longitudes (degrees)
+    """
+    return numpy.rad2deg(numpy.unwrap(numpy.deg2rad(longitudes)))
+
+
+def antimeridian_crossings(longitudes):
+    """
+    Finds the segments of the track that cross the antimeridian.
+    :param longitudes: NumPy array with the longitudes (degrees)
+    :return: NumPy array with the indexes of the points right before each
+                crossing
+    """
+    return numpy.flatnonzero(numpy.abs(numpy.diff(longitudes)) > 180.0)
+
+
+def by_count(length, points):
+    """
+    Selects, at most, the given number of points evenly spread along the
+    track, always including the first and the last ones.
+    :param length: Number of points of the track
+    :param points: Maximum number of points to be selected, at least 2
+    :return: NumPy array with the indexes of the selected points
+    """
+    if points < 2:
+        raise ValueError('At least 2 points must be selected.')
+    if length <= points:
+        return numpy.arange(length)
+
+    return numpy.unique(
+        numpy.rint(numpy.linspace(0, length - 1, points)).astype(int)
+    )
+
+
+def simplify(latitudes, longitudes, tolerance):
+    """
+    Simplifies the track with the Ramer-Douglas-Peucker algorithm: the
+    selected points are the minimum ones for which no point of the original
+    track deviates more than the tolerance from the simplified polyline. The
+    distances are measured in the (latitude, longitude) plane, over the
+    unwrapped longitudes. Both points of each segment crossing the
+    antimeridian are always kept, so that the clients can split the track
+    there.
+    :param latitudes: NumPy array with the latitudes (degrees)
+    :param longitudes: NumPy array with the longitudes (degrees)
+    :param tolerance: Maximum deviation (degrees)
+    :return: NumPy array with the sorted indexes of the selected points
+    """
+    latitudes = numpy.asarray(latitudes, dtype=numpy.float64)
+    longitudes = numpy.asarray(longitudes, dtype=numpy.float64)
+    length = len(latitudes)
+
+    if length < 3:
+        return numpy.arange(length)
+
+    crossings = antimeridian_crossings(longitudes)
+    longitudes = unwrap_longitudes(longitudes)
+
+    keep = numpy.zeros(length, dtype=bool)
+    keep[0] = keep[-1] = True
+    keep[crossings] = keep[crossings + 1] = True
+
+    # Each one of the spans in between two points already kept is simplified
+    # independently.
+    stack = [
+        (a, b) for a, b in zip(
+            numpy.flatnonzero(keep)[:-1], numpy.flatnonzero(keep)[1:]
+        ) if b - a > 1
+    ]
+
+    while stack:
+
+        a, b = stack.pop()
+        d_lat = latitudes[b] - latitudes[a]
+        d_lng = longitudes[b] - longitudes[a]
+        p_lat = latitudes[a + 1:b] - latitudes[a]
+        p_lng = longitudes[a + 1:b] - longitudes[a]
+        norm = numpy.hypot(d_lat, d_lng)
+
+        if norm > 0:
+            distances = numpy.abs(p_lat * d_lng - p_lng * d_lat) / norm
+        else:
+            distances = numpy.hypot(p_lat, p_lng)
+
+        i = int(numpy.argmax(distances))
+        if distances[i] <= tolerance:
+            continue
+
+        i += a + 1
+        keep[i] = True
+
+        if i - a > 1:
+            stack.append((a, i))
+        if b - i > 1:
+            stack.append((i, b))
+
+    return numpy.flatnonzero(keep)
@@ -0,0 +1,294 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import collections
+import hashlib
+import logging
+import math
+import ephem
+import numpy
+from website import settings as sn_settings
+
+logger = logging.getLogger('common')
+
+
+def tle_key(l1, l2):
+    """
+    Creates the key that identifies the ephemeris of a given TLE within the
+    cache: a digest of the two lines with the orbital elements, so that the
+    entries of a TLE stop being reachable as soon as its lines change.
+    :param l1: Line#1 of the TLE file (str or bytes)
+    :param l2: Line#2 of the TLE file (str or bytes)
+    :return: String with the hexadecimal digest
+    """
+    if isinstance(l1, bytes):
+        l1 = str(l1, 'ascii')
+    if isinstance(l2, bytes):
+        l2 = str(l2, 'ascii')
+
+    return hashlib.md5(
+        (l1.strip() + '\n' + l2.strip()).encode('ascii', 'ignore')
+    ).hexdigest()
+
+
+class Ephemeris(object):
+    """
+    Positions of a spacecraft sampled along a time grid. The dates are kept
+    in the Ephem format (number of days), the sub-satellite point in radians
+    and the positions as Earth-fixed (x, y, z) coordinates in meters.
+    """
+
+    def __init__(self, dates, sublat, sublong, positions):
+        self.dates = dates
+        self.sublat = sublat
+        self.sublong = sublong
+        self.positions = positions
+
+    def __len__(self):
+        return len(self.dates)
+
+    @property
+    def nbytes(self):
+        """
+        Memory used by the arrays of this ephemeris.
+        """
+        return self.dates.nbytes + self.sublat.nbytes +\
+            self.sublong.nbytes + self.positions.nbytes
+
+    def take(self, indexes):
+        """
+        Creates a new ephemeris with only the samples at the given indexes.
+        :param indexes: Slice or NumPy array with the indexes of the samples
+        :return: The new Ephemeris object
+        """
+        return Ephemeris(
+            self.dates[indexes], self.sublat[indexes],
+            self.sublong[indexes], self.positions[indexes]
+        )
+
+    @staticmethod
+    def concatenate(ephemerides):
+        """
+        Joins the samples of the given ephemerides, in the given order.
+        :param ephemerides: List with the Ephemeris objects
+        :return: The new Ephemeris object
+        """
+        return Ephemeris(
+            numpy.concatenate([e.dates for e in ephemerides]),
+            numpy.concatenate([e.sublat for e in ephemerides]),
+            numpy.concatenate([e.sublong for e in ephemerides]),
+            numpy.concatenate([e.positions for e in ephemerides])
+        )
+
+
+# Entry of the cache: the regular grid is defined by its first date (Ephem
+# days) and the step in between samples (seconds). Since each backend yields
+# slightly different results, the name of the propagator is also recorded.
+_CacheEntry = collections.namedtuple(
+    '_CacheEntry', ['key', 'backend', 'start', 'step', 'ephemeris']
+)
+
+
+class EphemerisCache(object):
+    """
+    In-memory LRU cache with the ephemerides of the spacecraft. The
+    ephemerides are sampled along regular grids and are shared by all the
+    simulations of the same TLE: the groundtracks read the samples of the grid
+    directly, whereas the calculation of the passes can reuse any grid that
+    is, at least, as dense as its own sampling step. The least recently used
+    entries are evicted whenever the memory used by all the stored arrays
+    exceeds the budget.
+    """
+
+    # Tolerance (in samples) for considering that a date lies on a grid.
+    _GRID_TOLERANCE = 1e-4
+
+    def __init__(self, budget=None):
+        """
+        Constructor.
+        :param budget: Maximum number of bytes for the stored arrays, the
+                        value from the settings is used by default
+        """
+        if budget is None:
+            budget = sn_settings.EPHEMERIS_CACHE_SIZE
+
+        self.budget = budget
+        self.nbytes = 0
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Removes all the entries from the cache.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+
+    def invalidate(self, l1, l2):
+        """
+        Removes all the entries for the given TLE from the cache.
+        :param l1: Line#1 of the TLE file
+        :param l2: Line#2 of the TLE file
+        :return: Number of entries removed
+        """
+        key = tle_key(l1, l2)
+        removed = [k for k, e in self._entries.items() if e.key == key]
+
+        for k in removed:
+            self._remove(k)
+
+        return len(removed)
+
+    def _remove(self, k):
+        """Private method
+        Removes the entry with the given internal key.
+        """
+        entry = self._entries.pop(k)
+        self.nbytes -= entry.ephemeris.nbytes
+
+    def _store(self, entry):
+        """Private method
+        Stores the new entry as the most recently used one and evicts the
+        least recently used ones until the budget is met again.
+        """
+        k = (entry.key, entry.backend, entry.start, entry.step)
+        if k in self._entries:
+            self._remove(k)
+
+        self._entries[k] = entry
+        self.nbytes += entry.ephemeris.nbytes
+
+        while self.nbytes > self.budget and len(self._entries) > 1:
+            self._remove(next(iter(self._entries)))
+
+    def _find(self, propagator, key, start, end, step, exact):
+        """Private method
+        Looks for an entry whose grid covers the [start, end] interval. If
+        exact is set, the grid must have the given step and contain the start
+        date as one of its samples; otherwise, any grid that is at least as
+        dense as the given step is valid.
+        :return: (entry, first index) tuple or (None, None)
+        """
+        for k, entry in self._entries.items():
+
+            if entry.key != key or entry.backend != propagator.name:
+                continue
+            if exact and entry.step != step:
+                continue
+            if entry.step > step:
+                continue
+
+            position = (start - entry.start) / (entry.step * ephem.second)
+            if position < -self._GRID_TOLERANCE:
+                continue
+            if entry.ephemeris.dates[-1] < end:
+                continue
+
+            index = int(round(position))
+            if exact:
+                if abs(position - index) > self._GRID_TOLERANCE:
+                    continue
+            elif entry.ephemeris.dates[index] > start:
+                index -= 1
+
+            self._entries.move_to_end(k)
+            return entry, max(index, 0)
+
+        return None, None
+
+    def _create(self, propagator, key, start, end, step):
+        """Private method
+        Samples a new grid that starts at the given date and whose last
+        sample is not earlier than the end date.
+        """
+        step_days = step * ephem.second
+        n_samples = int(math.ceil((end - start) / step_days)) + 1
+        dates = start + step_days * numpy.arange(n_samples)
+
+        entry = _CacheEntry(
+            key=key, backend=propagator.name, start=start, step=step,
+            ephemeris=Ephemeris(dates, *propagator.sample(dates))
+        )
+        self._store(entry)
+
+        return entry
+
+    def get_grid(self, propagator, key, start, end, step):
+        """
+        Returns the ephemeris sampled along the regular grid that starts at
+        the given date, with the given step and that covers the interval up to
+        the end date, this is, the last sample is the first one that is not
+        earlier than the end date.
+        :param propagator: Propagator for the spacecraft (see
+                            <services.common.propagators>), only used in
+                            case the ephemeris has to be calculated
+        :param key: Key of the TLE of the spacecraft (see <tle_key>)
+        :param start: Ephem date (float) with the start of the interval
+        :param end: Ephem date (float) with the end of the interval
+        :param step: Step in between two consecutive samples (seconds)
+        :return: Ephemeris object
+        """
+        entry, index = self._find(propagator, key, start, end, step, True)
+
+        if entry is None:
+            entry, index = self._create(propagator, key, start, end, step), 0
+
+        last = numpy.searchsorted(
+            entry.ephemeris.dates,
+            end - self._GRID_TOLERANCE * step * ephem.second
+        )
+        return entry.ephemeris.take(slice(index, last + 1))
+
+    def get_window(self, propagator, key, start, end, step):
+        """
+        Returns the ephemeris for the [start, end] interval sampled, at
+        least, every "step" seconds. The first and the last samples are
+        always the start and the end of the interval, the inner samples are
+        taken from the cached grids whenever possible.
+        :param propagator: Propagator for the spacecraft
+        :param key: Key of the TLE of the spacecraft (see <tle_key>)
+        :param start: Ephem date (float) with the start of the interval
+        :param end: Ephem date (float) with the end of the interval
+        :param step: Maximum step in between two samples (seconds)
+        :return: Ephemeris object
+        """
+        entry, index = self._find(propagator, key, start, end, step, False)
+
+        if entry is None:
+            entry, index = self._create(propagator, key, start, end, step), 0
+
+        dates = entry.ephemeris.dates
+        stride = max(int(step // entry.step), 1)
+        last = numpy.searchsorted(dates, end)
+
+        inner = numpy.arange(index, last, stride)
+        inner = inner[(dates[inner] > start) & (dates[inner] < end)]
+
+        edges = numpy.array([start, end])
+        edges = Ephemeris(edges, *propagator.sample(edges))
+
+        return Ephemeris.concatenate([
+            edges.take(slice(0, 1)),
+            entry.ephemeris.take(inner),
+            edges.take(slice(1, 2))
+        ])
+
+
+# Cache shared by all the simulations within this process.
+cache = EphemerisCache()
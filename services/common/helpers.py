@@ -19,7 +19,7 @@ import base64
 import datetime
 
 from django.contrib.auth.models import User
-from django.db import transaction, IntegrityError
+from django.db import connection, transaction, IntegrityError
 from django.test.client import RequestFactory
 
 from services.accounts.models import UserProfile
@@ -381,6 +381,44 @@ def create_jrpc_daily_rule(
     }
 
 
+def create_jrpc_weekly_rule(
+    operation=rules.RULE_OP_ADD,
+    date_i=None, date_f=None,
+    weekdays=None, starting_time=None, ending_time=None
+):
+
+    if date_i is None:
+        date_i = misc.get_today_utc() + datetime.timedelta(days=1)
+    if date_f is None:
+        date_f = misc.get_today_utc() + datetime.timedelta(days=366)
+    if weekdays is None:
+        weekdays = rules.RULE_WEEKLY_WEEKDAYS[:5]
+
+    now = misc.get_now_utc()
+
+    if starting_time is None:
+        starting_time = now + datetime.timedelta(minutes=30)
+    if ending_time is None:
+        ending_time = now + datetime.timedelta(minutes=45)
+
+    return {
+        rules.RULE_OP: operation,
+        rules.RULE_PERIODICITY: rules.RULE_PERIODICITY_WEEKLY,
+        rules.RULE_DATES: {
+            rules.RULE_DAILY_I_DATE: date_i.isoformat(),
+            rules.RULE_DAILY_F_DATE: date_f.isoformat(),
+            rules.RULE_DATES: [
+                {
+                    rules.RULE_WEEKLY_DATE_DAY: d,
+                    rules.RULE_S_TIME: starting_time.isoformat(),
+                    rules.RULE_E_TIME: ending_time.isoformat()
+                }
+                for d in weekdays
+            ]
+        },
+    }
+
+
 def create_identifier_list(json_slot_list):
     identifier_l = []
 
@@ -389,3 +427,24 @@ def create_identifier_list(json_slot_list):
         identifier_l.append(l_i['identifier'])
 
     return identifier_l
+
+
+def explain(queryset, analyze=True):
+    """
+    Returns the plan of the database for the query of the given queryset.
+    :param queryset: The queryset
+    :param analyze: Flag that indicates whether the statistics of the table
+                    of the model have to be updated first
+    :return: String with the plan, one node per line
+    """
+    sql, params = queryset.query.sql_with_params()
+
+    with connection.cursor() as cursor:
+        if analyze:
+            cursor.execute(
+                'ANALYZE ' + connection.ops.quote_name(
+                    queryset.model._meta.db_table
+                )
+            )
+        cursor.execute('EXPLAIN ' + sql, params)
+        return '\n'.join(row[0] for row in cursor.fetchall())
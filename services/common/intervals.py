@@ -0,0 +1,265 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import datetime
+import numpy
+import pytz
+
+# Origin and resolution of the epoch values (microseconds since 1.1.1970).
+EPOCH = pytz.utc.localize(datetime.datetime(1970, 1, 1))
+RESOLUTION = datetime.timedelta(microseconds=1)
+
+
+def to_epoch(dates):
+    """
+    Converts the given datetime objects (UTC localized) into epoch values.
+    :param dates: Iterable with the datetime objects
+    :return: NumPy array (int64) with the epoch values
+    """
+    return numpy.fromiter(
+        ((d - EPOCH) // RESOLUTION for d in dates), dtype=numpy.int64
+    )
+
+
+def from_epoch(values):
+    """
+    Converts the given epoch values into datetime objects (UTC localized).
+    :param values: Iterable with the epoch values
+    :return: List with the datetime objects
+    """
+    return [EPOCH + int(v) * RESOLUTION for v in values]
+
+
+def _covering(starts, ends, times):
+    """
+    Counts the intervals that cover each one of the segments that start at
+    the given times and end at the next one. The intervals do not have to be
+    sorted, neither have to be disjoint.
+    :param starts: NumPy array with the starts of the intervals
+    :param ends: NumPy array with the ends of the intervals
+    :param times: Sorted NumPy array with the starts of the segments
+    :return: NumPy array with the number of intervals covering each segment
+    """
+    return numpy.searchsorted(
+        numpy.sort(starts), times, side='right'
+    ) - numpy.searchsorted(
+        numpy.sort(ends), times, side='right'
+    )
+
+
+def _segments(times, inside):
+    """
+    Joins the consecutive segments that are inside of the set.
+    :param times: Sorted NumPy array with the starts of the segments, the
+                    last one ending at the infinite (repeated times yield
+                    empty segments, which are ignored)
+    :param inside: NumPy array of booleans with the segments that are inside
+    :return: (starts, ends) tuple with the NumPy arrays of the intervals
+    """
+    edges = numpy.diff(numpy.concatenate(([0], inside.astype(numpy.int8))))
+    return times[edges == 1], times[edges == -1]
+
+
+class IntervalSet(object):
+    """
+    Set of disjoint intervals [start, end), stored as sorted arrays with the
+    epoch values of their limits. Consecutive intervals that touch each other
+    are always joined, so two sets with the same points are always equal.
+
+    The operations in between sets are implemented with a sweep over the
+    sorted limits of the intervals of both sets, vectorized with NumPy. The
+    conversions from and to datetime objects (see <from_slots>, <to_slots>)
+    are done element by element in Python, they dominate the cost for the
+    small sets, so the sets should be converted once and kept in epoch form.
+    """
+
+    def __init__(self, starts=(), ends=()):
+        """
+        Creates the set with the union of the given intervals, which do not
+        have to be sorted, neither have to be disjoint. The empty intervals
+        are discarded.
+        :param starts: Iterable with the epoch values of the starts
+        :param ends: Iterable with the epoch values of the ends
+        """
+        starts = numpy.asarray(starts, dtype=numpy.int64)
+        ends = numpy.asarray(ends, dtype=numpy.int64)
+
+        if starts.shape != ends.shape:
+            raise ValueError('@IntervalSet: len(starts) != len(ends)')
+        if numpy.any(starts > ends):
+            raise ValueError('@IntervalSet: start > end')
+
+        times = numpy.sort(numpy.concatenate((starts, ends)))
+        self.starts, self.ends = _segments(
+            times, _covering(starts, ends, times) > 0
+        )
+
+    @classmethod
+    def _from_disjoint(cls, starts, ends):
+        """
+        Creates the set directly from arrays that are already sorted, with
+        disjoint and not touching intervals.
+        :param starts: NumPy array with the starts
+        :param ends: NumPy array with the ends
+        :return: The new IntervalSet object
+        """
+        result = cls.__new__(cls)
+        result.starts, result.ends = starts, ends
+        return result
+
+    @classmethod
+    def from_slots(cls, slots):
+        """
+        Creates the set with the union of the given slots.
+        :param slots: Iterable with the (start, end) tuples of datetime
+                        objects (UTC localized)
+        :return: The new IntervalSet object
+        """
+        slots = list(slots)
+        return cls(
+            to_epoch(s[0] for s in slots), to_epoch(s[1] for s in slots)
+        )
+
+    def to_slots(self):
+        """
+        Returns the intervals of this set as slots.
+        :return: List with the sorted (start, end) tuples of datetime objects
+                    (UTC localized)
+        """
+        return list(zip(from_epoch(self.starts), from_epoch(self.ends)))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __eq__(self, other):
+        return numpy.array_equal(self.starts, other.starts) and\
+            numpy.array_equal(self.ends, other.ends)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'IntervalSet(' + repr(list(zip(
+            self.starts.tolist(), self.ends.tolist()
+        ))) + ')'
+
+    def _sweep(self, other, operation):
+        """
+        Combines this set with the other one through a sweep over the limits
+        of the intervals of both sets.
+        :param other: The other IntervalSet object
+        :param operation: Function that, given the arrays of booleans with
+                            the segments inside of each set, returns the ones
+                            that are inside of the result
+        :return: The resulting IntervalSet object
+        """
+        times = numpy.sort(numpy.concatenate(
+            (self.starts, self.ends, other.starts, other.ends)
+        ))
+        return IntervalSet._from_disjoint(*_segments(times, operation(
+            _covering(self.starts, self.ends, times) > 0,
+            _covering(other.starts, other.ends, times) > 0
+        )))
+
+    def union(self, other):
+        """
+        :param other: The other IntervalSet object
+        :return: IntervalSet with the points within any of both sets
+        """
+        return self._sweep(other, numpy.logical_or)
+
+    def intersection(self, other):
+        """
+        :param other: The other IntervalSet object
+        :return: IntervalSet with the points within both sets
+        """
+        return self._sweep(other, numpy.logical_and)
+
+    def difference(self, other):
+        """
+        :param other: The other IntervalSet object
+        :return: IntervalSet with the points of this set that are not within
+                    the other one
+        """
+        return self._sweep(
+            other, lambda a, b: numpy.logical_and(a, numpy.logical_not(b))
+        )
+
+    def clip(self, start, end):
+        """
+        Cuts off the intervals of this set within the given window.
+        :param start: Epoch value for the start of the window
+        :param end: Epoch value for the end of the window
+        :return: IntervalSet with the points of this set within the window,
+                    empty if the window is empty (start >= end)
+        """
+        if start >= end:
+            return IntervalSet()
+
+        inside = (self.ends > start) & (self.starts < end)
+        return IntervalSet._from_disjoint(
+            numpy.maximum(self.starts[inside], start),
+            numpy.minimum(self.ends[inside], end)
+        )
+
+    __or__ = union
+    __and__ = intersection
+    __sub__ = difference
+
+
+def overlaps(slots, sorted_slots):
+    """
+    Finds, for each one of the given slots, the ones of the second list that
+    it overlaps with. Unlike the operations of the IntervalSet objects, the
+    slots keep their identity, so both lists can have slots that overlap with
+    each other. The search is done with a binary search over the slots of the
+    second list, which are usually disjoint.
+    :param slots: List with the (start, end) tuples of datetime objects
+    :param sorted_slots: List with the (start, end) tuples of datetime
+                            objects, sorted by their start
+    :return: List with the (i, j, (start, end)) tuples, with the indexes of
+                both slots and their intersection, sorted by (i, j)
+    """
+    if not slots or not sorted_slots:
+        return []
+
+    starts = to_epoch(s[0] for s in slots)
+    ends = to_epoch(s[1] for s in slots)
+    s_starts = to_epoch(s[0] for s in sorted_slots)
+    s_ends = to_epoch(s[1] for s in sorted_slots)
+
+    # Range of the slots of the second list that can overlap with each slot,
+    # which only includes false candidates if they overlap with each other.
+    first = numpy.searchsorted(
+        numpy.maximum.accumulate(s_ends), starts, side='right'
+    )
+    last = numpy.searchsorted(s_starts, ends, side='left')
+    counts = numpy.maximum(last - first, 0)
+
+    i = numpy.repeat(numpy.arange(len(slots)), counts)
+    j = numpy.repeat(first, counts) + numpy.arange(counts.sum()) -\
+        numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+    overlapping = s_ends[j] > starts[i]
+    i, j = i[overlapping], j[overlapping]
+
+    return list(zip(
+        i.tolist(), j.tolist(), zip(
+            from_epoch(numpy.maximum(starts[i], s_starts[j])),
+            from_epoch(numpy.minimum(ends[i], s_ends[j]))
+        )
+    ))
@@ -18,6 +18,7 @@ __author__ = 'rtubiopa@calpoly.edu'
 
 import datetime
 import ephem
+import numpy
 from services.common import misc as sn_misc
 
 
@@ -59,16 +60,31 @@ class mock__OrbitalSimulator(object):
             )
         ]
 
+    def calculate_pass_slots(
+        self, groundstations, start, end,
+        minimum_slot_duration=datetime.timedelta(minutes=1), geometry=False
+    ):
+
+        return [
+            [
+                slot + (None,) if geometry else slot
+                for slot in self.calculate_pass_slot(
+                    start, end, minimum_slot_duration
+                )
+            ]
+            for _ in groundstations
+        ]
+
     # noinspection PyMethodMayBeStatic
     def calculate_groundtrack(
         self, spacecraft_tle, interval=None,
         timestep=datetime.timedelta(seconds=20)
     ):
 
-        d_0 = datetime.datetime.utcnow()
+        d_0 = sn_misc.get_now_utc()
 
-        return [{
-            'timestamp': d_0,
-            'latitude': 10.0,
-            'longitude': 10
-        }]
+        return (
+            numpy.array([d_0.timestamp()]),
+            numpy.array([10.0]),
+            numpy.array([10.0])
+        )
@@ -0,0 +1,642 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import collections
+import logging
+import ephem
+import numpy
+from website import settings as sn_settings
+
+logger = logging.getLogger('common')
+
+# Offset in between the Ephem dates (Dublin Julian Days) and the Julian Days.
+_EPHEM_2_JD = 2415020.0
+
+# WGS72 constants, the ones used for generating the TLEs.
+_WGS72_RADIUS = 6378.135
+_WGS72_MU = 398600.8
+_XKE = 60.0 / numpy.sqrt(_WGS72_RADIUS ** 3 / _WGS72_MU)
+_J2 = 0.001082616
+_J3 = -0.00000253881
+_J4 = -0.00000165597
+_J3OJ2 = _J3 / _J2
+_TWO_PI = 2.0 * numpy.pi
+
+# WGS84 ellipsoid, used for the location of the groundstations.
+_WGS84_RADIUS = 6378137.0
+_WGS84_E2 = 6.69437999014e-3
+
+# Orbital periods longer than this one (minutes) require the deep space
+# perturbations (SDP4), which are not implemented by the vectorized backend.
+SGP4_MAXIMUM_PERIOD = 225.0
+
+
+def refract(altitudes, pressure, temperature):
+    """
+    Converts the true altitudes into the apparent ones, using the same
+    refraction model as the one used by PyEphem (libastro), so that the
+    elevations of both backends can be compared against the horizon of the
+    groundstations in the same way.
+    :param altitudes: NumPy array with the true altitudes (radians)
+    :param pressure: Atmospheric pressure (mBar)
+    :param temperature: Atmospheric temperature (Celsius)
+    :return: NumPy array with the apparent altitudes (radians)
+    """
+    if pressure <= 0:
+        return altitudes
+
+    k = pressure / (273.0 + temperature)
+    apparent = altitudes
+
+    # The model gives the refraction for an apparent altitude, therefore, it
+    # has to be inverted. Since the refraction changes slowly with the
+    # altitude, a few fixed point iterations are enough.
+    for _ in range(6):
+
+        a_deg = numpy.rad2deg(apparent)
+        low = k * (0.1594 + a_deg * (0.0196 + 0.00002 * a_deg)) / (
+            1.0 + a_deg * (0.505 + 0.0845 * a_deg)
+        )
+        high = 7.888888e-5 * k / numpy.tan(numpy.maximum(apparent, 1e-3))
+        apparent = altitudes + numpy.where(
+            a_deg < 15.0, numpy.deg2rad(low), high
+        )
+
+    return apparent
+
+
+def observer_ecef(observer):
+    """
+    Calculates the Earth-fixed position and the local vertical of the given
+    observer over the WGS84 ellipsoid.
+    :param observer: PyEphem observer for the groundstation
+    :return: (position, vertical) tuple, both as NumPy arrays (meters)
+    """
+    lat = float(observer.lat)
+    lon = float(observer.lon)
+    n = _WGS84_RADIUS / numpy.sqrt(1.0 - _WGS84_E2 * numpy.sin(lat) ** 2)
+
+    vertical = numpy.array([
+        numpy.cos(lat) * numpy.cos(lon),
+        numpy.cos(lat) * numpy.sin(lon),
+        numpy.sin(lat)
+    ])
+    position = numpy.array([
+        (n + observer.elevation) * vertical[0],
+        (n + observer.elevation) * vertical[1],
+        (n * (1.0 - _WGS84_E2) + observer.elevation) * vertical[2]
+    ])
+
+    return position, vertical
+
+
+class PyEphemPropagator(object):
+    """
+    Propagator backed by the SGP4/SDP4 implementation of PyEphem. Each date
+    requires a call to the library, therefore, the dates are processed one by
+    one.
+    """
+
+    name = 'pyephem'
+
+    def __init__(self, l0, l1, l2):
+        self.body = ephem.readtle(l0, l1, l2)
+
+    def sample(self, dates):
+        """
+        Calculates the sub-satellite point and the geocentric position of the
+        spacecraft for each one of the given dates. The model used is the same
+        one used by PyEphem for locating the sub-satellite point, this is, a
+        spherical Earth whose radius is <ephem.earth_radius>.
+        :param dates: NumPy array with the Ephem dates for the samples
+        :return: (sublat, sublong, positions) tuple, being the first two
+                    arrays with the coordinates (radians) of the sub-satellite
+                    point and the last one an array with shape (len(dates), 3)
+                    with the (x, y, z) Earth-fixed coordinates (meters)
+        """
+        sublat = numpy.empty(len(dates))
+        sublong = numpy.empty(len(dates))
+        radius = numpy.empty(len(dates))
+
+        for i, date_i in enumerate(dates):
+
+            self.body.compute(date_i)
+            sublat[i] = self.body.sublat
+            sublong[i] = self.body.sublong
+            radius[i] = self.body.elevation
+
+        radius += ephem.earth_radius
+
+        return sublat, sublong, numpy.column_stack((
+            radius * numpy.cos(sublat) * numpy.cos(sublong),
+            radius * numpy.cos(sublat) * numpy.sin(sublong),
+            radius * numpy.sin(sublat)
+        ))
+
+    @staticmethod
+    def observer_position(observer):
+        """
+        Calculates the position and the local vertical of the observer within
+        the same spherical Earth model as the one of the sampled positions.
+        :param observer: PyEphem observer for the groundstation
+        :return: (position, vertical) tuple, both as NumPy arrays (meters)
+        """
+        gc_lat = numpy.arctan(
+            (1.0 - _WGS84_E2) * numpy.tan(float(observer.lat))
+        )
+        lon = float(observer.lon)
+        vertical = numpy.array([
+            numpy.cos(gc_lat) * numpy.cos(lon),
+            numpy.cos(gc_lat) * numpy.sin(lon),
+            numpy.sin(gc_lat)
+        ])
+
+        return (ephem.earth_radius + observer.elevation) * vertical, vertical
+
+    def elevations(self, observer, dates):
+        """
+        Calculates the apparent elevation of the spacecraft over the horizon
+        of the observer for each one of the given dates.
+        :param observer: PyEphem observer for the groundstation
+        :param dates: NumPy array with the Ephem dates
+        :return: NumPy array with the elevations (radians)
+        """
+        elevations = numpy.empty(len(dates))
+
+        for i, date_i in enumerate(dates):
+
+            observer.date = date_i
+            self.body.compute(observer)
+            elevations[i] = self.body.alt
+
+        return elevations
+
+    def topocentric(self, observer, dates):
+        """
+        Calculates the azimuth, the apparent elevation and the range-rate of
+        the spacecraft as seen from the observer for each one of the given
+        dates, with the complete model of PyEphem.
+        :param observer: PyEphem observer for the groundstation
+        :param dates: NumPy array with the Ephem dates
+        :return: (azimuths, elevations, range_rates) tuple with NumPy arrays,
+                    the angles in radians and the range-rates in meters per
+                    second
+        """
+        azimuths = numpy.empty(len(dates))
+        elevations = numpy.empty(len(dates))
+        range_rates = numpy.empty(len(dates))
+
+        for i, date_i in enumerate(dates):
+
+            observer.date = date_i
+            self.body.compute(observer)
+            azimuths[i] = self.body.az
+            elevations[i] = self.body.alt
+            range_rates[i] = self.body.range_velocity
+
+        return azimuths, elevations, range_rates
+
+
+# Mean elements of a set of TLEs, each field being a NumPy array with one
+# element per TLE. The epoch is kept as an Ephem date.
+Sgp4Elements = collections.namedtuple(
+    'Sgp4Elements',
+    ['epoch', 'bstar', 'inclo', 'nodeo', 'ecco', 'argpo', 'mo', 'no']
+)
+
+
+def _read_exponential(field):
+    """
+    Reads a number written with the implicit decimal point and exponent
+    notation of the TLEs, for instance: " 12345-4" = 0.12345e-4.
+    :param field: String with the field of the TLE
+    :return: The number
+    """
+    field = field.strip()
+    if not field:
+        return 0.0
+
+    sign = -1.0 if field[0] == '-' else 1.0
+    field = field.lstrip('+-')
+
+    return sign * float('0.' + field[:-2]) * 10.0 ** int(field[-2:])
+
+
+def read_sgp4_elements(tles):
+    """
+    Reads the mean elements from the lines of the given TLEs.
+    :param tles: List with (l1, l2) tuples
+    :return: Sgp4Elements object
+    """
+    fields = dict((f, []) for f in Sgp4Elements._fields)
+
+    for l1, l2 in tles:
+
+        year = int(l1[18:20])
+        year += 2000 if year < 57 else 1900
+        fields['epoch'].append(
+            float(ephem.Date(str(year) + '/1/1')) + float(l1[20:32]) - 1.0
+        )
+
+        fields['bstar'].append(_read_exponential(l1[53:61]))
+
+        fields['inclo'].append(numpy.deg2rad(float(l2[8:16])))
+        fields['nodeo'].append(numpy.deg2rad(float(l2[17:25])))
+        fields['ecco'].append(float('0.' + l2[26:33].strip()))
+        fields['argpo'].append(numpy.deg2rad(float(l2[34:42])))
+        fields['mo'].append(numpy.deg2rad(float(l2[43:51])))
+        fields['no'].append(float(l2[52:63]) * _TWO_PI / 1440.0)
+
+    return Sgp4Elements(**dict(
+        (f, numpy.array(v, dtype=numpy.float64)) for f, v in fields.items()
+    ))
+
+
+def sgp4_period(elements):
+    """
+    Calculates the orbital period (minutes) of each one of the given TLEs.
+    :param elements: Sgp4Elements object
+    :return: NumPy array with the periods
+    """
+    return _TWO_PI / elements.no
+
+
+def sgp4_teme(elements, dates):
+    """
+    Propagates all the given TLEs to all the given dates at once with the
+    near-Earth SGP4 model (Hoots and Roehrich, as revised by Vallado et al.).
+    The deep space perturbations are not included, therefore, the periods of
+    the orbits must be shorter than SGP4_MAXIMUM_PERIOD.
+    :param elements: Sgp4Elements object with K TLEs
+    :param dates: NumPy array with T Ephem dates
+    :return: NumPy array with shape (K, T, 3) with the TEME positions (km)
+    """
+    dates = numpy.asarray(dates, dtype=numpy.float64)
+
+    # Initialization, the arrays have shape (K, 1) so that they broadcast
+    # against the (1, T) array with the times.
+    e = dict(
+        (f, getattr(elements, f)[:, None]) for f in Sgp4Elements._fields
+    )
+    ecco, inclo, argpo = e['ecco'], e['inclo'], e['argpo']
+    bstar, mo, nodeo = e['bstar'], e['mo'], e['nodeo']
+
+    eccsq = ecco * ecco
+    omeosq = 1.0 - eccsq
+    rteosq = numpy.sqrt(omeosq)
+    cosio = numpy.cos(inclo)
+    cosio2 = cosio * cosio
+
+    ak = (_XKE / e['no']) ** (2.0 / 3.0)
+    d1 = 0.75 * _J2 * (3.0 * cosio2 - 1.0) / (rteosq * omeosq)
+    del_ = d1 / (ak * ak)
+    adel = ak * (
+        1.0 - del_ * del_ - del_ * (1.0 / 3.0 + 134.0 * del_ * del_ / 81.0)
+    )
+    del_ = d1 / (adel * adel)
+    no = e['no'] / (1.0 + del_)
+
+    ao = (_XKE / no) ** (2.0 / 3.0)
+    sinio = numpy.sin(inclo)
+    po = ao * omeosq
+    con42 = 1.0 - 5.0 * cosio2
+    con41 = -con42 - cosio2 - cosio2
+    posq = po * po
+    rp = ao * (1.0 - ecco)
+
+    isimp = rp < (220.0 / _WGS72_RADIUS + 1.0)
+    perige = (rp - 1.0) * _WGS72_RADIUS
+    sfour = numpy.where(
+        perige < 156.0,
+        numpy.where(perige < 98.0, 20.0, perige - 78.0),
+        78.0
+    )
+    qzms24 = ((120.0 - sfour) / _WGS72_RADIUS) ** 4
+    sfour = sfour / _WGS72_RADIUS + 1.0
+
+    pinvsq = 1.0 / posq
+    tsi = 1.0 / (ao - sfour)
+    eta = ao * ecco * tsi
+    etasq = eta * eta
+    eeta = ecco * eta
+    psisq = numpy.abs(1.0 - etasq)
+    coef = qzms24 * tsi ** 4
+    coef1 = coef / psisq ** 3.5
+    cc2 = coef1 * no * (
+        ao * (1.0 + 1.5 * etasq + eeta * (4.0 + etasq)) +
+        0.375 * _J2 * tsi / psisq * con41 * (
+            8.0 + 3.0 * etasq * (8.0 + etasq)
+        )
+    )
+    cc1 = bstar * cc2
+    circular = ecco <= 1.0e-4
+    cc3 = numpy.where(
+        circular, 0.0,
+        -2.0 * coef * tsi * _J3OJ2 * no * sinio / numpy.where(
+            circular, 1.0, ecco
+        )
+    )
+    x1mth2 = 1.0 - cosio2
+    cc4 = 2.0 * no * coef1 * ao * omeosq * (
+        eta * (2.0 + 0.5 * etasq) + ecco * (0.5 + 2.0 * etasq) -
+        _J2 * tsi / (ao * psisq) * (
+            -3.0 * con41 * (1.0 - 2.0 * eeta + etasq * (1.5 - 0.5 * eeta)) +
+            0.75 * x1mth2 * (2.0 * etasq - eeta * (1.0 + etasq)) *
+            numpy.cos(2.0 * argpo)
+        )
+    )
+    cc5 = 2.0 * coef1 * ao * omeosq * (
+        1.0 + 2.75 * (etasq + eeta) + eeta * etasq
+    )
+
+    cosio4 = cosio2 * cosio2
+    temp1 = 1.5 * _J2 * pinvsq * no
+    temp2 = 0.5 * temp1 * _J2 * pinvsq
+    temp3 = -0.46875 * _J4 * pinvsq * pinvsq * no
+    mdot = no + 0.5 * temp1 * rteosq * con41 +\
+        0.0625 * temp2 * rteosq * (13.0 - 78.0 * cosio2 + 137.0 * cosio4)
+    argpdot = -0.5 * temp1 * con42 +\
+        0.0625 * temp2 * (7.0 - 114.0 * cosio2 + 395.0 * cosio4) +\
+        temp3 * (3.0 - 36.0 * cosio2 + 49.0 * cosio4)
+    xhdot1 = -temp1 * cosio
+    nodedot = xhdot1 + (
+        0.5 * temp2 * (4.0 - 19.0 * cosio2) +
+        2.0 * temp3 * (3.0 - 7.0 * cosio2)
+    ) * cosio
+    omgcof = bstar * cc3 * numpy.cos(argpo)
+    xmcof = numpy.where(
+        circular, 0.0,
+        -2.0 / 3.0 * coef * bstar / numpy.where(circular, 1.0, eeta)
+    )
+    nodecf = 3.5 * omeosq * xhdot1 * cc1
+    t2cof = 1.5 * cc1
+    xlcof = -0.25 * _J3OJ2 * sinio * (3.0 + 5.0 * cosio) / numpy.where(
+        numpy.abs(cosio + 1.0) > 1.5e-12, 1.0 + cosio, 1.5e-12
+    )
+    aycof = -0.5 * _J3OJ2 * sinio
+    delmo = (1.0 + eta * numpy.cos(mo)) ** 3
+    sinmao = numpy.sin(mo)
+    x7thm1 = 7.0 * cosio2 - 1.0
+
+    # The higher order drag terms are dropped for the low perigees.
+    full = numpy.where(isimp, 0.0, 1.0)
+    cc1sq = cc1 * cc1
+    d2 = 4.0 * ao * tsi * cc1sq * full
+    temp = d2 * tsi * cc1 / 3.0
+    d3 = (17.0 * ao + sfour) * temp
+    d4 = 0.5 * temp * ao * tsi * (221.0 * ao + 31.0 * sfour) * cc1
+    t3cof = (d2 + 2.0 * cc1sq) * full
+    t4cof = 0.25 * (3.0 * d3 + cc1 * (12.0 * d2 + 10.0 * cc1sq)) * full
+    t5cof = 0.2 * (
+        3.0 * d4 + 12.0 * cc1 * d3 + 6.0 * d2 * d2 +
+        15.0 * cc1sq * (2.0 * d2 + cc1sq)
+    ) * full
+
+    # Propagation, secular effects of the gravity and the drag.
+    t = (dates[None, :] - e['epoch']) * 1440.0
+    xmdf = mo + mdot * t
+    argpdf = argpo + argpdot * t
+    nodedf = nodeo + nodedot * t
+    t2 = t * t
+    nodem = nodedf + nodecf * t2
+
+    delomg = omgcof * t
+    delm = xmcof * ((1.0 + eta * numpy.cos(xmdf)) ** 3 - delmo)
+    temp = (delomg + delm) * full
+    mm = xmdf + temp
+    argpm = argpdf - temp
+    t3 = t2 * t
+    t4 = t3 * t
+    tempa = 1.0 - cc1 * t - d2 * t2 - d3 * t3 - d4 * t4
+    tempe = bstar * cc4 * t + full * bstar * cc5 * (numpy.sin(mm) - sinmao)
+    templ = t2cof * t2 + t3cof * t3 + t4 * (t4cof + t * t5cof)
+
+    am = (_XKE / no) ** (2.0 / 3.0) * tempa * tempa
+    em = numpy.maximum(ecco - tempe, 1.0e-6)
+    mm = mm + no * templ
+    xlm = mm + argpm + nodem
+    nodem = numpy.mod(nodem, _TWO_PI)
+    argpm = numpy.mod(argpm, _TWO_PI)
+    xlm = numpy.mod(xlm, _TWO_PI)
+    mm = numpy.mod(xlm - argpm - nodem, _TWO_PI)
+
+    # Long period periodics.
+    axnl = em * numpy.cos(argpm)
+    temp = 1.0 / (am * (1.0 - em * em))
+    aynl = em * numpy.sin(argpm) + temp * aycof
+    xl = mm + argpm + nodem + temp * xlcof * axnl
+
+    # Kepler's equation, with the same limited steps as the reference.
+    u = numpy.mod(xl - nodem, _TWO_PI)
+    eo1 = u
+    for _ in range(10):
+        sineo1 = numpy.sin(eo1)
+        coseo1 = numpy.cos(eo1)
+        tem5 = (u - aynl * coseo1 + axnl * sineo1 - eo1) / (
+            1.0 - coseo1 * axnl - sineo1 * aynl
+        )
+        eo1 = eo1 + numpy.clip(tem5, -0.95, 0.95)
+
+    sineo1 = numpy.sin(eo1)
+    coseo1 = numpy.cos(eo1)
+
+    # Short period periodics.
+    ecose = axnl * coseo1 + aynl * sineo1
+    esine = axnl * sineo1 - aynl * coseo1
+    el2 = axnl * axnl + aynl * aynl
+    pl = am * (1.0 - el2)
+    rl = am * (1.0 - ecose)
+    betal = numpy.sqrt(1.0 - el2)
+    temp = esine / (1.0 + betal)
+    sinu = am / rl * (sineo1 - aynl - axnl * temp)
+    cosu = am / rl * (coseo1 - axnl + aynl * temp)
+    su = numpy.arctan2(sinu, cosu)
+    sin2u = (cosu + cosu) * sinu
+    cos2u = 1.0 - 2.0 * sinu * sinu
+    temp = 1.0 / pl
+    temp1 = 0.5 * _J2 * temp
+    temp2 = temp1 * temp
+
+    mrt = rl * (1.0 - 1.5 * temp2 * betal * con41) +\
+        0.5 * temp1 * x1mth2 * cos2u
+    su = su - 0.25 * temp2 * x7thm1 * sin2u
+    xnode = nodem + 1.5 * temp2 * cosio * sin2u
+    xinc = inclo + 1.5 * temp2 * cosio * sinio * cos2u
+
+    sinsu = numpy.sin(su)
+    cossu = numpy.cos(su)
+    snod = numpy.sin(xnode)
+    cnod = numpy.cos(xnode)
+    sini = numpy.sin(xinc)
+    cosi = numpy.cos(xinc)
+
+    radius = mrt * _WGS72_RADIUS
+    return numpy.stack((
+        radius * (-snod * cosi * sinsu + cnod * cossu),
+        radius * (cnod * cosi * sinsu + snod * cossu),
+        radius * (sini * sinsu)
+    ), axis=-1)
+
+
+def gmst(dates):
+    """
+    Greenwich mean sidereal time (IAU 1982) for the given dates.
+    :param dates: NumPy array with the Ephem dates
+    :return: NumPy array with the angles (radians)
+    """
+    tut1 = (numpy.asarray(dates) + _EPHEM_2_JD - 2451545.0) / 36525.0
+    seconds = -6.2e-6 * tut1 ** 3 + 0.093104 * tut1 ** 2 +\
+        (876600.0 * 3600.0 + 8640184.812866) * tut1 + 67310.54841
+    return numpy.mod(numpy.deg2rad(seconds / 240.0), _TWO_PI)
+
+
+def teme_2_ecef(positions, dates):
+    """
+    Rotates the TEME positions into the Earth-fixed frame (the polar motion
+    is neglected).
+    :param positions: NumPy array with shape (..., T, 3)
+    :param dates: NumPy array with the T Ephem dates
+    :return: NumPy array with the same shape as the positions
+    """
+    theta = gmst(dates)
+    c = numpy.cos(theta)
+    s = numpy.sin(theta)
+
+    return numpy.stack((
+        c * positions[..., 0] + s * positions[..., 1],
+        -s * positions[..., 0] + c * positions[..., 1],
+        positions[..., 2]
+    ), axis=-1)
+
+
+def propagate(tles, dates):
+    """
+    Propagates many TLEs to many dates at once.
+    :param tles: List with (l1, l2) tuples
+    :param dates: NumPy array with T Ephem dates
+    :return: NumPy array with shape (len(tles), T, 3) with the Earth-fixed
+                positions (meters)
+    """
+    dates = numpy.asarray(dates, dtype=numpy.float64)
+    return 1000.0 * teme_2_ecef(
+        sgp4_teme(read_sgp4_elements(tles), dates), dates
+    )
+
+
+class Sgp4Propagator(object):
+    """
+    Vectorized propagator that implements the near-Earth SGP4 model directly
+    over NumPy arrays, so that all the dates are propagated with a single
+    call.
+    """
+
+    name = 'sgp4'
+
+    def __init__(self, l0, l1, l2):
+        self.elements = read_sgp4_elements([(l1, l2)])
+
+    def positions(self, dates):
+        """
+        Calculates the Earth-fixed positions of the spacecraft.
+        :param dates: NumPy array with the Ephem dates
+        :return: NumPy array with shape (len(dates), 3) (meters)
+        """
+        dates = numpy.asarray(dates, dtype=numpy.float64)
+        return 1000.0 * teme_2_ecef(
+            sgp4_teme(self.elements, dates)[0], dates
+        )
+
+    def sample(self, dates):
+        """
+        Calculates the sub-satellite point (geodetic coordinates over the
+        WGS84 ellipsoid) and the Earth-fixed position of the spacecraft for
+        each one of the given dates.
+        :param dates: NumPy array with the Ephem dates for the samples
+        :return: (sublat, sublong, positions) tuple, see
+                    <PyEphemPropagator.sample>
+        """
+        positions = self.positions(dates)
+        x, y, z = positions[:, 0], positions[:, 1], positions[:, 2]
+        p = numpy.hypot(x, y)
+
+        sublat = numpy.arctan2(z, p * (1.0 - _WGS84_E2))
+        for _ in range(3):
+            n = _WGS84_RADIUS / numpy.sqrt(
+                1.0 - _WGS84_E2 * numpy.sin(sublat) ** 2
+            )
+            sublat = numpy.arctan2(
+                z + _WGS84_E2 * n * numpy.sin(sublat), p
+            )
+
+        return sublat, numpy.arctan2(y, x), positions
+
+    @staticmethod
+    def observer_position(observer):
+        """
+        Calculates the position and the local vertical of the observer over
+        the WGS84 ellipsoid, see <observer_ecef>.
+        :param observer: PyEphem observer for the groundstation
+        :return: (position, vertical) tuple, both as NumPy arrays (meters)
+        """
+        return observer_ecef(observer)
+
+    def elevations(self, observer, dates):
+        """
+        Calculates the apparent elevation of the spacecraft over the horizon
+        of the observer for each one of the given dates.
+        :param observer: PyEphem observer for the groundstation
+        :param dates: NumPy array with the Ephem dates
+        :return: NumPy array with the elevations (radians)
+        """
+        o_position, o_vertical = observer_ecef(observer)
+        ranges = self.positions(dates) - o_position
+
+        altitudes = numpy.arcsin(
+            ranges.dot(o_vertical) / numpy.sqrt((ranges * ranges).sum(axis=1))
+        )
+        return refract(altitudes, observer.pressure, observer.temp)
+
+
+# Available backends, by name.
+BACKENDS = {
+    PyEphemPropagator.name: PyEphemPropagator,
+    Sgp4Propagator.name: Sgp4Propagator
+}
+
+
+def create(l0, l1, l2, backend=None):
+    """
+    Creates the propagator for the given TLE.
+    :param l0: Line#0 of the TLE file
+    :param l1: Line#1 of the TLE file
+    :param l2: Line#2 of the TLE file
+    :param backend: Name of the backend, by default, SIMULATION_PROPAGATOR
+                    from the settings
+    :return: The propagator object
+    """
+    if backend is None:
+        backend = sn_settings.SIMULATION_PROPAGATOR
+
+    if backend == Sgp4Propagator.name:
+        period = sgp4_period(read_sgp4_elements([(l1, l2)]))[0]
+        if period >= SGP4_MAXIMUM_PERIOD:
+            logger.info(
+                'Deep space orbit, falling back to PyEphem, tle = ' + str(l0)
+            )
+            backend = PyEphemPropagator.name
+
+    return BACKENDS[backend](l0, l1, l2)
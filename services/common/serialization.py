@@ -15,10 +15,21 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
+import base64
 import datetime
 import dateutil.parser
+import numpy
 import pytz
 
+# Formats for the responses with large arrays: the default one is a list of
+# objects, one per item, whereas the columnar ones are objects with parallel
+# arrays, either with fixed-precision integers or with base64-packed float32
+# values.
+FORMAT_OBJECTS = 'objects'
+FORMAT_COLUMNAR = 'columnar'
+FORMAT_COLUMNAR_B64 = 'columnar-b64'
+FORMATS = (FORMAT_OBJECTS, FORMAT_COLUMNAR, FORMAT_COLUMNAR_B64)
+
 
 def serialize_iso8601_date(dt):
     """
@@ -80,3 +91,73 @@ def deserialize_iso8601_time(iso8601_time):
     return dateutil.parser.parse(iso8601_time).astimezone(
         pytz.utc
     ).replace(tzinfo=None).timetz()
+
+
+def read_format(response_format):
+    """
+    Validates the format requested for a response.
+    :param response_format: Name of the format, None for the default one
+    :return: Name of the format
+    """
+    if response_format is None:
+        return FORMAT_OBJECTS
+    if response_format not in FORMATS:
+        raise Exception('Format <' + str(response_format) + '> not supported.')
+    return response_format
+
+
+def delta_encode(values):
+    """
+    Encodes a sequence of integers as its first value followed by the
+    differences in between consecutive values.
+    :param values: Sequence of integers
+    :return: List with the encoded integers
+    """
+    values = numpy.asarray(values, dtype=numpy.int64)
+    if not len(values):
+        return []
+    return numpy.concatenate((values[:1], numpy.diff(values))).tolist()
+
+
+def delta_decode(values):
+    """
+    Decodes a sequence encoded with <delta_encode>.
+    :param values: Sequence with the encoded integers
+    :return: List with the original integers
+    """
+    return numpy.cumsum(numpy.asarray(values, dtype=numpy.int64)).tolist()
+
+
+def fixed_encode(values, precision):
+    """
+    Encodes a sequence of real numbers as integers with the given number of
+    decimal digits, missing values are kept as None.
+    :param values: Sequence of real numbers
+    :param precision: Number of decimal digits
+    :return: List with the encoded integers
+    """
+    scale = 10 ** precision
+    return [
+        None if v is None else int(round(v * scale)) for v in values
+    ]
+
+
+def float32_encode(values):
+    """
+    Packs a sequence of real numbers as a base64 string with their
+    little-endian float32 representation.
+    :param values: Sequence of real numbers
+    :return: String with the packed values
+    """
+    return base64.b64encode(
+        numpy.asarray(values, dtype='<f4').tobytes()
+    ).decode('ascii')
+
+
+def float32_decode(packed):
+    """
+    Unpacks a sequence of real numbers packed with <float32_encode>.
+    :param packed: String with the packed values
+    :return: NumPy array with the values
+    """
+    return numpy.frombuffer(base64.b64decode(packed), dtype='<f4')
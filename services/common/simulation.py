@@ -15,15 +15,33 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
+import collections
 import datetime
 from datetime import timedelta as py_td
 import ephem
 import logging
+import math
 import numpy
-from services.common import gis, misc
+from services.common import ephemeris, gis, misc, propagators
 
 logger = logging.getLogger('common')
 
+# Plain copy of the data of a GroundStation required for the simulations, it
+# can be sent to other processes since it holds no references to the database.
+GroundStationCoordinates = collections.namedtuple(
+    'GroundStationCoordinates',
+    ['latitude', 'longitude', 'contact_elevation', 'altitude']
+)
+
+# Geometry of a pass: the maximum elevation (degrees) with its instant, the
+# azimuths (degrees) at the AOS and at the LOS and the decimated track, as a
+# float32 array whose rows are (seconds since the AOS, azimuth, elevation,
+# range-rate in meters per second).
+PassGeometry = collections.namedtuple(
+    'PassGeometry',
+    ['max_elevation', 'culmination', 'aos_azimuth', 'los_azimuth', 'track']
+)
+
 
 class OrbitalSimulator(object):
     """
@@ -60,12 +78,43 @@ class OrbitalSimulator(object):
         """
         return self._test_mode
 
+    def __init__(self, backend=None):
+        """
+        Constructor.
+        :param backend: Name of the propagator to be used (see
+                        <services.common.propagators.BACKENDS>), by default,
+                        SIMULATION_PROPAGATOR from the settings
+        """
+        self._backend = backend
+
     # Observer for the simulation (GroundStation simulation object).
     _observer = None
     # Body for the simulation (Spacecraft simulation object).
     _body = None
     # TLE in use for the simulation (taken from Spacecraft).
     _tle = None
+    # Key of the TLE in use within the cache of ephemerides.
+    _tle_key = None
+    # Propagator for the spacecraft, created from the TLE in use.
+    _propagator = None
+
+    # Time step for the coarse sampling of the simulation window done while
+    # looking for the passes of the Spacecraft.
+    PASS_SAMPLING_STEP = py_td(seconds=60)
+    # Accuracy (in seconds) for the bisection of the AOS/LOS instants.
+    PASS_REFINEMENT_ACCURACY = 0.1
+    # Margin (radians) below the horizon for the approximate elevations, it
+    # must cover both the atmospheric refraction and the simplifications of
+    # the model.
+    _ELEVATION_MARGIN = numpy.deg2rad(2.0)
+    # Elevation (radians) of the horizon for the passes. As it happens with
+    # <ephem.Observer.next_pass>, the contact elevation of the groundstation
+    # is not taken into account.
+    PASS_HORIZON = 0.0
+    # Number of evaluations of the elevation for locating the culmination of
+    # each pass, which narrow the two sampling steps around the highest sample
+    # down to a third of a second.
+    PASS_CULMINATION_EVALUATIONS = 14
 
     @staticmethod
     def normalize_string(l0, l1, l2):
@@ -161,19 +210,30 @@ class OrbitalSimulator(object):
             misc.unicode_2_string(spacecraft_tle.first_line),\
             misc.unicode_2_string(spacecraft_tle.second_line)
 
-    def set_groundstation(self, groundstation):
+    @staticmethod
+    def create_observer(groundstation):
         """
         Creates an PyEphem observer object with the data from a GroundStation
         object.
         :param groundstation: Object from where to take the data required
+        :return: The object that has to be used with the PyEphem library.
         """
-        self._observer = ephem.Observer()
-        self._observer.lat = gis.decimal_2_degrees(groundstation.latitude)
-        self._observer.lon = gis.decimal_2_degrees(groundstation.longitude)
-        self._observer.horizon = gis.decimal_2_degrees(
+        observer = ephem.Observer()
+        observer.lat = gis.decimal_2_degrees(groundstation.latitude)
+        observer.lon = gis.decimal_2_degrees(groundstation.longitude)
+        observer.horizon = gis.decimal_2_degrees(
             groundstation.contact_elevation
         )
-        self._observer.elevation = groundstation.altitude
+        observer.elevation = groundstation.altitude
+        return observer
+
+    def set_groundstation(self, groundstation):
+        """
+        Creates an PyEphem observer object with the data from a GroundStation
+        object.
+        :param groundstation: Object from where to take the data required
+        """
+        self._observer = OrbitalSimulator.create_observer(groundstation)
 
     def set_spacecraft(self, spacecraft_tle):
         """
@@ -182,8 +242,21 @@ class OrbitalSimulator(object):
         method "get" of the <services.configuration.models.TwoLineElement>.
         """
         self._tle = spacecraft_tle
-        l0, l1, l2 = OrbitalSimulator.dbtle_2_ephem_str(spacecraft_tle)
+        self.load_tle(*OrbitalSimulator.dbtle_2_ephem_str(spacecraft_tle))
+
+    def load_tle(self, l0, l1, l2):
+        """
+        Creates the PyEphem body object directly from the lines of a TLE.
+        :param l0: Line#0 of the TLE file.
+        :param l1: Line#1 of the TLE file.
+        :param l2: Line#2 of the TLE file.
+        """
+        l0, l1, l2 = OrbitalSimulator.normalize_string(l0, l1, l2)
         self._body = OrbitalSimulator.create_spacecraft(l0, l1, l2)
+        self._tle_key = ephemeris.tle_key(l1, l2)
+        self._propagator = propagators.create(
+            l0, l1, l2, backend=self._backend
+        )
 
     @staticmethod
     def create_spacecraft(l0, l1, l2):
@@ -274,7 +347,11 @@ class OrbitalSimulator(object):
     ):
         """
         Calculates the passes available for the given spacecraft in between the
-        start and end dates.
+        start and end dates. The passes are calculated in batch mode: the
+        whole simulation window is first sampled with a coarse time step, the
+        horizon crossings are located through the changes of sign of the
+        elevation of the spacecraft and, finally, the AOS/LOS instants are
+        refined by bisection.
         :param start: The datetime object (UTC) that defines the start of the
         simulation.
         :param end: The datetime object (UTC) that defines the end of the
@@ -282,47 +359,441 @@ class OrbitalSimulator(object):
         :param minimum_slot_duration: The minimum duration of a slot
         :return: List with the datetime objects (UTC) with the passess for
         the given Spacecraft over the given GroundStation
-        :raises ephem.CircumpolarError: Raised whenever a pass for a given
-        simulation is either always up or the satellite never shows up above the
-        defined horizon.
         """
         if self._test_mode:
             if self._fail_test:
                 raise Exception('TEST TEST TEST EXCEPTION')
             return OrbitalSimulator._create_test_operational_slots(start, end)
 
+        return self._calculate_pass_slots(
+            [self._observer], start, end, minimum_slot_duration
+        )[0]
+
+    def calculate_pass_slots(
+        self, groundstations, start, end,
+        minimum_slot_duration=datetime.timedelta(minutes=1), geometry=False
+    ):
+        """
+        Calculates the passes of the spacecraft over each one of the given
+        groundstations in between the start and end dates. The spacecraft is
+        propagated only once for the whole simulation window, being its
+        positions shared for the calculation of the elevations over all the
+        groundstations.
+        :param groundstations: List with the GroundStation objects
+        :param start: The datetime object (UTC) that defines the start of the
+        simulation.
+        :param end: The datetime object (UTC) that defines the end of the
+        simulation.
+        :param minimum_slot_duration: The minimum duration of a slot
+        :param geometry: Flag that enables the calculation of the geometry of
+                            the passes (see <PassGeometry>), in which case
+                            each pass is returned as a (start, end, geometry)
+                            tuple
+        :return: List with the lists of passes for each groundstation, in the
+                    same order as the one of the given groundstations
+        """
+        if self._test_mode:
+            if self._fail_test:
+                raise Exception('TEST TEST TEST EXCEPTION')
+            slots = OrbitalSimulator._create_test_operational_slots(
+                start, end
+            )
+            if geometry:
+                slots = [s + (None,) for s in slots]
+            return [list(slots) for _ in groundstations]
+
+        return self._calculate_pass_slots(
+            [OrbitalSimulator.create_observer(g) for g in groundstations],
+            start, end, minimum_slot_duration, geometry=geometry
+        )
+
+    def _calculate_pass_slots(
+        self, observers, start, end, minimum_slot_duration, geometry=False
+    ):
+        """Private method
+        Calculates the passes of the current spacecraft over each one of the
+        given observers.
+        :param observers: List with the PyEphem observers
+        :param start: The datetime object (UTC) with the simulation start
+        :param end: The datetime object (UTC) with the simulation end
+        :param minimum_slot_duration: The minimum duration of a slot
+        :param geometry: Flag that enables the calculation of the geometry of
+                            the passes
+        :return: List with the lists of passes for each observer
+        """
+        window = ephemeris.cache.get_window(
+            self._propagator, self._tle_key,
+            float(ephem.Date(start)), float(ephem.Date(end)),
+            OrbitalSimulator.PASS_SAMPLING_STEP.total_seconds()
+        )
+        elevations = OrbitalSimulator.calculate_elevations(
+            observers, window.positions
+        )
+        results = []
+
+        for observer, elevations_i in zip(observers, elevations):
+
+            slots = []
+
+            for aos, los in OrbitalSimulator.find_passes(
+                self._propagator, observer, window.dates, elevations_i,
+                minimum_slot_duration=minimum_slot_duration
+            ):
+                slot = (
+                    OrbitalSimulator.ephem_date_2_utc_datetime(
+                        ephem.Date(aos)
+                    ),
+                    OrbitalSimulator.ephem_date_2_utc_datetime(
+                        ephem.Date(los)
+                    )
+                )
+                if geometry:
+                    slot += (OrbitalSimulator.pass_geometry(
+                        self._propagator, observer, window, aos, los
+                    ),)
+                slots.append(slot)
+
+            results.append(slots)
+
+        return results
+
+    @staticmethod
+    def observer_position(observer):
+        """
+        Calculates the geocentric position and the local vertical of the given
+        observer, using the same spherical Earth model as the one used for the
+        positions of the spacecraft.
+        :param observer: PyEphem observer for the groundstation
+        :return: (position, vertical) tuple, both as NumPy arrays
+        """
+        return propagators.PyEphemPropagator.observer_position(observer)
+
+    @staticmethod
+    def calculate_elevations(observers, positions):
+        """
+        Calculates the approximate elevation of the spacecraft over the
+        horizon of each one of the observers for all the given positions at
+        once, as a single (observers x positions) matrix operation. These
+        elevations are only to be used for locating the horizon crossings,
+        since they neither take into account the atmospheric refraction nor
+        the ellipsoid for the observer.
+        :param observers: List with the PyEphem observers
+        :param positions: NumPy array with the positions of the spacecraft
+        :return: NumPy array with shape (len(observers), len(positions)) with
+                    the elevations (radians)
+        """
+        o_positions = numpy.empty((len(observers), 3))
+        o_verticals = numpy.empty((len(observers), 3))
+
+        for i, observer in enumerate(observers):
+            position, vertical = OrbitalSimulator.observer_position(observer)
+            o_positions[i] = position
+            o_verticals[i] = vertical
+
+        # For the range vector (r - s) of the spacecraft from each observer,
+        # both (r - s).u and |r - s|^2 can be expanded as dot products, so
+        # that no (observers x positions x 3) array has to be built.
+        up = o_verticals.dot(positions.T) - (
+            o_positions * o_verticals
+        ).sum(axis=1)[:, None]
+        range_2 = (positions * positions).sum(axis=1)[None, :]\
+            - 2.0 * o_positions.dot(positions.T)\
+            + (o_positions * o_positions).sum(axis=1)[:, None]
+
+        return numpy.arcsin(up / numpy.sqrt(range_2))
+
+    @staticmethod
+    def is_visible(propagator, observer, dates):
+        """
+        Checks whether the spacecraft is above the horizon of the observer at
+        the given dates, using the complete model of the propagator.
+        :param propagator: Propagator for the spacecraft
+        :param observer: PyEphem observer for the groundstation
+        :param dates: NumPy array with the Ephem dates
+        :return: NumPy array with 'True' for the dates at which the spacecraft
+                    is above the horizon
+        """
+        return propagator.elevations(
+            observer, dates
+        ) > OrbitalSimulator.PASS_HORIZON
+
+    @staticmethod
+    def refine_crossings(propagator, observer, t_0, t_1, visible_0):
+        """
+        Refines by bisection the instants at which the spacecraft crosses the
+        horizon of the observer, within each one of the [t_0, t_1] intervals.
+        All the intervals are bisected at the same time.
+        :param propagator: Propagator for the spacecraft
+        :param observer: PyEphem observer for the groundstation
+        :param t_0: NumPy array with the Ephem dates at which the visibility
+                    is the initial one
+        :param t_1: NumPy array with the Ephem dates at which the visibility
+                    has already changed
+        :param visible_0: NumPy array with the initial visibility
+        :return: NumPy array with the Ephem dates of the crossings
+        """
+        accuracy = OrbitalSimulator.PASS_REFINEMENT_ACCURACY * ephem.second
+
+        while len(t_0) and (t_1 - t_0).max() > accuracy:
+
+            t_m = 0.5 * (t_0 + t_1)
+            same = OrbitalSimulator.is_visible(
+                propagator, observer, t_m
+            ) == visible_0
+            t_0 = numpy.where(same, t_m, t_0)
+            t_1 = numpy.where(same, t_1, t_m)
+
+        return 0.5 * (t_0 + t_1)
+
+    @staticmethod
+    def find_passes(
+        propagator, observer, dates, elevations,
+        minimum_slot_duration=datetime.timedelta(minutes=1)
+    ):
+        """
+        Finds the passes of the spacecraft over the observer. The approximate
+        elevations are used to discard all the samples during which the
+        spacecraft is clearly below the horizon, so that the complete model of
+        the propagator is only evaluated around the passes. The horizon
+        crossings are located by the changes in the visibility of the
+        spacecraft in between two consecutive samples and refined later by
+        bisection.
+
+        As it happens with <ephem.Observer.next_pass>, a pass that is already
+        in progress at the beginning of the window is not reported. Passes in
+        progress at the end of the window are cut off at the end of the
+        window.
+
+        :param propagator: Propagator for the spacecraft
+        :param observer: PyEphem observer for the groundstation
+        :param dates: NumPy array with the Ephem dates for the samples
+        :param elevations: NumPy array with the approximate elevations
+        :param minimum_slot_duration: The minimum duration of a slot
+        :return: List with the (aos, los) Ephem dates (floats)
+        """
         pass_slots = []
-        self._observer.date = OrbitalSimulator.datetime_2_ephem_string(start)
-        last_end = start
 
-        while last_end < end:
+        above = elevations > (
+            OrbitalSimulator.PASS_HORIZON - OrbitalSimulator._ELEVATION_MARGIN
+        )
+        # The samples adjacent to the ones above the horizon are also
+        # evaluated, so that every crossing is bracketed by two evaluated
+        # samples.
+        candidates = above.copy()
+        candidates[:-1] |= above[1:]
+        candidates[1:] |= above[:-1]
+
+        visible = numpy.zeros(len(dates), dtype=bool)
+        visible[candidates] = OrbitalSimulator.is_visible(
+            propagator, observer, dates[candidates]
+        )
+
+        changes = numpy.flatnonzero(visible[1:] != visible[:-1])
+        crossings = OrbitalSimulator.refine_crossings(
+            propagator, observer,
+            dates[changes], dates[changes + 1], visible[changes]
+        )
+        aos = None
+
+        for i, crossing in zip(changes, crossings):
+
+            if not visible[i]:
+                aos = crossing
+                continue
+
+            if aos is not None:
+                OrbitalSimulator._append_pass(
+                    pass_slots, aos, crossing, minimum_slot_duration
+                )
+                aos = None
+
+        if aos is not None:
+            OrbitalSimulator._append_pass(
+                pass_slots, aos, dates[-1], minimum_slot_duration
+            )
+
+        return pass_slots
+
+    @staticmethod
+    def _append_pass(pass_slots, aos, los, minimum_slot_duration):
+        """
+        Appends the pass to the given list in case it lasts longer than the
+        minimum duration.
+        :param pass_slots: List with the passes
+        :param aos: Ephem date with the start of the pass
+        :param los: Ephem date with the end of the pass
+        :param minimum_slot_duration: The minimum duration of a slot
+        """
+        if (los - aos) / ephem.second > minimum_slot_duration.total_seconds():
+            pass_slots.append((aos, los))
+
+    @staticmethod
+    def _interpolate(dates, samples, t):
+        """Private method
+        Interpolates the samples at the given dates with the Lagrange
+        polynomial through the three closest samples, so that the values at
+        the dates of the samples themselves are exact.
+        :param dates: NumPy array with the Ephem dates of the samples
+        :param samples: NumPy array with shape (len(dates), 3)
+        :param t: NumPy array with the Ephem dates for the interpolation
+        :return: (values, derivatives) tuple, the derivatives being per
+                    second
+        """
+        k = min(3, len(dates))
+        i = numpy.clip(
+            numpy.searchsorted(dates, t) - 1, 0, len(dates) - k
+        )
+        values = numpy.zeros((len(t), samples.shape[1]))
+        derivatives = numpy.zeros((len(t), samples.shape[1]))
+
+        for a in range(k):
 
-            tr, azr, tt, altt, ts, azs = self._observer.next_pass(self._body)
-            self._body.compute(self._observer)
+            l_a = numpy.ones(len(t))
+            d_a = numpy.zeros(len(t))
 
-            if not tr or not ts:
-                return pass_slots
+            for b in range(k):
+                if b == a:
+                    continue
+                x_ab = dates[i + a] - dates[i + b]
+                d_a = (d_a * (t - dates[i + b]) + l_a) / x_ab
+                l_a = l_a * (t - dates[i + b]) / x_ab
 
-            dt_tr = misc.localize_datetime_utc(tr.datetime())
-            dt_ts = misc.localize_datetime_utc(ts.datetime())
+            values += l_a[:, None] * samples[i + a]
+            derivatives += d_a[:, None] * samples[i + a]
 
-            if dt_tr > end:
-                break
+        return values, derivatives * ephem.second
+
+    @staticmethod
+    def topocentric(propagator, observer, positions, velocities):
+        """
+        Calculates the azimuth, the apparent elevation and the range-rate of
+        the spacecraft as seen from the observer, with the same Earth model
+        as the one of the positions yielded by the propagator.
+        :param propagator: Propagator for the spacecraft
+        :param observer: PyEphem observer for the groundstation
+        :param positions: NumPy array with the positions of the spacecraft
+        :param velocities: NumPy array with the Earth-fixed velocities of the
+                            spacecraft (meters per second)
+        :return: (azimuths, elevations, range_rates) tuple with NumPy arrays,
+                    the angles in radians and the range-rates in meters per
+                    second
+        """
+        position, up = propagator.observer_position(observer)
+        lon = float(observer.lon)
+        east = numpy.array([-numpy.sin(lon), numpy.cos(lon), 0.0])
+        north = numpy.cross(up, east)
+
+        ranges = positions - position
+        distances = numpy.sqrt((ranges * ranges).sum(axis=1))
+
+        azimuths = numpy.mod(
+            numpy.arctan2(ranges.dot(east), ranges.dot(north)), 2 * math.pi
+        )
+        elevations = propagators.refract(
+            numpy.arcsin(ranges.dot(up) / distances),
+            observer.pressure, observer.temp
+        )
+        range_rates = (ranges * velocities).sum(axis=1) / distances
+
+        return azimuths, elevations, range_rates
+
+    @staticmethod
+    def _culmination(elevation, lower, upper, evaluations):
+        """Private method
+        Locates the highest point of the pass within the given bracket with
+        a golden-section search, which evaluates the elevation exactly the
+        given number of times.
+        :param elevation: Function that yields the elevation at an Ephem date
+        :param lower: Ephem date with the start of the bracket
+        :param upper: Ephem date with the end of the bracket
+        :param evaluations: Number of evaluations of the elevation, at least 2
+        :return: (date, elevation) tuple with the highest point evaluated
+        """
+        ratio = (math.sqrt(5.0) - 1.0) / 2.0
+        c = upper - ratio * (upper - lower)
+        d = lower + ratio * (upper - lower)
+        f_c, f_d = elevation(c), elevation(d)
 
-            if dt_ts > end:
-                slot_end = end
+        for _ in range(evaluations - 2):
+
+            if f_c > f_d:
+                upper, d, f_d = d, c, f_c
+                c = upper - ratio * (upper - lower)
+                f_c = elevation(c)
             else:
-                slot_end = dt_ts
+                lower, c, f_c = c, d, f_d
+                d = lower + ratio * (upper - lower)
+                f_d = elevation(d)
 
-            if (slot_end - dt_tr) > minimum_slot_duration:
-                pass_slots.append((dt_tr, slot_end))
+        return (c, f_c) if f_c > f_d else (d, f_d)
 
-            self._observer.date = ts + ephem.minute
-            last_end = misc.localize_datetime_utc(
-                self._observer.date.datetime()
+    @staticmethod
+    def pass_geometry(propagator, observer, window, aos, los):
+        """
+        Calculates the geometry of a pass. The track includes the AOS, all the
+        samples of the window within the pass and the LOS, and it is
+        calculated from the samples of the ephemeris already used for finding
+        the pass, no further propagation being required. The culmination is
+        located with a golden-section search between the neighbours of the
+        highest sample.
+
+        With the PyEphem backend, the azimuths of the AOS and of the LOS and
+        the culmination are calculated with the complete model of the
+        library, so that they match <ephem.Observer.next_pass>; this costs
+        2 + PASS_CULMINATION_EVALUATIONS computations of the body per pass,
+        regardless of its duration. With the other backends, these points are
+        interpolated from the samples as well.
+        :param propagator: Propagator for the spacecraft
+        :param observer: PyEphem observer for the groundstation
+        :param window: Ephemeris with the samples of the simulation window
+        :param aos: Ephem date with the start of the pass
+        :param los: Ephem date with the end of the pass
+        :return: PassGeometry object
+        """
+        def sampled(t):
+            return OrbitalSimulator.topocentric(
+                propagator, observer, *OrbitalSimulator._interpolate(
+                    window.dates, window.positions, t
+                )
             )
 
-        return pass_slots
+        if isinstance(propagator, propagators.PyEphemPropagator):
+            def exact(t):
+                return propagator.topocentric(observer, t)
+        else:
+            exact = sampled
+
+        inner = (window.dates > aos) & (window.dates < los)
+        dates = numpy.concatenate(([aos], window.dates[inner], [los]))
+
+        azimuths, elevations, range_rates = sampled(dates)
+        if exact is not sampled:
+            ends = numpy.array([0, -1])
+            azimuths[ends], elevations[ends], range_rates[ends] = exact(
+                dates[ends]
+            )
+
+        top = int(numpy.argmax(elevations))
+        culmination, max_elevation = OrbitalSimulator._culmination(
+            lambda t: exact(numpy.array([t]))[1][0],
+            dates[max(top - 1, 0)], dates[min(top + 1, len(dates) - 1)],
+            OrbitalSimulator.PASS_CULMINATION_EVALUATIONS
+        )
+
+        return PassGeometry(
+            max_elevation=float(numpy.rad2deg(max_elevation)),
+            culmination=OrbitalSimulator.ephem_date_2_utc_datetime(
+                ephem.Date(culmination)
+            ),
+            aos_azimuth=float(numpy.rad2deg(azimuths[0])),
+            los_azimuth=float(numpy.rad2deg(azimuths[-1])),
+            track=numpy.column_stack((
+                (dates - aos) / ephem.second,
+                numpy.rad2deg(azimuths),
+                numpy.rad2deg(elevations),
+                range_rates
+            )).astype(numpy.float32)
+        )
 
     @staticmethod
     def arrays_2_groundtrack(timestamps, latitudes, longitudes):
@@ -361,12 +832,17 @@ class OrbitalSimulator(object):
     ):
         """
         Calculates the GroundTrack for the spacecraft with the given tle object.
+        The points of the groundtrack are returned as three independent NumPy
+        arrays, the same layout as the one used for storing them.
         :param spacecraft_tle: TLE for the spacecraft
         :param interval: simulation interval
         :param timestep: time ellapsed for the calculation of two subsequent
                             points in the ground track
-        :return: Array where each element is { timestamp, latitude, longitude }.
-                    The first timestamp is "start" and the last one is
+        :return: (timestamps, latitudes, longitudes) tuple with the NumPy
+                    arrays for the points of the groundtrack, being the
+                    timestamps the UTC POSIX timestamps (seconds) and the
+                    coordinates in degrees. The first timestamp is "start"
+                    and the last one is
                     "start+floor(duration/timestamp)*timestamp".
         """
         if not interval:
@@ -378,25 +854,25 @@ class OrbitalSimulator(object):
 
         self.set_spacecraft(spacecraft_tle)
 
-        groundtrack = []
-        date_i = interval[0]
-
-        while date_i < interval[1]:
-
-            self._body.compute(date_i)
-
-            lat_i = numpy.rad2deg(self._body.sublat)
-            lng_i = numpy.rad2deg(self._body.sublong)
-
-            groundtrack.append({
-                'timestamp': date_i,
-                'latitude': lat_i,
-                'longitude': lng_i
-            })
-
-            date_i += timestep
+        n_points = int(math.ceil(
+            (interval[1] - interval[0]).total_seconds() /
+            timestep.total_seconds()
+        ))
+        if n_points < 1:
+            return numpy.empty(0), numpy.empty(0), numpy.empty(0)
+
+        grid = ephemeris.cache.get_grid(
+            self._propagator, self._tle_key,
+            float(ephem.Date(interval[0])), float(ephem.Date(interval[1])),
+            timestep.total_seconds()
+        )
 
-        return groundtrack
+        return (
+            interval[0].timestamp() +
+            timestep.total_seconds() * numpy.arange(n_points),
+            numpy.rad2deg(grid.sublat[:n_points]),
+            numpy.rad2deg(grid.sublong[:n_points])
+        )
 
     def __unicode__(self):
         return '# ### Body (Spacecraft): ' + str(self._body)\
@@ -412,3 +888,34 @@ class OrbitalSimulator(object):
 
     def __str__(self):
         return self.__unicode__()
+
+
+def calculate_pass_slots_job(tle, stations, start, end):
+    """Process pool job
+    Calculates the passes of a single spacecraft over the given stations. This
+    function is meant to be executed by the workers of a process pool,
+    therefore, it only receives and returns plain objects.
+    :param tle: Tuple (l0, l1, l2) with the lines of the TLE
+    :param stations: List with GroundStationCoordinates objects
+    :param start: The datetime object (UTC) with the simulation start
+    :param end: The datetime object (UTC) with the simulation end
+    :return: List with the lists of (start, end, geometry) passes for each
+                station or None if the passes could not be calculated, so
+                that the caller does not take the failure for the absence of
+                passes
+    """
+    try:
+
+        simulator = OrbitalSimulator()
+        simulator.load_tle(*tle)
+        return simulator.calculate_pass_slots(
+            stations, start, end, geometry=True
+        )
+
+    except Exception as ex:
+
+        logger.exception(
+            'Error while calculating pass slots, tle.id = ' + str(tle[0]) +
+            ', ex = ' + str(ex)
+        )
+        return None
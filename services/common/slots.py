@@ -16,6 +16,7 @@
 __author__ = 'rtubiopa@calpoly.edu'
 
 from datetime import datetime as py_datetime, timedelta as py_timedelta
+from django.db import models as django_models
 from services.common import misc
 
 
@@ -118,10 +119,11 @@ def merge_slots(p_slots, m_slots):
             continue
 
         if p[0] >= m[1]:
-            # ### CASE F:
+            # ### CASE F: the same (+) slot is checked against the next (-)
             if m_i < m_n:
                 m = m_slots[m_i]
                 m_i += 1
+                p_next = False
             else:
                 slots.append(p)
             continue
@@ -223,6 +225,46 @@ def position(interval, slot):
     return r0_p, r1_p
 
 
+def occurrences(interval, slot, period=None):
+    """Slot manipulation library
+    This function generates the occurrences of the given slot, repeated every
+    period, that overlap with the given interval, cutted off within it. The
+    first occurrence within the interval is calculated directly, so the cost
+    of the generation only depends on the length of the interval and not on
+    how far the original slot is from it.
+
+    :param interval: 2-tuple with the datetime objects for the interval
+    :param slot: 2-tuple with the datetime objects for the first occurrence
+    :param period: timedelta in between occurrences, None if the slot occurs
+                    only once
+    :return: Generator with the occurrences of the slot within the interval
+    """
+    if not slot or not interval:
+        raise ValueError('@occurrences: wrong parameters')
+    if slot[0] > slot[1]:
+        raise ValueError('@occurrences: slot[0] > slot[1]')
+    if interval[0] > interval[1]:
+        raise ValueError('@occurrences: interval[0] > interval[1]')
+
+    if period is None:
+        if slot[1] > interval[0] and slot[0] < interval[1]:
+            yield cutoff(interval, slot)
+        return
+
+    if period <= py_timedelta(0):
+        raise ValueError('@occurrences: period <= 0')
+
+    # First occurrence that ends after the beginning of the interval
+    n = (interval[0] - slot[1]) // period + 1
+    start = slot[0] + n * period
+    end = slot[1] + n * period
+
+    while start < interval[1]:
+        yield cutoff(interval, (start, end))
+        start += period
+        end += period
+
+
 def string(slot):
     """Slot manipulation library
     This function prints a slot into a human readable string and returns it.
@@ -231,3 +273,27 @@ def string(slot):
     :return: A human readable string
     """
     return '(' + slot[0].isoformat() + ', ' + slot[1].isoformat() + ')'
+
+
+class SlotQuerySet(django_models.QuerySet):
+    """Slot manipulation library
+    QuerySet for the models of the slots, this is, for the models with
+    "start" and "end" datetime fields.
+    """
+
+    def overlapping(self, start, end):
+        """
+        Filters the slots that overlap with the given window, this is, the
+        ones that start before the window ends and end after it starts. It
+        does not truncate the slots that exceed the limits of the window
+        (see <cutoff>).
+
+        :param start: Start of the window
+        :param end: End of the window
+        :return: The filtered QuerySet
+        """
+        return self.filter(start__lt=end, end__gt=start)
+
+
+# Base class for the managers of the models of the slots.
+SlotManager = django_models.Manager.from_queryset(SlotQuerySet)
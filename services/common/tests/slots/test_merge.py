@@ -364,3 +364,29 @@ class MergeSlotsTest(test.TestCase):
         self.assertCountEqual(
             expected_s, actual_s, 'COMPLEX CASE #1: Wrong result!'
         )
+
+    def test_merge_complex_4(self):
+        """UNIT test: services.common.slots.merge_slots (complex case #4)
+        A (+) slot that outlasts a (-) slot must still be checked against the
+        following (-) slots.
+        """
+        p = (misc.get_today_utc() + timedelta(hours=0),
+             misc.get_today_utc() + timedelta(hours=10))
+
+        m = (misc.get_today_utc() + timedelta(hours=1),
+             misc.get_today_utc() + timedelta(hours=2))
+        n = (misc.get_today_utc() + timedelta(hours=4),
+             misc.get_today_utc() + timedelta(hours=5))
+
+        expected_s = [(p[0], m[0]), (m[1], n[0]), (n[1], p[1])]
+        actual_s = slots.merge_slots([p], [m, n])
+
+        if self.__verbose_testing:
+            misc.print_list([p], name='(+) slots')
+            misc.print_list([m, n], name='(-) slots')
+            misc.print_list(actual_s, name='(A) slots')
+            misc.print_list(expected_s, name='(EXPECTED) slots')
+
+        self.assertEqual(
+            expected_s, actual_s, 'COMPLEX CASE #4: Wrong result!'
+        )
@@ -0,0 +1,115 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+from datetime import timedelta as py_delta
+
+from django import test
+from services.common import misc, slots
+
+
+class OccurrencesSlotTest(test.TestCase):
+
+    def setUp(self):
+
+        self.__verbose_testing = False
+
+    def test_occurrences_none(self):
+        """UNIT test: services.common.slots.occurrences (robustness)
+        Nones, empties and wrong periods test.
+        """
+        interval = (
+            misc.get_next_midnight(),
+            misc.get_next_midnight() + py_delta(days=1)
+        )
+
+        self.assertRaises(ValueError, list, slots.occurrences(None, None))
+        self.assertRaises(ValueError, list, slots.occurrences((), ()))
+        self.assertRaises(
+            ValueError, list, slots.occurrences(interval, (
+                misc.get_next_midnight() + py_delta(hours=1),
+                misc.get_next_midnight()
+            ))
+        )
+        self.assertRaises(
+            ValueError, list, slots.occurrences(
+                interval, interval, period=py_delta(0)
+            )
+        )
+
+    def test_occurrences_once(self):
+        """UNIT test: services.common.slots.occurrences (once)
+        Without period, the slot occurs only once, if it overlaps with the
+        interval.
+        """
+        i0 = misc.get_next_midnight()
+        interval = (i0, i0 + py_delta(days=1))
+
+        self.assertListEqual(
+            list(slots.occurrences(
+                interval, (i0 - py_delta(hours=1), i0 + py_delta(hours=1))
+            )),
+            [(i0, i0 + py_delta(hours=1))]
+        )
+        self.assertListEqual(
+            list(slots.occurrences(
+                interval, (i0 - py_delta(hours=2), i0)
+            )),
+            []
+        )
+        self.assertListEqual(
+            list(slots.occurrences(
+                interval, (interval[1], interval[1] + py_delta(hours=2))
+            )),
+            []
+        )
+
+    def test_occurrences_periodic(self):
+        """UNIT test: services.common.slots.occurrences (periodic)
+        The occurrences start directly within the interval, including the one
+        that started before it but ends within it.
+        """
+        i0 = misc.get_next_midnight() + py_delta(days=3000)
+        interval = (i0, i0 + py_delta(days=2))
+
+        slot = (
+            misc.get_next_midnight() - py_delta(hours=1),
+            misc.get_next_midnight() + py_delta(hours=1)
+        )
+        expected = [
+            (i0, i0 + py_delta(hours=1)),
+            (i0 + py_delta(hours=23), i0 + py_delta(days=1, hours=1)),
+            (i0 + py_delta(days=1, hours=23), i0 + py_delta(days=2))
+        ]
+
+        self.assertListEqual(
+            list(slots.occurrences(interval, slot, period=py_delta(days=1))),
+            expected
+        )
+
+        self.assertListEqual(
+            list(slots.occurrences(interval, slot, period=py_delta(days=7))),
+            []
+        )
+        self.assertListEqual(
+            list(slots.occurrences(
+                interval, (
+                    slot[0] + py_delta(days=5), slot[1] + py_delta(days=5)
+                ),
+                period=py_delta(days=7)
+            )),
+            [(i0 + py_delta(hours=23), i0 + py_delta(days=1, hours=1))]
+        )
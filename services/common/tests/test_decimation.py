@@ -0,0 +1,76 @@
+
+import numpy
+from django.test import TestCase
+
+from services.common import decimation
+
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+
+class TestDecimation(TestCase):
+    """UNIT tests
+    Test methods for the decimation of the groundtracks.
+    """
+
+    def setUp(self):
+
+        # Sinusoidal track that crosses the antimeridian twice.
+        t = numpy.linspace(0, 4 * numpy.pi, 1000)
+        self.__lat = 50.0 * numpy.sin(t)
+        self.__lng = numpy.mod(numpy.rad2deg(t) + 330.0, 360.0) - 180.0
+
+    def test_by_count(self):
+        """UNIT test: services.common.decimation.by_count
+        """
+        self.assertEquals(list(decimation.by_count(10, 4)), [0, 3, 6, 9])
+        self.assertEquals(list(decimation.by_count(3, 5)), [0, 1, 2])
+        self.assertEquals(len(decimation.by_count(1000, 100)), 100)
+        self.assertRaises(ValueError, decimation.by_count, 10, 1)
+
+    def test_simplify(self):
+        """UNIT test: services.common.decimation.simplify
+        The simplified track must keep the first and last points and the
+        points around the antimeridian, and no point of the original track
+        may deviate more than the tolerance from it.
+        """
+        tolerance = 0.1
+        indexes = decimation.simplify(self.__lat, self.__lng, tolerance)
+
+        self.assertLess(len(indexes), len(self.__lat) / 5)
+        self.assertEquals(indexes[0], 0)
+        self.assertEquals(indexes[-1], len(self.__lat) - 1)
+
+        crossings = decimation.antimeridian_crossings(self.__lng)
+        self.assertEquals(len(crossings), 2)
+        for c in crossings:
+            self.assertIn(c, indexes)
+            self.assertIn(c + 1, indexes)
+
+        lng = decimation.unwrap_longitudes(self.__lng)
+        for a, b in zip(indexes[:-1], indexes[1:]):
+            d = numpy.array([self.__lat[b] - self.__lat[a], lng[b] - lng[a]])
+            p_lat = self.__lat[a:b + 1] - self.__lat[a]
+            p_lng = lng[a:b + 1] - lng[a]
+            distances = numpy.abs(p_lat * d[1] - p_lng * d[0]) /\
+                numpy.hypot(*d)
+            self.assertLessEqual(distances.max(), tolerance)
+
+        self.assertEquals(
+            len(decimation.simplify(self.__lat, self.__lng, 0)),
+            len(self.__lat)
+        )
@@ -0,0 +1,119 @@
+
+import ephem
+import numpy
+from django.test import TestCase
+
+from services.common import ephemeris, helpers as db_tools, propagators
+
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+
+class TestEphemeris(TestCase):
+    """UNIT tests
+    Test methods for the cache of ephemerides.
+    """
+
+    def setUp(self):
+
+        self.__sc = propagators.PyEphemPropagator(
+            db_tools.ISS_TLE_ID, db_tools.ISS_TLE[0], db_tools.ISS_TLE[1]
+        )
+        self.__key = ephemeris.tle_key(
+            db_tools.ISS_TLE[0], db_tools.ISS_TLE[1]
+        )
+        self.__start = float(ephem.Date('2016/01/08 00:00:00'))
+        self.__end = self.__start + 0.25
+
+    def test_get_grid(self):
+        """UNIT test: services.common.ephemeris.get_grid
+        Validates that the grids are only sampled once and that the cached
+        grids can serve the intervals that start on one of their samples.
+        """
+        cache = ephemeris.EphemerisCache(budget=1024 * 1024)
+
+        grid = cache.get_grid(
+            self.__sc, self.__key, self.__start, self.__end, 20
+        )
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(grid.dates[0], self.__start)
+        self.assertGreaterEqual(grid.dates[-1], self.__end)
+
+        start = self.__start + 30 * 20 * ephem.second
+        sub = cache.get_grid(self.__sc, self.__key, start, self.__end, 20)
+        self.assertEqual(len(cache), 1)
+
+        dates = start + 20 * ephem.second * numpy.arange(len(sub))
+        sublat, sublong, positions = self.__sc.sample(dates)
+        numpy.testing.assert_allclose(sub.dates, dates, rtol=0, atol=1e-9)
+        numpy.testing.assert_allclose(sub.sublat, sublat, atol=1e-9)
+        numpy.testing.assert_allclose(sub.sublong, sublong, atol=1e-9)
+
+        # Different step, therefore, a new grid is required.
+        cache.get_grid(self.__sc, self.__key, start, self.__end, 60)
+        self.assertEqual(len(cache), 2)
+
+    def test_get_window(self):
+        """UNIT test: services.common.ephemeris.get_window
+        Validates that the windows are cut off from the denser grids already
+        cached and that their edges are the ones requested.
+        """
+        cache = ephemeris.EphemerisCache(budget=1024 * 1024)
+        cache.get_grid(self.__sc, self.__key, self.__start, self.__end, 20)
+
+        start = self.__start + 0.01
+        end = self.__end - 0.01
+        window = cache.get_window(self.__sc, self.__key, start, end, 60)
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(window.dates[0], start)
+        self.assertEqual(window.dates[-1], end)
+        self.assertTrue(numpy.all(numpy.diff(window.dates) > 0))
+        self.assertLessEqual(
+            numpy.diff(window.dates).max(), 60 * ephem.second + 1e-9
+        )
+
+        sublat, sublong, positions = self.__sc.sample(window.dates)
+        numpy.testing.assert_allclose(window.positions, positions, rtol=1e-9)
+
+    def test_eviction_and_invalidation(self):
+        """UNIT test: services.common.ephemeris.EphemerisCache
+        Validates the eviction of the least recently used entries and the
+        invalidation of the entries of a TLE.
+        """
+        first = ephemeris.EphemerisCache(budget=10 ** 9)
+        first.get_grid(self.__sc, self.__key, self.__start, self.__end, 20)
+        budget = int(first.nbytes * 2.5)
+
+        cache = ephemeris.EphemerisCache(budget=budget)
+        for i in range(3):
+            cache.get_grid(
+                self.__sc, self.__key, self.__start + i, self.__end + i, 20
+            )
+            self.assertLessEqual(cache.nbytes, budget)
+
+        self.assertEqual(len(cache), 2)
+        cache.get_grid(
+            self.__sc, self.__key, self.__start + 2, self.__end + 2, 20
+        )
+        self.assertEqual(len(cache), 2)
+
+        self.assertEqual(
+            cache.invalidate(db_tools.ISS_TLE[0], db_tools.ISS_TLE[1]), 2
+        )
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
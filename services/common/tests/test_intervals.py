@@ -0,0 +1,135 @@
+
+import datetime
+import numpy
+from django.test import TestCase
+
+from services.common import intervals, misc
+
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+
+def _points(starts, ends, length):
+    """
+    Brute force reference: marks the points covered by the intervals.
+    """
+    points = numpy.zeros(length, dtype=bool)
+    for s, e in zip(starts, ends):
+        points[s:e] = True
+    return points
+
+
+class TestIntervals(TestCase):
+    """UNIT tests
+    Test methods for the algebra of the sets of intervals.
+    """
+
+    def setUp(self):
+
+        self.__rng = numpy.random.RandomState(0)
+        self.__length = 200
+
+    def __random_set(self):
+        """
+        Random list of intervals, overlapping and touching each other.
+        """
+        n = self.__rng.randint(0, 20)
+        starts = self.__rng.randint(0, self.__length - 20, n)
+        return starts, starts + self.__rng.randint(0, 20, n)
+
+    def test_epoch(self):
+        """UNIT test: services.common.intervals.to_epoch/from_epoch
+        """
+        now = misc.get_now_utc(no_microseconds=False)
+        self.assertEquals(
+            intervals.from_epoch(intervals.to_epoch([now])), [now]
+        )
+        self.assertEquals(
+            intervals.to_epoch([intervals.EPOCH])[0], 0
+        )
+
+    def test_normalization(self):
+        """UNIT test: services.common.intervals.IntervalSet
+        Overlapping and touching intervals are joined, empty ones discarded.
+        """
+        s = intervals.IntervalSet([10, 0, 5, 30, 40], [20, 5, 7, 30, 45])
+        self.assertEquals(s.starts.tolist(), [0, 10, 40])
+        self.assertEquals(s.ends.tolist(), [7, 20, 45])
+        self.assertEquals(len(intervals.IntervalSet()), 0)
+        self.assertRaises(ValueError, intervals.IntervalSet, [1], [0])
+        self.assertRaises(ValueError, intervals.IntervalSet, [1], [2, 3])
+
+    def test_operations(self):
+        """UNIT test: services.common.intervals.IntervalSet - operations
+        Union, intersection, difference and clip must match the brute force
+        results over the covered points.
+        """
+        for _ in range(200):
+
+            a_starts, a_ends = self.__random_set()
+            b_starts, b_ends = self.__random_set()
+            a = intervals.IntervalSet(a_starts, a_ends)
+            b = intervals.IntervalSet(b_starts, b_ends)
+            a_p = _points(a_starts, a_ends, self.__length)
+            b_p = _points(b_starts, b_ends, self.__length)
+
+            for result, expected in [
+                (a, a_p),
+                (a | b, a_p | b_p),
+                (a & b, a_p & b_p),
+                (a - b, a_p & ~b_p),
+                (a.clip(50, 150), a_p & _points([50], [150], self.__length)),
+                (a.clip(100, 100), numpy.zeros_like(a_p)),
+                (a.clip(150, 50), numpy.zeros_like(a_p))
+            ]:
+                numpy.testing.assert_array_equal(
+                    _points(result.starts, result.ends, self.__length),
+                    expected
+                )
+                self.assertTrue(numpy.all(result.starts < result.ends))
+                self.assertTrue(
+                    numpy.all(result.starts[1:] > result.ends[:-1])
+                )
+
+    def test_slots(self):
+        """UNIT test: services.common.intervals - slots
+        Conversion from/to slots and search of the overlapping slots.
+        """
+        t_0 = misc.get_next_midnight()
+        h = datetime.timedelta(hours=1)
+
+        s = intervals.IntervalSet.from_slots([
+            (t_0 + 2 * h, t_0 + 3 * h), (t_0, t_0 + h), (t_0 + h, t_0 + 2 * h)
+        ]) - intervals.IntervalSet.from_slots([(t_0 + h, t_0 + 2 * h)])
+        self.assertEquals(s.to_slots(), [
+            (t_0, t_0 + h), (t_0 + 2 * h, t_0 + 3 * h)
+        ])
+
+        self.assertEquals(
+            intervals.overlaps(
+                [(t_0, t_0 + 5 * h), (t_0 + 4 * h, t_0 + 6 * h)],
+                [
+                    (t_0 + h, t_0 + 2 * h), (t_0 + 2 * h, t_0 + 3 * h),
+                    (t_0 + 5 * h, t_0 + 8 * h)
+                ]
+            ), [
+                (0, 0, (t_0 + h, t_0 + 2 * h)),
+                (0, 1, (t_0 + 2 * h, t_0 + 3 * h)),
+                (1, 2, (t_0 + 5 * h, t_0 + 6 * h))
+            ]
+        )
+        self.assertEquals(intervals.overlaps([], [(t_0, t_0 + h)]), [])
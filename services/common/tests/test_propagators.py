@@ -0,0 +1,219 @@
+
+import datetime
+import ephem
+import numpy
+from django.test import TestCase
+from pytz import utc as pytz_utc
+
+from services.common import helpers as db_tools, propagators, simulation
+from website import settings as sn_settings
+
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+# Deep space orbit (period ~12 h).
+GPS_TLE_ID = 'GPS BIIR-13'
+GPS_TLE = [
+    '1 28474U 04045A   16007.51019622 -.00000063  00000-0  00000+0 0  9997',
+    '2 28474  54.4016 232.1412 0101574 215.7547 143.5963  2.00560611 82081'
+]
+
+
+class TestPropagators(TestCase):
+    """UNIT tests
+    Cross-validation of the propagators available for the simulations.
+    """
+
+    def setUp(self):
+
+        self.__tles = [
+            (db_tools.ISS_TLE_ID, db_tools.ISS_TLE[0], db_tools.ISS_TLE[1]),
+            ('TIANGONG 1', db_tools.TIANGONG_TLE[0], db_tools.TIANGONG_TLE[1])
+        ]
+        self.__stations = [
+            simulation.GroundStationCoordinates(
+                latitude=42.170075, longitude=-8.68826,
+                contact_elevation=0, altitude=0
+            ),
+            simulation.GroundStationCoordinates(
+                latitude=35.347099, longitude=-120.455299,
+                contact_elevation=10, altitude=100
+            )
+        ]
+        self.__start = pytz_utc.localize(datetime.datetime(2016, 1, 8))
+        self.__end = self.__start + datetime.timedelta(days=2)
+
+    def test_read_exponential(self):
+        """UNIT test: services.common.propagators._read_exponential
+        """
+        self.assertAlmostEqual(
+            propagators._read_exponential(' 94765-4'), 0.94765e-4
+        )
+        self.assertAlmostEqual(
+            propagators._read_exponential('-11606-4'), -0.11606e-4
+        )
+        self.assertEqual(propagators._read_exponential(' 00000+0'), 0.0)
+
+    def test_create(self):
+        """UNIT test: services.common.propagators.create
+        The deep space orbits are propagated with PyEphem, even when the SGP4
+        backend is requested.
+        """
+        self.assertIsInstance(
+            propagators.create(*self.__tles[0], backend='sgp4'),
+            propagators.Sgp4Propagator
+        )
+        self.assertIsInstance(
+            propagators.create(*self.__tles[0], backend='pyephem'),
+            propagators.PyEphemPropagator
+        )
+        self.assertIsInstance(
+            propagators.create(
+                GPS_TLE_ID, GPS_TLE[0], GPS_TLE[1], backend='sgp4'
+            ),
+            propagators.PyEphemPropagator
+        )
+
+    def test_propagate(self):
+        """UNIT test: services.common.propagators.propagate
+        Many TLEs propagated at once must yield the same positions as each TLE
+        propagated on its own, and those positions must be close to the ones
+        calculated by PyEphem.
+        """
+        dates = numpy.linspace(42376.0, 42378.0, 500)
+        positions = propagators.propagate(
+            [(l1, l2) for _, l1, l2 in self.__tles], dates
+        )
+        self.assertEqual(positions.shape, (len(self.__tles), len(dates), 3))
+
+        for tle, positions_i in zip(self.__tles, positions):
+
+            sgp4 = propagators.Sgp4Propagator(*tle)
+            numpy.testing.assert_allclose(
+                sgp4.positions(dates), positions_i, rtol=1e-12
+            )
+
+            _, sublong_x, _ = propagators.PyEphemPropagator(*tle).sample(
+                dates
+            )
+            _, sublong, _ = sgp4.sample(dates)
+            difference = numpy.angle(numpy.exp(1j * (sublong - sublong_x)))
+            self.assertLess(numpy.abs(difference).max(), numpy.deg2rad(0.01))
+
+    def test_passes_cross_validation(self):
+        """UNIT test: services.common.propagators - passes cross-validation
+        The AOS/LOS instants calculated with both backends must agree within
+        SIMULATION_PROPAGATOR_TOLERANCE.
+        """
+        tolerance = datetime.timedelta(
+            seconds=sn_settings.SIMULATION_PROPAGATOR_TOLERANCE
+        )
+
+        for tle in self.__tles:
+
+            slots = {}
+
+            for backend in propagators.BACKENDS:
+                simulator = simulation.OrbitalSimulator(backend=backend)
+                simulator.load_tle(*tle)
+                slots[backend] = simulator.calculate_pass_slots(
+                    self.__stations, self.__start, self.__end
+                )
+
+            x_slots = slots[propagators.PyEphemPropagator.name]
+            s_slots = slots[propagators.Sgp4Propagator.name]
+
+            for x_gs, s_gs in zip(x_slots, s_slots):
+                self.assertNotEqual(len(x_gs), 0)
+                self.assertEqual(len(x_gs), len(s_gs))
+                for x, s in zip(x_gs, s_gs):
+                    self.assertLess(abs(x[0] - s[0]), tolerance)
+                    self.assertLess(abs(x[1] - s[1]), tolerance)
+
+    def test_pass_geometry(self):
+        """UNIT test: services.common.simulation - geometry of the passes
+        The geometry calculated with both backends (PyEphem, the default one,
+        and SGP4, from its samples) must match the topocentric coordinates
+        calculated by PyEphem.
+        """
+        for backend in (
+            propagators.PyEphemPropagator.name, propagators.Sgp4Propagator.name
+        ):
+            self.__assert_pass_geometry(backend)
+
+    def __assert_pass_geometry(self, backend, tolerance=0.01):
+        """
+        Compares the geometry of the passes calculated with the given backend
+        with the topocentric coordinates calculated by PyEphem.
+        :param backend: Name of the backend
+        :param tolerance: Maximum difference for the angles (degrees)
+        """
+        body = ephem.readtle(*self.__tles[0])
+        simulator = simulation.OrbitalSimulator(backend=backend)
+        simulator.load_tle(*self.__tles[0])
+        gs_slots = simulator.calculate_pass_slots(
+            self.__stations, self.__start, self.__end, geometry=True
+        )
+
+        for station, slots in zip(self.__stations, gs_slots):
+
+            observer = simulation.OrbitalSimulator.create_observer(station)
+            self.assertNotEqual(len(slots), 0)
+
+            for start, end, geometry in slots:
+
+                track = geometry.track
+                self.assertEqual(track.shape[1], 4)
+                self.assertEqual(track[0, 0], 0)
+                self.assertAlmostEqual(
+                    float(track[-1, 0]), (end - start).total_seconds(),
+                    places=1
+                )
+                self.assertGreaterEqual(
+                    geometry.max_elevation, track[:, 2].max() - 1e-3
+                )
+                self.assertTrue(start <= geometry.culmination <= end)
+
+                for date, azimuth, elevation in [
+                    (start, geometry.aos_azimuth, None),
+                    (end, geometry.los_azimuth, None),
+                    (geometry.culmination, None, geometry.max_elevation)
+                ]:
+                    observer.date = ephem.Date(date)
+                    body.compute(observer)
+                    if azimuth is not None:
+                        difference = (
+                            numpy.rad2deg(body.az) - azimuth + 180
+                        ) % 360 - 180
+                        self.assertLess(abs(difference), tolerance)
+                    if elevation is not None:
+                        self.assertAlmostEqual(
+                            numpy.rad2deg(body.alt), elevation,
+                            delta=tolerance
+                        )
+
+                # No instant around the culmination is higher.
+                for seconds in range(-10, 11):
+                    observer.date = ephem.Date(
+                        geometry.culmination +
+                        datetime.timedelta(seconds=seconds)
+                    )
+                    body.compute(observer)
+                    self.assertLess(
+                        numpy.rad2deg(body.alt),
+                        geometry.max_elevation + tolerance
+                    )
@@ -18,6 +18,7 @@ __author__ = 'rtubiopa@calpoly.edu'
 import datetime
 import logging
 
+import numpy
 import pytz
 from django import test
 
@@ -161,3 +162,34 @@ class TestSerialization(test.TestCase):
             actual.isoformat(), expected, 'Wrong ISO-8601 format.'
         )
         self.__verbose_testing = False
+
+    def test_columnar_encoding(self):
+        """UNIT test: services.common.serialization - columnar encoding
+        Validates the encoding helpers for the columnar formats of the
+        responses.
+        """
+        self.assertEqual(
+            serialization.read_format(None), serialization.FORMAT_OBJECTS
+        )
+        self.assertEqual(
+            serialization.read_format(serialization.FORMAT_COLUMNAR),
+            serialization.FORMAT_COLUMNAR
+        )
+        self.assertRaises(Exception, serialization.read_format, 'xml')
+
+        timestamps = [1452211200, 1452211220, 1452211240, 1452211300]
+        encoded = serialization.delta_encode(timestamps)
+        self.assertEqual(encoded, [1452211200, 20, 20, 60])
+        self.assertEqual(serialization.delta_decode(encoded), timestamps)
+        self.assertEqual(serialization.delta_encode([]), [])
+
+        self.assertEqual(
+            serialization.fixed_encode([42.170075, -8.68826, None], 5),
+            [4217008, -868826, None]
+        )
+
+        values = [42.170075, -8.68826, 179.999]
+        numpy.testing.assert_allclose(
+            serialization.float32_decode(serialization.float32_encode(values)),
+            values, rtol=1e-6
+        )
@@ -15,6 +15,7 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
+import ephem
 import logging
 import math
 from datetime import timedelta, datetime
@@ -109,28 +110,34 @@ class TestSimulation(TestCase):
         step = timedelta(minutes=1)
         interval = self.__simulator.get_simulation_window()
 
-        groundtrack = self.__simulator.calculate_groundtrack(
-            tle_models.TwoLineElement.objects.get(
-                identifier=self.__sc_1_tle_id
-            ),
-            interval=interval, timestep=step
-        )
+        timestamps, latitudes, longitudes = \
+            self.__simulator.calculate_groundtrack(
+                tle_models.TwoLineElement.objects.get(
+                    identifier=self.__sc_1_tle_id
+                ),
+                interval=interval, timestep=step
+            )
 
         if self.__verbose_testing:
-            for p in groundtrack:
+            for ts, lat, lng in zip(timestamps, latitudes, longitudes):
                 print(
-                    '>> @' + str(p['timestamp']) + ', (' + str(
-                        p['latitude']) + ',' + str(p['longitude']) + ')'
+                    '>> @' + str(ts) + ', (' + str(lat) + ',' + str(lng) + ')'
                 )
 
         e_n_points = int(math.ceil(
             (interval[1] - interval[0]).total_seconds() / step.total_seconds()
         ))
         self.assertEqual(
-            e_n_points, len(groundtrack),
+            e_n_points, len(timestamps),
             'Number of points differs! e = ' + str(
                 e_n_points
-            ) + ', a = ' + str(len(groundtrack))
+            ) + ', a = ' + str(len(timestamps))
+        )
+        self.assertEqual(len(timestamps), len(latitudes))
+        self.assertEqual(len(timestamps), len(longitudes))
+        self.assertEqual(timestamps[0], interval[0].timestamp())
+        self.assertEqual(
+            timestamps[1] - timestamps[0], step.total_seconds()
         )
 
     def test_passes(self):
@@ -162,3 +169,97 @@ class TestSimulation(TestCase):
         window = self.__simulator.get_simulation_window()
         # noinspection PyUnusedLocal
         slots = self.__simulator.calculate_pass_slot(window[0], window[1])
+
+    def test_calculate_pass_slot_batch(self):
+        """UNIT test: services.common.simulation.calculate_pass_slot (BATCH)
+        Validates that the passes calculated in batch mode are the same ones
+        as those obtained by iterating over <ephem.Observer.next_pass>, also
+        for groundstations whose contact elevation is not zero.
+        """
+        tle = tle_models.TwoLineElement.objects.get(
+            identifier=self.__sc_1_tle_id
+        )
+        stations = [
+            ('gs-batch-1', 42.170075, -8.68826, 0),
+            ('gs-batch-2', 35.3, 139.5, 10),
+            ('gs-batch-3', -70.0, 2.5, 5)
+        ]
+
+        for identifier, latitude, longitude, elevation in stations:
+            gs = db_tools.create_gs(
+                user_profile=self.__test_user_profile, identifier=identifier,
+                latitude=latitude, longitude=longitude,
+                contact_elevation=elevation
+            )
+            self.__assert_batch_passes(gs, tle)
+
+    def __assert_batch_passes(self, gs, tle):
+        """
+        Compares the passes calculated in batch mode for the given
+        groundstation with the ones obtained by iterating over
+        <ephem.Observer.next_pass>.
+        :param gs: GroundStation object
+        :param tle: TwoLineElement object for the spacecraft
+        """
+        tolerance = timedelta(seconds=1)
+        start, end = self.__simulator.get_simulation_window()
+
+        self.__simulator.set_groundstation(gs)
+        self.__simulator.set_spacecraft(tle)
+        b_slots = self.__simulator.calculate_pass_slot(start, end)
+
+        # Reference implementation, one <next_pass> invokation per pass.
+        self.__simulator.set_spacecraft(tle)
+        observer = self.__simulator._observer
+        body = self.__simulator._body
+        observer.date = simulation.OrbitalSimulator.datetime_2_ephem_string(
+            start
+        )
+        x_slots = []
+
+        while True:
+            tr, azr, tt, altt, ts, azs = observer.next_pass(body)
+            dt_tr = pytz_utc.localize(tr.datetime())
+            dt_ts = pytz_utc.localize(ts.datetime())
+            if dt_tr > end:
+                break
+            if dt_ts > end:
+                dt_ts = end
+            if (dt_ts - dt_tr) > timedelta(minutes=1):
+                x_slots.append((dt_tr, dt_ts))
+            observer.date = ts + ephem.minute
+
+        self.assertTrue(x_slots)
+        self.assertEqual(len(x_slots), len(b_slots))
+        for x, b in zip(x_slots, b_slots):
+            self.assertLess(abs(x[0] - b[0]), tolerance)
+            self.assertLess(abs(x[1] - b[1]), tolerance)
+
+    def test_calculate_pass_slots_multi(self):
+        """UNIT test: services.common.simulation.calculate_pass_slots
+        Validates that the passes calculated for several groundstations with
+        a single propagation of the spacecraft are the same as the ones
+        calculated for each groundstation separately.
+        """
+        groundstations = [
+            self.__gs_1,
+            db_tools.create_gs(
+                user_profile=self.__test_user_profile, identifier='gs-multi',
+                latitude=42.170075, longitude=-8.68826, contact_elevation=5
+            )
+        ]
+        start, end = self.__simulator.get_simulation_window()
+        self.__simulator.set_spacecraft(tle_models.TwoLineElement.objects.get(
+            identifier=self.__sc_1_tle_id
+        ))
+
+        m_slots = self.__simulator.calculate_pass_slots(
+            groundstations, start, end
+        )
+
+        self.assertEqual(len(m_slots), len(groundstations))
+        for gs, slots in zip(groundstations, m_slots):
+            self.__simulator.set_groundstation(gs)
+            self.assertEqual(
+                slots, self.__simulator.calculate_pass_slot(start, end)
+            )
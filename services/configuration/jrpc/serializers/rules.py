@@ -129,15 +129,18 @@ def serialize_weekly_dates(rule, child_rule):
     """
     dates = []
 
-    for d in RULE_WEEKLY_WEEKDAYS:
+    for d, day in zip(RULE_WEEKLY_WEEKDAYS, rules.WEEKLY_DAYS):
+
+        starting_time = getattr(child_rule, day + '_s_time')
+        ending_time = getattr(child_rule, day + '_e_time')
+
+        if starting_time is None or ending_time is None:
+            continue
+
         dates.append({
             RULE_WEEKLY_DATE_DAY: d,
-            RULE_S_TIME: common_serial.serialize_iso8601_time(
-                child_rule[d + '_starting_time']
-            ),
-            RULE_E_TIME: common_serial.serialize_iso8601_time(
-                child_rule[d + '_ending_time']
-            )
+            RULE_S_TIME: common_serial.serialize_iso8601_time(starting_time),
+            RULE_E_TIME: common_serial.serialize_iso8601_time(ending_time)
         })
 
     return {
@@ -161,15 +164,14 @@ def serialize_rules(channel_rules):
     """
     This method serializes in JSON format all the rule objects contained in
     the list given as a parameter.
-    :param channel_rules: The array of objects with the rules as read from the
-    database.
+    :param channel_rules: The array of objects with the specific rules as
+    read from the database (see AvailabilityRuleManager.get_specific_rules).
     :return: JSON structure with all the rules.
     """
     jrules = []
     for r in channel_rules:
 
         periodicity = __db2net__[r.periodicity]
-        child_r = rules.AvailabilityRule.objects.get_specific_rule(r.id)
         serializer = __date_serializers__[periodicity]
 
         if serializer is None:
@@ -179,7 +181,7 @@ def serialize_rules(channel_rules):
             RULE_PK_K: r.id,
             RULE_OP: __db2net__[r.operation],
             RULE_PERIODICITY: __db2net__[r.periodicity],
-            RULE_DATES: serializer(r, child_r),
+            RULE_DATES: serializer(r, r),
         })
 
     return jrules
@@ -230,25 +232,37 @@ def deserialize_daily_dates(dates):
 
 def deserialize_weekly_dates(dates):
     """
-    Since the value for the days of the weeks are not stored within the table
-    in the database, in this case the object that is obtained directly from
-    the network can be utilized for accessing the database. Therefore,
-    only a brief validation of the data contained in that structure is
-    necessary.
-    :param dates: The days of the week with the time intervals per day.
-    :return: The structure with the time intervals per weekday.
+    Deserializes the dates as expected within a weekly dates object. The time
+    intervals are given per day of the week, the days that are not included
+    have no slots at all.
+    :param dates: The dates object.
+    :return: A 16-tuple containing the initial date, the final date and the
+    starting and ending hours for each day of the week, starting on Monday
+    (None for the days that are not included).
     """
-    check_weekdays = list(RULE_WEEKLY_WEEKDAYS)
-    if dates is None or len(dates) == 0:
+    weekdays = dates.get(RULE_DATES)
+    if weekdays is None or len(weekdays) == 0:
         raise Exception('Weekly dates provided is empty.')
-    for d in dates:
+
+    times = [None] * (2 * len(RULE_WEEKLY_WEEKDAYS))
+
+    for w in weekdays:
+
+        d = w[RULE_WEEKLY_DATE_DAY]
         if d not in RULE_WEEKLY_WEEKDAYS:
             raise Exception('Day <' + d + '> not supported.')
-        if d not in check_weekdays:
+
+        i = 2 * RULE_WEEKLY_WEEKDAYS.index(d)
+        if times[i] is not None:
             raise Exception('Day <' + d + '> is duplicated.')
-        else:
-            check_weekdays.remove(d)
-    return dates
+
+        times[i] = du_parser.parse(w[RULE_S_TIME])
+        times[i + 1] = du_parser.parse(w[RULE_E_TIME])
+
+    return (
+        du_parser.parse(dates[RULE_DAILY_I_DATE]),
+        du_parser.parse(dates[RULE_DAILY_F_DATE])
+    ) + tuple(times)
 
 # Switch-like dictionary for date deserialization functions
 __dates_deserialization__ = {
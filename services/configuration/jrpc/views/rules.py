@@ -37,7 +37,7 @@ def list_channel_rules(groundstation_id):
     of the rules of this pair Ground Station, Channel.
     """
     return rule_serializers.serialize_rules(
-        rule_models.AvailabilityRule.objects.filter(
+        rule_models.AvailabilityRule.objects.get_specific_rules(
             groundstation=segment_models.GroundStation.objects.get(
                 identifier=groundstation_id
             )
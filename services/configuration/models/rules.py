@@ -15,15 +15,16 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
-from datetime import timedelta as py_timedelta
+from datetime import datetime as py_datetime, timedelta as py_timedelta
 from django.core import exceptions as dj_exceptions
 from django.db import models as django_models
 from django.utils import timezone as django_tz
+import heapq
 import logging
 import pytz
 from pytz import reference as pytz_ref
 
-from services.common import misc, simulation, slots
+from services.common import intervals, misc, simulation, slots
 from services.configuration.models import segments as segment_models
 from website import settings as satnet_settings
 
@@ -36,8 +37,21 @@ ONCE_PERIODICITY = 'O'
 DAILY_PERIODICITY = 'D'
 WEEKLY_PERIODICITY = 'W'
 
+# Prefixes of the fields of the weekly rules for each day of the week,
+# starting on Monday (as in datetime.weekday).
+WEEKLY_DAYS = ('m', 't', 'w', 'r', 'f', 's', 'x')
+# Monday of the reference week in which the times of the weekly rules are
+# stored, so that the day shift caused by their conversion into UTC is kept.
+WEEKLY_REFERENCE_MONDAY = py_datetime(2001, 1, 1)
+
 DEFAULT_GROUNDSTATION = 1
 
+# Number of (+) and (-) slots from which the availability slots are
+# calculated with <services.common.intervals.IntervalSet>; below it, the
+# conversions of the sets cost more than the legacy merge (see the
+# benchmark in services.scheduling.benchmark).
+INTERVAL_SET_MIN_SLOTS = 10**5
+
 
 class AvailabilityRuleManager(django_models.Manager):
     """
@@ -88,33 +102,46 @@ class AvailabilityRuleManager(django_models.Manager):
         )
 
     @staticmethod
-    def get_specific_rule(rule_id):
+    def get_specific_rule(rule_id, periodicity=None):
         """
-        Returns all the specific rules that inherit from this generic one.
+        Returns the specific rule that inherits from this generic one.
         :param rule_id: Identifier of the generic rule.
+        :param periodicity: Periodicity of the rule, if already known.
         :returns: Specific object that inherits from this rule.
         """
         try:
-            return AvailabilityRuleOnce.objects.get(
-                availabilityrule_ptr_id=rule_id
-            )
-        except AvailabilityRuleOnce.DoesNotExist:
-            try:
-                return AvailabilityRuleDaily.objects.get(
-                    availabilityrule_ptr_id=rule_id
-                )
-            except AvailabilityRuleDaily.DoesNotExist:
-                try:
-                    return AvailabilityRuleWeekly.objects.get(
-                        availabilityrule_ptr_id=rule_id
-                    )
-                except AvailabilityRuleWeekly.DoesNotExist:
-                    raise Exception(
-                        'Cannot find rule with id = ' + str(rule_id)
-                    )
+            if periodicity is None:
+                periodicity = AvailabilityRule.objects.values_list(
+                    'periodicity', flat=True
+                ).get(pk=rule_id)
+
+            return globals()[
+                AvailabilityRuleManager.__periodicity2class__[periodicity]
+            ].objects.get(availabilityrule_ptr_id=rule_id)
+
+        except dj_exceptions.ObjectDoesNotExist:
+            raise Exception('Cannot find rule with id = ' + str(rule_id))
 
     @staticmethod
-    def get_applicable_rule_values(groundstation, interval=None):
+    def get_specific_rules(**filters):
+        """
+        Returns the specific rules that match the given filters, with one
+        single query per each type of specific rule (the generic fields are
+        read through the join with the generic rules table).
+        :param filters: Filters over the fields of the generic rules.
+        :returns: List with the specific objects, ordered by their id.
+        """
+        return sorted(
+            [
+                r
+                for c in AvailabilityRuleManager.__periodicity2class__.values()
+                for r in globals()[c].objects.filter(**filters)
+            ],
+            key=lambda r: r.pk
+        )
+
+    @staticmethod
+    def get_applicable_rules(groundstation, interval=None):
         """
         This method finds all applicable rules within the database whose
         initial_date and ending_date range within the given interval.
@@ -123,60 +150,65 @@ class AvailabilityRuleManager(django_models.Manager):
         rules. This is a tuple with the first value being the begin_date for
         the interval and the second (and last) object being the end_date for
         the interval.
-        :returns: Two separate lists with all the applicable rules as objects
-        read from the database directly, the first list contains the rules
-        that add slots and the second one contains those that remove slots.
+        :returns: Two separate lists with all the applicable rules as specific
+        rule objects, the first list contains the rules that add slots and the
+        second one contains those that remove slots.
         """
-        add_r = []
-        remove_r = []
-
         if interval is None:
             interval = simulation.OrbitalSimulator.get_simulation_window()
 
-        r_list = list(
-            AvailabilityRule.objects.filter(
-                groundstation=groundstation, operation=ADD_SLOTS,
-                starting_date__lte=interval[1], ending_date__gte=interval[0]
-            ).values()
+        r_list = AvailabilityRuleManager.get_specific_rules(
+            groundstation=groundstation,
+            starting_date__lte=interval[1], ending_date__gte=interval[0]
         )
-        add_r += r_list
 
-        r_list = list(
-            AvailabilityRule.objects.filter(
-                groundstation=groundstation, operation=REMOVE_SLOTS,
-                starting_date__lte=interval[1], ending_date__gte=interval[0]
-            ).values()
+        return (
+            [r for r in r_list if r.operation == ADD_SLOTS],
+            [r for r in r_list if r.operation == REMOVE_SLOTS]
         )
-        remove_r += r_list
-
-        return add_r, remove_r
 
     @staticmethod
-    def generate_available_slots_once(rule_values, interval=None):
+    def _get_child_rule(rule, child_class):
         """
-        This method generates the available slots for a only-once rule that
-        starts and ends in the given dates, during the specified interval.
-        :param interval: Interval of applicability
-        :param rule_values: The values for the ONCE availability rule
+        Returns the specific object for the given rule, which is only read
+        from the database if the rule is given through its values.
+        :param rule: Specific rule object or values of the generic rule
+        :param child_class: Class of the specific rule
+        :returns: Specific rule object or None if it does not exist
         """
-        if interval is None:
-            interval = simulation.OrbitalSimulator.get_simulation_window()
+        if isinstance(rule, child_class):
+            return rule
 
         try:
-            r = AvailabilityRuleOnce.objects.get(
-                availabilityrule_ptr_id=rule_values['id']
-            )
+            return child_class.objects.get(availabilityrule_ptr_id=rule['id'])
         except dj_exceptions.ObjectDoesNotExist as ex:
             logger.warning(
                 '>>> Child rule does not exist, returning no slots, ex = ' +
                 str(ex)
             )
+            return None
+
+    @staticmethod
+    def generate_available_slots_once(rule, interval=None):
+        """
+        This method generates the available slots for a only-once rule that
+        starts and ends in the given dates, during the specified interval.
+        :param interval: Interval of applicability
+        :param rule: The ONCE availability rule (or its values)
+        """
+        if interval is None:
+            interval = simulation.OrbitalSimulator.get_simulation_window()
+
+        r = AvailabilityRuleManager._get_child_rule(
+            rule, AvailabilityRuleOnce
+        )
+        if r is None:
             return []
 
         try:
-            slot = slots.cutoff(
+            return list(slots.occurrences(
                 interval, (r.starting_time, r.ending_time)
-            )
+            ))
         except ValueError as ex:
             logger.warning(
                 '>>> onceRules.generate_available_slots, no slots generated, '
@@ -184,86 +216,79 @@ class AvailabilityRuleManager(django_models.Manager):
             )
             return []
 
-        return [slot]
-
     @staticmethod
-    def generate_available_slots_daily(rule_values, interval=None):
+    def generate_available_slots_daily(rule, interval=None):
         """
         This method generates the available slots for a daily rule that
         starts and ends in the given dates, during the specified interval.
-        TODO :: improve the generation algorithm in order to avoid generating
-                slots since the start of the rule until the validity of the
-                current interval (can be long)
+        The generation starts directly with the first day of the rule within
+        the interval, no matter how long ago the rule started.
         :param interval: Interval of applicability
-        :param rule_values: The values for the ONCE availability rule
+        :param rule: The DAILY availability rule (or its values)
         """
         if interval is None:
             interval = simulation.OrbitalSimulator.get_simulation_window()
 
-        try:
-            r = AvailabilityRuleDaily.objects.get(
-                availabilityrule_ptr_id=rule_values['id']
-            )
-        except dj_exceptions.ObjectDoesNotExist as ex:
-            logger.warning(
-                '>>> Child rule does not exist, returning no slots, ex = ' +
-                str(ex)
-            )
+        r = AvailabilityRuleManager._get_child_rule(
+            rule, AvailabilityRuleDaily
+        )
+        if r is None:
             return []
 
-        result = []
-        slot_i = slots.position(interval, (r.starting_time, r.ending_time))
-
-        while slot_i[0] < interval[1]:
-
-            slot = slots.cutoff(interval, slot_i)
-            result.append((slot[0], slot[1]))
-
-            slot_i = (
-                slot_i[0] + py_timedelta(days=1),
-                slot_i[1] + py_timedelta(days=1)
-            )
+        return list(slots.occurrences(
+            interval, (r.starting_time, r.ending_time),
+            period=py_timedelta(days=1)
+        ))
 
-        return result
-
-    # noinspection PyUnusedLocal
     @staticmethod
-    def generate_available_slots_weekly(rule_values, interval):
+    def generate_available_slots_weekly(rule, interval=None):
         """
         This method generates the available slots for a weekly rule that
         starts and ends in the given dates, during the specified interval.
-        TODO :: implement this weekly method for convenience.
+        The occurrences of each day of the week are generated as independent
+        slots repeated every week, which are merged in a single pass.
         :param interval: Interval of applicability
-        :param rule_values: The values for the ONCE availability rule
+        :param rule: The WEEKLY availability rule (or its values)
         """
-        logger.warn('generate_available_slots_weekly: still not implemented')
-        return []
+        if interval is None:
+            interval = simulation.OrbitalSimulator.get_simulation_window()
+
+        r = AvailabilityRuleManager._get_child_rule(
+            rule, AvailabilityRuleWeekly
+        )
+        if r is None:
+            return []
+
+        return list(heapq.merge(*[
+            slots.occurrences(interval, slot, period=py_timedelta(days=7))
+            for slot in r.get_week_slots()
+        ]))
 
     @staticmethod
-    def generate_available_slots(r_values, interval=None):
+    def generate_available_slots(rule, interval=None):
         """
         This method generates the available slots defined by this rule.
         :param interval: Interval of applicability
-        :param r_values: The values for the availability rule
+        :param rule: The specific availability rule
         :return: Initial slots array, initial datetime and final datetime.
         """
         if interval is None:
             interval = simulation.OrbitalSimulator.get_simulation_window()
 
-        periodicity = r_values['periodicity']
+        periodicity = rule.periodicity
 
         try:
             if periodicity == ONCE_PERIODICITY:
                 return AvailabilityRuleManager.generate_available_slots_once(
-                    r_values, interval
+                    rule, interval
                 )
             if periodicity == DAILY_PERIODICITY:
                 return AvailabilityRuleManager.generate_available_slots_daily(
-                    r_values, interval
+                    rule, interval
                 )
             if periodicity == WEEKLY_PERIODICITY:
                 return AvailabilityRuleManager.generate_available_slots_weekly(
-                    r_values, interval
+                    rule, interval
                 )
         except ValueError as ex:
             logger.warning(ex)
@@ -287,7 +312,7 @@ class AvailabilityRuleManager(django_models.Manager):
                 interval = simulation.OrbitalSimulator.get_simulation_window()
 
         add_rules, remove_rules = AvailabilityRuleManager\
-            .get_applicable_rule_values(groundstation, interval=interval)
+            .get_applicable_rules(groundstation, interval=interval)
 
         logger.info(
             misc.list_2_string(
@@ -312,17 +337,20 @@ class AvailabilityRuleManager(django_models.Manager):
                 r, interval=interval
             )
 
-        # 1) First, raw slots must be sorted and normalized.
-        add_slots = slots.normalize_slots(
-            sorted(add_slots, key=lambda s: s[1])
+        # 1) The final availability slots are the points of the (+) slots
+        # that are not within any of the (-) slots. The legacy merge is
+        # faster for the usual amounts of slots, the interval sets only pay
+        # off for the largest ones.
+        if len(add_slots) + len(remove_slots) >= INTERVAL_SET_MIN_SLOTS:
+            return (
+                intervals.IntervalSet.from_slots(add_slots) -
+                intervals.IntervalSet.from_slots(remove_slots)
+            ).to_slots()
+
+        return slots.merge_slots(
+            slots.normalize_slots(sorted(add_slots)),
+            slots.normalize_slots(sorted(remove_slots))
         )
-        remove_slots = slots.normalize_slots(
-            sorted(remove_slots, key=lambda s: s[0])
-        )
-
-        # 2) Sorted and normalized slots can be merged to generated the final
-        # availability slots.
-        return slots.merge_slots(add_slots, remove_slots)
 
 
 class AvailabilityRule(django_models.Model):
@@ -394,7 +422,9 @@ class AvailabilityRule(django_models.Model):
         """
         Unicode string representation of the contents of this object.
         """
-        child = AvailabilityRule.objects.get_specific_rule(self.pk)
+        child = AvailabilityRule.objects.get_specific_rule(
+            self.pk, periodicity=self.periodicity
+        )
 
         result = self.__operation2unicode__[str(self.operation)]\
             + self.__periodicity2unicode__[str(self.periodicity)]\
@@ -582,28 +612,64 @@ class AvailabilityRuleWeeklyManager(django_models.Manager):
         :param groundstation: reference to the ground station for the rule
         :param operation: type of operation (create or remove slots)
         :param periodicity: periodicity for the rule (once, daily, weekly)
-        :param dates: applicability dates for the rule
+        :param dates: applicability dates for the rule, followed by the
+                        starting and ending times for each day of the week
+                        (None for the days without slots)
         """
+        times = {}
+
+        for weekday, (day, starting_dt, ending_dt) in enumerate(zip(
+            WEEKLY_DAYS, dates[2::2], dates[3::2]
+        )):
+
+            if starting_dt is None and ending_dt is None:
+                times[day + '_s_time'] = times[day + '_e_time'] = None
+                continue
+
+            if starting_dt is None or ending_dt is None:
+                raise ValueError(
+                    'Invalid WEEKLY rule, day = ' + day + ' misses one time'
+                )
+
+            local_dt = starting_dt
+            starting_dt = starting_dt.astimezone(pytz.utc)
+            ending_dt = ending_dt.astimezone(pytz.utc)
+            diff_dt = ending_dt - starting_dt
+
+            if diff_dt > py_timedelta(hours=24):
+                raise ValueError(
+                    'Invalid WEEKLY rule, day = ' + day + ', diff_dt = ' +
+                    str(diff_dt) + ' > 24 hours'
+                )
+
+            if ending_dt <= starting_dt:
+                raise ValueError(
+                    'Invalid WEEKLY rule, day = ' + day + ', ending (' +
+                    ending_dt.isoformat() + ') <= starting (' +
+                    starting_dt.isoformat() + ')'
+                )
+
+            # The local time is placed on its day of the reference week, so
+            # that the UTC date keeps the day in which the slot really starts
+            # (e.g. Monday 08:00+09:00 is Sunday 23:00 UTC).
+            reference = WEEKLY_REFERENCE_MONDAY + py_timedelta(days=weekday)
+            local_dt = local_dt.replace(
+                year=reference.year, month=reference.month, day=reference.day
+            )
+
+            times[day + '_s_time'] = local_dt.astimezone(pytz.utc)
+            times[day + '_e_time'] = times[day + '_s_time'] + diff_dt
+
+        if all(t is None for t in times.values()):
+            raise ValueError('Invalid WEEKLY rule, no days defined')
+
         return super(AvailabilityRuleWeeklyManager, self).create(
             groundstation=groundstation,
             operation=operation,
             periodicity=periodicity,
             starting_date=dates[0],
             ending_date=dates[1],
-            m_s_time=dates[2],
-            m_e_time=dates[3],
-            t_s_time=dates[4],
-            t_e_time=dates[5],
-            w_s_time=dates[6],
-            w_e_time=dates[7],
-            r_s_time=dates[8],
-            r_e_time=dates[9],
-            f_s_time=dates[10],
-            f_e_time=dates[11],
-            s_s_time=dates[12],
-            s_e_time=dates[13],
-            x_s_time=dates[14],
-            x_e_time=dates[15]
+            **times
         )
 
 
@@ -664,6 +730,40 @@ class AvailabilityRuleWeekly(AvailabilityRule):
         'End time on Sunday', default=django_tz.now, null=True
     )
 
+    def get_week_slots(self):
+        """
+        Returns the slots for the first week of this rule, one per each day
+        of the week with both starting and ending times, starting on the
+        Monday of the week of the starting date of the rule. The times are
+        stored within the reference week (see WEEKLY_REFERENCE_MONDAY), so
+        that a slot whose UTC start falls on the day before or after its
+        local day is moved accordingly.
+        :return: List with the (start, end) tuples of the slots
+        """
+        starting_date = self.starting_date
+        if isinstance(starting_date, py_datetime):
+            starting_date = starting_date.date()
+
+        monday = pytz.utc.localize(py_datetime.combine(
+            starting_date - py_timedelta(days=starting_date.weekday()),
+            py_datetime.min.time()
+        ))
+        reference = pytz.utc.localize(WEEKLY_REFERENCE_MONDAY)
+        result = []
+
+        for day in WEEKLY_DAYS:
+
+            starting_dt = getattr(self, day + '_s_time')
+            ending_dt = getattr(self, day + '_e_time')
+
+            if starting_dt is None or ending_dt is None:
+                continue
+
+            start = monday + (starting_dt - reference)
+            result.append((start, start + (ending_dt - starting_dt)))
+
+        return result
+
     def __unicode__(self):
         """
         Unicode string representation of the contents of this object.
@@ -20,7 +20,7 @@ import sys
 from urllib.request import urlopen as urllib2_urlopen
 from django.core import exceptions, validators
 from django.db import models
-from services.common import misc
+from services.common import ephemeris, misc
 from services.common import simulation
 from services.configuration.models.celestrak\
     import CelestrakDatabase as Celestrak
@@ -203,6 +203,9 @@ class TwoLineElement(models.Model):
         """
         changed_flag = False
 
+        if self.first_line != l1 or self.second_line != l2:
+            ephemeris.cache.invalidate(self.first_line, self.second_line)
+
         if self.identifier != identifier:
             self.identifier = identifier
             changed_flag = True
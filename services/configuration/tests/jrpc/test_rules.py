@@ -162,6 +162,74 @@ class JRPCRulesTest(test.TestCase):
 
         self.assertEqual(rules_g1c1[0], expected_r)
 
+    def test_add_weekly_rule(self):
+        """JRPC test: (W) cfg.gs.channel.addRule, cfg.gs.channel.removeRule
+        Should correctly add a WEEKLY rule to the system.
+        """
+        if self.__verbose_testing:
+            print('>>> TEST (test_gs_channel_add_rule)')
+
+        now = misc.get_now_utc()
+        r_1_s_time = now + datetime.timedelta(minutes=30)
+        r_1_e_time = now + datetime.timedelta(minutes=45)
+        r_1_weekdays = ('monday', 'wednesday', 'friday')
+
+        # 1) A weekly rule is inserted in the database:
+        rule_cfg = db_tools.create_jrpc_weekly_rule(
+            weekdays=r_1_weekdays,
+            starting_time=r_1_s_time,
+            ending_time=r_1_e_time
+        )
+        rule_pk = jrpc_rules.add_rule(self.__gs_1_id, rule_cfg)
+
+        # 2) get the rule back through the JRPC interface
+        rules_g1c1 = jrpc_rules.list_channel_rules(self.__gs_1_id)
+        expected_r = {
+            jrpc_serial.RULE_PK_K: rule_pk,
+            jrpc_serial.RULE_PERIODICITY: jrpc_serial.RULE_PERIODICITY_WEEKLY,
+            jrpc_serial.RULE_OP: jrpc_serial.RULE_OP_ADD,
+            jrpc_serial.RULE_DATES: {
+                jrpc_serial.RULE_DAILY_I_DATE: common_serial
+                .serialize_iso8601_date(
+                    misc.get_today_utc() + datetime.timedelta(days=1)
+                ),
+                jrpc_serial.RULE_DAILY_F_DATE: common_serial
+                .serialize_iso8601_date(
+                    misc.get_today_utc() + datetime.timedelta(days=366)
+                ),
+                jrpc_serial.RULE_DATES: [
+                    {
+                        jrpc_serial.RULE_WEEKLY_DATE_DAY: d,
+                        jrpc_serial.RULE_S_TIME: common_serial
+                        .serialize_iso8601_time(r_1_s_time),
+                        jrpc_serial.RULE_E_TIME: common_serial
+                        .serialize_iso8601_time(r_1_e_time)
+                    }
+                    for d in r_1_weekdays
+                ]
+            }
+        }
+
+        if self.__verbose_testing:
+            misc.print_list(rules_g1c1, name='DATABASE')
+            misc.print_dictionary(expected_r)
+
+        self.assertEqual(rules_g1c1[0], expected_r)
+
+        # 3) duplicated and unknown days are rejected
+        rule_cfg = db_tools.create_jrpc_weekly_rule(
+            weekdays=('monday', 'monday')
+        )
+        self.assertRaises(
+            Exception, jrpc_rules.add_rule, self.__gs_1_id, rule_cfg
+        )
+        rule_cfg = db_tools.create_jrpc_weekly_rule(weekdays=('holiday',))
+        self.assertRaises(
+            Exception, jrpc_rules.add_rule, self.__gs_1_id, rule_cfg
+        )
+
+        jrpc_rules.remove_rule(self.__gs_1_id, rule_pk)
+
     def test_remove_rule(self):
         """JRPC test: cfg.gs.channel.removeRule
         Should correctly remove any rule to the system.
@@ -15,13 +15,15 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
-from datetime import timedelta as py_timedelta
+from datetime import datetime as py_datetime, timedelta as py_timedelta
 import logging
+import pytz
 from django import test
 from django.db.models import signals as django_signals
 
 from services.common import misc as sn_misc
 from services.common import helpers as sn_helpers
+from services.configuration.jrpc.serializers import rules as rule_serial
 from services.configuration.jrpc.views import rules as rule_jrpc
 from services.configuration.models import rules as rule_models
 from services.scheduling.signals import availability as availability_signals
@@ -62,6 +64,116 @@ class TestRulesAvailability(test.TestCase):
             user_profile=self.__test_user_profile, identifier=self.__sc_1_id
         )
 
+    def test_applicable_rules_queries(self):
+        """UNIT test: services.configuration.models.rules - rules loading
+        All the applicable rules must be read with a single query per type
+        of specific rule, and their expansion must not require any other
+        query at all.
+        """
+        if self.__verbose_testing:
+            print('>>> test_applicable_rules_queries:')
+
+        rule_jrpc.add_rule(
+            self.__gs_1_id,
+            sn_helpers.create_jrpc_once_rule(
+                starting_time=sn_misc.get_next_midnight() + py_timedelta(
+                    days=1, hours=2
+                ),
+                ending_time=sn_misc.get_next_midnight() + py_timedelta(
+                    days=1, hours=4
+                )
+            )
+        )
+        for i in range(3):
+            rule_jrpc.add_rule(
+                self.__gs_1_id, sn_helpers.create_jrpc_daily_rule()
+            )
+        rule_jrpc.add_rule(
+            self.__gs_1_id,
+            sn_helpers.create_jrpc_daily_rule(
+                operation=rule_serial.RULE_OP_REMOVE
+            )
+        )
+        rule_jrpc.add_rule(
+            self.__gs_1_id, sn_helpers.create_jrpc_weekly_rule()
+        )
+
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=1),
+            sn_misc.get_next_midnight() + py_timedelta(days=8)
+        )
+
+        with self.assertNumQueries(3):
+            add_rules, remove_rules = rule_models.AvailabilityRuleManager\
+                .get_applicable_rules(self.__gs, interval=interval)
+
+        self.assertEqual(len(add_rules), 5)
+        self.assertEqual(len(remove_rules), 1)
+        self.assertListEqual(
+            [r.pk for r in add_rules], sorted(r.pk for r in add_rules)
+        )
+        self.assertIsInstance(add_rules[0], rule_models.AvailabilityRuleOnce)
+        self.assertIsInstance(
+            add_rules[-1], rule_models.AvailabilityRuleWeekly
+        )
+        self.assertIsInstance(
+            remove_rules[0], rule_models.AvailabilityRuleDaily
+        )
+
+        with self.assertNumQueries(0):
+            for r in add_rules + remove_rules:
+                self.assertNotEqual(
+                    len(
+                        rule_models.AvailabilityRuleManager
+                        .generate_available_slots(r, interval=interval)
+                    ),
+                    0
+                )
+
+    def test_availability_slots_large(self):
+        """UNIT test: services.configuration.models.rules - large sets
+        The availability slots calculated with the interval sets, used for
+        the largest amounts of slots, must be the same as the ones
+        calculated with the legacy merge.
+        """
+        if self.__verbose_testing:
+            print('>>> test_availability_slots_large:')
+
+        midnight = sn_misc.get_next_midnight()
+        rule_jrpc.add_rule(
+            self.__gs_1_id, sn_helpers.create_jrpc_daily_rule(
+                starting_time=midnight + py_timedelta(hours=2),
+                ending_time=midnight + py_timedelta(hours=4)
+            )
+        )
+        rule_jrpc.add_rule(
+            self.__gs_1_id, sn_helpers.create_jrpc_daily_rule(
+                operation=rule_serial.RULE_OP_REMOVE,
+                starting_time=midnight + py_timedelta(hours=3),
+                ending_time=midnight + py_timedelta(hours=3, minutes=30)
+            )
+        )
+
+        interval = (
+            midnight + py_timedelta(days=1), midnight + py_timedelta(days=8)
+        )
+        merged = rule_models.AvailabilityRuleManager.get_availability_slots(
+            self.__gs, interval=interval
+        )
+        self.assertEqual(len(merged), 14)
+
+        min_slots = rule_models.INTERVAL_SET_MIN_SLOTS
+        rule_models.INTERVAL_SET_MIN_SLOTS = 0
+        try:
+            self.assertListEqual(
+                rule_models.AvailabilityRuleManager.get_availability_slots(
+                    self.__gs, interval=interval
+                ),
+                merged
+            )
+        finally:
+            rule_models.INTERVAL_SET_MIN_SLOTS = min_slots
+
     def test_generate_slots_daily_rule(self):
         """UNIT test: services.configuration.models.rules - DAILY slots
         This test validates that a DAILY rule generates the right amount of
@@ -172,6 +284,127 @@ class TestRulesAvailability(test.TestCase):
             sender=rule_models.AvailabilityRuleDaily
         )
 
+    def test_generate_slots_weekly_rule(self):
+        """UNIT test: services.configuration.models.rules - WEEKLY slots
+        This test validates that a WEEKLY rule generates one slot per each
+        one of the days of the week included in the rule, no matter how far
+        the interval is from the start of the rule.
+        """
+        if self.__verbose_testing:
+            print('>>> test_generate_slots_weekly_rule:')
+
+        #######################################################################
+        # ### XXXX SIGNAL DISCONNECTED
+        django_signals.post_save.disconnect(
+            availability_signals.weekly_rule_saved,
+            sender=rule_models.AvailabilityRuleWeekly
+        )
+
+        #######################################################################
+        # ### 1) working days only, first and last days truncated
+        rule_id = rule_jrpc.add_rule(
+            self.__gs_1_id,
+            sn_helpers.create_jrpc_weekly_rule(
+                starting_time=sn_misc.get_next_midnight() + py_timedelta(
+                    hours=2
+                ),
+                ending_time=sn_misc.get_next_midnight() + py_timedelta(
+                    hours=6
+                )
+            )
+        )
+
+        rule_db_values = rule_models.AvailabilityRule.objects.filter(
+            pk=rule_id
+        ).values()
+
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=300, hours=4),
+            sn_misc.get_next_midnight() + py_timedelta(days=314, hours=5)
+        )
+
+        slots = rule_models.AvailabilityRuleManager\
+            .generate_available_slots_weekly(
+                rule_db_values[0], interval=interval
+            )
+
+        expected = []
+        for d in range(300, 315):
+            day = sn_misc.get_next_midnight() + py_timedelta(days=d)
+            if day.weekday() < 5:
+                expected.append((
+                    max(day + py_timedelta(hours=2), interval[0]),
+                    min(day + py_timedelta(hours=6), interval[1])
+                ))
+
+        self.assertListEqual(slots, expected)
+
+        #######################################################################
+        # ### 2) working days only, local times in a timezone ahead of UTC
+        # (Monday 08:00+09:00 is Sunday 23:00 UTC)
+        tz = pytz.FixedOffset(9 * 60)
+        rule_id = rule_jrpc.add_rule(
+            self.__gs_1_id,
+            sn_helpers.create_jrpc_weekly_rule(
+                starting_time=tz.localize(py_datetime(2016, 1, 4, 8)),
+                ending_time=tz.localize(py_datetime(2016, 1, 4, 12))
+            )
+        )
+
+        rule_db_values = rule_models.AvailabilityRule.objects.filter(
+            pk=rule_id
+        ).values()
+
+        slots = rule_models.AvailabilityRuleManager\
+            .generate_available_slots_weekly(
+                rule_db_values[0], interval=interval
+            )
+
+        expected = []
+        for d in range(299, 316):
+            day = (
+                sn_misc.get_next_midnight() + py_timedelta(days=d)
+            ).date()
+            if day.weekday() >= 5:
+                continue
+            start = tz.localize(
+                py_datetime(day.year, day.month, day.day, 8)
+            )
+            end = start + py_timedelta(hours=4)
+            if end > interval[0] and start < interval[1]:
+                expected.append((
+                    max(start, interval[0]), min(end, interval[1])
+                ))
+
+        self.assertTrue(expected)
+        self.assertListEqual(slots, expected)
+        self.assertEquals(slots[0][0].astimezone(tz).hour, 8)
+
+        #######################################################################
+        # ### 3) wrong rules
+        self.assertRaises(
+            ValueError, rule_jrpc.add_rule, self.__gs_1_id,
+            sn_helpers.create_jrpc_weekly_rule(
+                starting_time=sn_misc.get_next_midnight() + py_timedelta(
+                    hours=6
+                ),
+                ending_time=sn_misc.get_next_midnight() + py_timedelta(
+                    hours=2
+                )
+            )
+        )
+        self.assertRaises(
+            Exception, rule_jrpc.add_rule, self.__gs_1_id,
+            sn_helpers.create_jrpc_weekly_rule(weekdays=[])
+        )
+
+        #######################################################################
+        # ### XXXX SIGNAL RECONNECTED
+        django_signals.post_save.connect(
+            availability_signals.weekly_rule_saved,
+            sender=rule_models.AvailabilityRuleWeekly
+        )
+
     def test_generate_slots_once_rule(self):
         """UNIT test: services.configuration.models.rules - ONCE slots
         This test validates that a ONCE rule generates the right amount of
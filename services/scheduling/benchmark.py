@@ -0,0 +1,186 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import collections
+import datetime
+import logging
+import time
+import numpy
+from pytz import utc as pytz_utc
+
+from services.common import intervals, slots
+
+logger = logging.getLogger('scheduling')
+
+# Limit for the number of (+) and (-) intervals of the random scenarios.
+MAX_INTERVALS = 10**6
+
+# The random intervals are generated over a grid with this resolution that
+# starts at this epoch, so that they can be checked against a dense grid.
+EPOCH = pytz_utc.localize(datetime.datetime(2016, 1, 8))
+RESOLUTION = datetime.timedelta(minutes=1)
+
+# Maximum duration of the random intervals (units of RESOLUTION).
+MAX_DURATION = 20
+
+
+def random_intervals(n, seed=0, max_duration=MAX_DURATION):
+    """
+    Creates random intervals over a span that grows with their number, so
+    that the average overlap in between intervals does not depend on it:
+    there are isolated intervals, overlapping ones, nested ones and
+    intervals that only touch each other. The same seed always yields the
+    same intervals.
+    :param n: Number of intervals
+    :param seed: Seed for the random generator
+    :param max_duration: Maximum duration of the intervals
+    :return: (starts, ends) tuple with the NumPy arrays of their limits, in
+                units of RESOLUTION
+    """
+    rng = numpy.random.RandomState(seed)
+    starts = rng.randint(0, n * max_duration // 2 + 1, n)
+    return starts, starts + rng.randint(1, max_duration + 1, n)
+
+
+def to_slots(starts, ends):
+    """
+    Converts the limits of the intervals into slots.
+    :param starts: Starts of the intervals, in units of RESOLUTION
+    :param ends: Ends of the intervals, in units of RESOLUTION
+    :return: List with the (start, end) tuples of datetime objects
+    """
+    return [
+        (EPOCH + int(s) * RESOLUTION, EPOCH + int(e) * RESOLUTION)
+        for s, e in zip(starts, ends)
+    ]
+
+
+def reference(add, remove):
+    """
+    Brute force calculation of the availability: each one of the points of a
+    dense grid is marked as available if it is covered by any of the (+)
+    intervals and by none of the (-) ones.
+    :param add: (starts, ends) tuple with the (+) intervals
+    :param remove: (starts, ends) tuple with the (-) intervals
+    :return: (starts, ends) tuple with the NumPy arrays of the limits of the
+                runs of available points
+    """
+    length = int(max(
+        numpy.max(add[1]) if len(add[1]) else 0,
+        numpy.max(remove[1]) if len(remove[1]) else 0
+    )) + 1
+
+    def covered(starts, ends):
+        counts = numpy.zeros(length + 1, dtype=numpy.int32)
+        numpy.add.at(counts, starts, 1)
+        numpy.add.at(counts, ends, -1)
+        return numpy.cumsum(counts)[:length] > 0
+
+    available = covered(*add) & ~covered(*remove)
+    edges = numpy.diff(
+        numpy.concatenate(([0], available.astype(numpy.int8), [0]))
+    )
+
+    return numpy.flatnonzero(edges == 1), numpy.flatnonzero(edges == -1)
+
+
+def merge_legacy(add_slots, remove_slots):
+    """
+    Availability calculated with the original slot manipulation functions.
+    :param add_slots: List with the (+) slots
+    :param remove_slots: List with the (-) slots
+    :return: List with the available slots
+    """
+    return slots.merge_slots(
+        slots.normalize_slots(sorted(add_slots)),
+        slots.normalize_slots(sorted(remove_slots))
+    )
+
+
+def merge_intervals(add_slots, remove_slots):
+    """
+    Availability calculated with the sets of intervals.
+    :param add_slots: List with the (+) slots
+    :param remove_slots: List with the (-) slots
+    :return: List with the available slots
+    """
+    return (
+        intervals.IntervalSet.from_slots(add_slots) -
+        intervals.IntervalSet.from_slots(remove_slots)
+    ).to_slots()
+
+
+# Implementations to be compared, each one with the same signature.
+IMPLEMENTATIONS = collections.OrderedDict([
+    ('legacy', merge_legacy),
+    ('interval_set', merge_intervals)
+])
+
+
+def check(add, remove):
+    """
+    Checks all the implementations against the brute force reference.
+    :param add: (starts, ends) tuple with the (+) intervals
+    :param remove: (starts, ends) tuple with the (-) intervals
+    :return: Dictionary with the result of the check of each implementation
+    """
+    add_slots, remove_slots = to_slots(*add), to_slots(*remove)
+    expected = to_slots(*reference(add, remove))
+
+    return dict(
+        (name, f(add_slots, remove_slots) == expected)
+        for name, f in IMPLEMENTATIONS.items()
+    )
+
+
+def run(n, seed=0, equivalence=True):
+    """
+    Runs the benchmark for a random scenario with the given number of (+)
+    and (-) intervals.
+    :param n: Number of (+) intervals, and of (-) intervals
+    :param seed: Seed for the generation of the intervals
+    :param equivalence: Flag that enables the check of the results against
+                        the brute force reference
+    :return: JSON-like serializable dictionary with the results
+    """
+    if not 0 < n <= MAX_INTERVALS:
+        raise ValueError(
+            'intervals must be within (0, ' + str(MAX_INTERVALS) + ']'
+        )
+
+    logger.info('>>> @benchmark.run, intervals = ' + str(n))
+
+    add = random_intervals(n, seed=seed)
+    remove = random_intervals(n, seed=seed + 1)
+    add_slots, remove_slots = to_slots(*add), to_slots(*remove)
+    expected = to_slots(*reference(add, remove)) if equivalence else None
+
+    result = {'intervals': n, 'seed': seed}
+
+    for name, f in IMPLEMENTATIONS.items():
+
+        t_0 = time.perf_counter()
+        actual = f(list(add_slots), list(remove_slots))
+        result[name] = {
+            'seconds': time.perf_counter() - t_0,
+            'slots': len(actual)
+        }
+
+        if equivalence:
+            result[name]['equivalent'] = actual == expected
+
+    return result
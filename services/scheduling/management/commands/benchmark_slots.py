@@ -0,0 +1,94 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import json
+from optparse import make_option
+from django.core.management import base
+
+from services.scheduling import benchmark
+
+
+def _read_sizes(value):
+    """
+    Reads a comma separated list of sizes.
+    :param value: String with the list
+    :return: List with the sizes (int)
+    """
+    try:
+        return [int(v) for v in value.split(',') if v.strip()]
+    except ValueError:
+        raise base.CommandError('Invalid list of sizes: ' + str(value))
+
+
+class Command(base.BaseCommand):
+    """
+    Benchmark of the merging of the availability slots with random
+    scenarios. For each size, all the implementations are timed with the
+    same (+) and (-) intervals and, optionally, their results are checked
+    against a brute force reference. The results are written as JSON.
+    """
+
+    help = 'Benchmarks the merging of the availability slots over random ' +\
+        'sets of (+) and (-) intervals (up to ' +\
+        str(benchmark.MAX_INTERVALS) + ' intervals)'
+
+    option_list = base.BaseCommand.option_list + (
+        make_option(
+            '--intervals', default='100,1000,10000,100000,1000000',
+            help='Comma separated numbers of (+) and (-) intervals'
+        ),
+        make_option(
+            '--seed', type='int', default=0,
+            help='Seed for the generation of the intervals'
+        ),
+        make_option(
+            '--no-equivalence', action='store_false', dest='equivalence',
+            default=True, help='Skips the check against the reference'
+        ),
+        make_option(
+            '--output', default=None,
+            help='File for the results, by default, the standard output'
+        ),
+    )
+
+    def handle(self, *args, **options):
+
+        results = []
+
+        for n in _read_sizes(options['intervals']):
+
+            try:
+                results.append(benchmark.run(
+                    n, seed=options['seed'],
+                    equivalence=options['equivalence']
+                ))
+            except ValueError as ex:
+                raise base.CommandError(str(ex))
+
+        output = json.dumps(
+            {
+                'implementations': list(benchmark.IMPLEMENTATIONS.keys()),
+                'results': results
+            },
+            indent=2, sort_keys=True
+        )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduling', '0011_auto_20160212_0705'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='availabilityslot',
+            index_together=set([('groundstation', 'start', 'end')]),
+        ),
+        migrations.AlterIndexTogether(
+            name='operationalslot',
+            index_together=set([('pass_slot', 'start'), ('end', 'start')]),
+        ),
+    ]
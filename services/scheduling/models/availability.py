@@ -25,7 +25,7 @@ from services.configuration.models import segments as segment_models
 from services.configuration.models import rules as rule_models
 
 
-class AvailabilitySlotsManager(django_models.Manager):
+class AvailabilitySlotsManager(sn_slots.SlotManager):
     """
     Manager for handling the main operations over the availability slots.
     """
@@ -86,7 +86,7 @@ class AvailabilitySlotsManager(django_models.Manager):
 
         for a_i in self.filter(
             groundstation=groundstation
-        ).filter(start__lt=end, end__gt=start):
+        ).overlapping(start, end):
 
             result.append(
                 sn_slots.cutoff((a_i.start, a_i.end), (start, end))
@@ -187,6 +187,8 @@ class AvailabilitySlot(django_models.Model):
     """
     class Meta:
         app_label = 'scheduling'
+        # Lookups of the slots of a groundstation within a time range.
+        index_together = [('groundstation', 'start', 'end')]
 
     ID_FIELDS_SEPARATOR = '-'
 
@@ -2,9 +2,9 @@
 import logging
 
 from django.db import models as django_models
-from django.db.models import Q
 
-from services.common import misc as sn_misc, slots as sn_slots
+from services.common import intervals as sn_intervals, misc as sn_misc
+from services.common import slots as sn_slots
 from services.scheduling.models import availability as availability_models
 from services.scheduling.models import compatibility as compatibility_models
 from services.simulation.models import passes as pass_models
@@ -40,7 +40,7 @@ STATE_CANCELED = str('CANCELED')
 STATE_REMOVED = str('REMOVED')
 
 
-class OperationalSlotsManager(django_models.Manager):
+class OperationalSlotsManager(sn_slots.SlotManager):
     """
     Manager for handling all the operations associated with the objects from
     the OperationalSlots table.
@@ -148,34 +148,6 @@ class OperationalSlotsManager(django_models.Manager):
 
         return result
 
-    @staticmethod
-    def _slots_query(start, end):
-        """Private method
-        Returns the Q() expression to properly filter the applicable slots for
-        the given window. This expression selects the following set of slots:
-            1) all the slots that completely occur within the window,
-            2) all the slots that starts before the window and end after it
-                starts,
-            3) all the slots that end after the window and start before it ends,
-            4) all the slots that start before the window and end after it ends.
-
-        IMPORTANT: It does not truncate slots selected with criterions
-        {2, 3, 4}, being this an issue left for further steps if it is
-        strictly require to meet the restrictions of the window.
-
-        NOTE: This Q() expression can be either used with Availability or with
-        Operational slots.
-
-        :param start: Start of the window
-        :param end: End of the window
-        :return: Q() expression to be used together with filter()
-        """
-        return \
-            Q(start__gte=start) & Q(end__lte=end) | \
-            Q(start__lt=start) & Q(end__gt=start) & Q(end__lte=end) | \
-            Q(end__gt=end) & Q(start__lt=start) & Q(end__lte=end) | \
-            Q(start__lte=start) & Q(end__gte=end)
-
     def availability_generates_slots(self, availability_slot):
         """
         Method that generates the Operational slots corresponding to the given
@@ -204,11 +176,8 @@ class OperationalSlotsManager(django_models.Manager):
             ]
         )
 
-        p_slots = compatible_p_slots.filter(
-            OperationalSlotsManager._slots_query(
-                availability_slot.start,
-                availability_slot.end
-            )
+        p_slots = compatible_p_slots.overlapping(
+            availability_slot.start, availability_slot.end
         )
 
         logger.info(
@@ -259,12 +228,7 @@ class OperationalSlotsManager(django_models.Manager):
         #   (b) occur within the applicability range of the Availability slot
         a_slots = availability_models.AvailabilitySlot.objects.filter(
             groundstation=pass_slot.groundstation
-        ).filter(
-            OperationalSlotsManager._slots_query(
-                pass_slot.start,
-                pass_slot.end
-            )
-        )
+        ).overlapping(pass_slot.start, pass_slot.end)
 
         # 2) we filter the pass slots that are applicable to the window of this
         #       availability slot; truncating the first and the last one if
@@ -279,6 +243,73 @@ class OperationalSlotsManager(django_models.Manager):
                 availability_slot=a, pass_slot=pass_slot, start=start, end=end
             )
 
+    def passes_generate_slots(self, pass_slots):
+        """
+        Method that generates all the Operational slots related to a batch of
+        newly created pass slots. Both the compatibility of the pairs and the
+        availability slots of the groundstations are read with a single query
+        for the whole batch, all the operational slots being created in bulk.
+
+        :param pass_slots: list with the new pass slots
+        """
+        if not pass_slots:
+            return
+
+        gs_ids = set(p.groundstation_id for p in pass_slots)
+        start = min(p.start for p in pass_slots)
+        end = max(p.end for p in pass_slots)
+
+        # 0) Compatible (groundstation, spacecraft) pairs
+        compatible = set(
+            compatibility_models.ChannelCompatibility.objects.filter(
+                groundstation__in=gs_ids,
+                spacecraft__in=set(p.spacecraft_id for p in pass_slots)
+            ).values_list('groundstation_id', 'spacecraft_id')
+        )
+
+        # 1) Availability slots of the groundstations over the whole batch
+        a_slots = {}
+        for a in availability_models.AvailabilitySlot.objects.filter(
+            groundstation__in=gs_ids
+        ).overlapping(start, end).order_by('start'):
+            a_slots.setdefault(a.groundstation_id, []).append(a)
+
+        # 2) Compatible passes, grouped by groundstation
+        p_slots = {}
+        for p in pass_slots:
+
+            if (p.groundstation_id, p.spacecraft_id) not in compatible:
+                logger.warn('No compatibility for pass slot = ' + str(p))
+                continue
+
+            p_slots.setdefault(p.groundstation_id, []).append(p)
+
+        # 3) Operational slots for the compatible passes, truncated to the
+        #       availability slots that they overlap with
+        o_slots = []
+
+        for gs_id, gs_p_slots in p_slots.items():
+
+            gs_a_slots = a_slots.get(gs_id, [])
+
+            for i, j, (o_start, o_end) in sn_intervals.overlaps(
+                [(p.start, p.end) for p in gs_p_slots],
+                [(a.start, a.end) for a in gs_a_slots]
+            ):
+                p = gs_p_slots[i]
+                o_slots.append(OperationalSlot(
+                    identifier=self.create_identifier(
+                        p.groundstation, p.spacecraft, o_start
+                    ),
+                    start=o_start,
+                    end=o_end,
+                    pass_slot=p,
+                    availability_slot=gs_a_slots[j]
+                ))
+
+        if o_slots:
+            self.bulk_create(o_slots)
+
     def compatibility_generates_slots(self, compatibility):
         """
         Method that generates the operational slots whenever a compatibility
@@ -312,6 +343,9 @@ class OperationalSlot(django_models.Model):
     class Meta:
         app_label = 'scheduling'
         ordering = ['identifier']
+        # Lookups of the slots of a pass and of the upcoming slots, ordered
+        # by their start.
+        index_together = [('pass_slot', 'start'), ('end', 'start')]
 
     ID_FIELDS_SEPARATOR = '-'
 
@@ -167,6 +167,24 @@ def pass_slot_added(sender, instance, created, raw, **kwargs):
     operational_models.OperationalSlot.objects.pass_generates_slots(instance)
 
 
+# noinspection PyUnusedLocal
+@django_dispatch.receiver(
+    pass_models.passes_bulk_created, sender=pass_models.PassSlots
+)
+def pass_slots_bulk_added(sender, pass_slots, **kwargs):
+    """
+    Updates the available Operational Slots after a batch of pass slots has
+    been created in bulk.
+
+    :param sender: any sender is accepted
+    :param pass_slots: List with the just created objects
+    :param kwargs: Additional parameters
+    """
+    operational_models.OperationalSlot.objects.passes_generate_slots(
+        pass_slots
+    )
+
+
 # noinspection PyUnusedLocal
 @django_dispatch.receiver(
     django_signals.pre_delete, sender=pass_models.PassSlots
@@ -667,3 +667,31 @@ class TestAvailability(test.TestCase):
             )[0],
             (s_time, e_time)
         )
+
+    def test_indexes(self):
+        """INTR test: services.scheduling - availability slots indexes
+        The lookups of the availability slots of a groundstation within a
+        time range must be resolved with the composite index, on a table of
+        realistic size.
+        """
+        start = misc.get_next_midnight()
+        availability.AvailabilitySlot.objects.bulk_create([
+            availability.AvailabilitySlot(
+                identifier=gs.identifier + '-' + str(i), groundstation=gs,
+                start=start + datetime.timedelta(hours=i),
+                end=start + datetime.timedelta(hours=i, minutes=30)
+            )
+            for gs in (self.__gs, self.__gs_2)
+            for i in range(10000)
+        ])
+
+        window_s = start + datetime.timedelta(days=10)
+        window_e = window_s + datetime.timedelta(days=1)
+
+        plan = db_tools.explain(
+            availability.AvailabilitySlot.objects.filter(
+                groundstation=self.__gs
+            ).overlapping(window_s, window_e)
+        )
+        self.assertIn('Index', plan)
+        self.assertNotIn('Seq Scan', plan)
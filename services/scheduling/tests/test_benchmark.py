@@ -0,0 +1,92 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import logging
+import numpy
+from django import test
+
+from services.scheduling import benchmark
+
+
+class BenchmarkTest(test.TestCase):
+    """UNIT tests
+    Tests for the benchmark of the merging of the availability slots.
+    """
+
+    def setUp(self):
+        """Test setup
+        """
+        self.__verbose_testing = False
+
+        if not self.__verbose_testing:
+            logging.getLogger('scheduling').setLevel(level=logging.CRITICAL)
+
+    def test_reference(self):
+        """UNIT test: services.scheduling.benchmark.reference
+        """
+        starts, ends = benchmark.reference(
+            (numpy.array([0, 5, 12, 30]), numpy.array([5, 10, 20, 31])),
+            (numpy.array([2, 15]), numpy.array([3, 18]))
+        )
+        self.assertEquals(starts.tolist(), [0, 3, 12, 18, 30])
+        self.assertEquals(ends.tolist(), [2, 10, 15, 20, 31])
+
+        starts, ends = benchmark.reference(
+            (numpy.array([0]), numpy.array([5])), ([], [])
+        )
+        self.assertEquals(starts.tolist(), [0])
+        self.assertEquals(ends.tolist(), [5])
+
+    def test_equivalence(self):
+        """UNIT test: services.scheduling.benchmark - equivalence
+        All the implementations must yield the same slots as the brute force
+        reference for many random scenarios, small enough so that all the
+        special cases (nested, touching or identical intervals, no (-)
+        intervals at all...) appear.
+        """
+        rng = numpy.random.RandomState(0)
+
+        for seed in range(300):
+
+            n = rng.randint(1, 30)
+            add = benchmark.random_intervals(n, seed=2 * seed)
+            remove = benchmark.random_intervals(
+                rng.randint(0, 30), seed=2 * seed + 1
+            )
+
+            for name, equivalent in benchmark.check(add, remove).items():
+                self.assertTrue(
+                    equivalent,
+                    'Implementation <' + name + '> failed, seed = ' +
+                    str(seed)
+                )
+
+    def test_run(self):
+        """UNIT test: services.scheduling.benchmark.run
+        """
+        result = benchmark.run(1000, seed=1)
+
+        self.assertEquals(result['intervals'], 1000)
+        for name in benchmark.IMPLEMENTATIONS:
+            self.assertTrue(result[name]['equivalent'])
+            self.assertGreater(result[name]['slots'], 0)
+            self.assertGreaterEqual(result[name]['seconds'], 0)
+
+        self.assertRaises(ValueError, benchmark.run, 0)
+        self.assertRaises(
+            ValueError, benchmark.run, benchmark.MAX_INTERVALS + 1
+        )
@@ -0,0 +1,374 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import collections
+import datetime
+import logging
+import math
+import time
+import numpy
+from django.db import transaction
+from pytz import utc as pytz_utc
+
+from services.accounts import models as account_models
+from services.common import ephemeris, propagators, simulation
+from services.configuration.models import segments as segment_models
+from services.configuration.models import tle as tle_models
+from services.simulation.models import groundtracks as groundtrack_models
+from services.simulation.models import passes as pass_models
+from website import settings as sn_settings
+
+logger = logging.getLogger('simulation')
+
+# Limits for the size of the synthetic scenarios.
+MAX_OBJECTS = 2000
+MAX_STATIONS = 200
+
+# All the scenarios are simulated from the same instant, which is also the
+# epoch of all the synthetic TLEs, so that the results of different runs can
+# be compared.
+EPOCH = pytz_utc.localize(datetime.datetime(2016, 1, 8))
+
+# Prefix for the identifiers of the objects created in the database.
+_PREFIX = 'BENCH-'
+
+# TLE-like object with the same attributes as the TwoLineElement model, so
+# that it can be used with the OrbitalSimulator without being stored.
+SyntheticTLE = collections.namedtuple(
+    'SyntheticTLE', ['identifier', 'first_line', 'second_line']
+)
+
+
+def tle_checksum(line):
+    """
+    Calculates the checksum of a line of a TLE: the sum of all its digits,
+    counting each minus sign as 1, modulo 10.
+    :param line: String with the first 68 characters of the line
+    :return: Checksum digit (int)
+    """
+    return sum(
+        int(c) if c.isdigit() else 1 if c == '-' else 0 for c in line
+    ) % 10
+
+
+def synthetic_tle(number, inclination, raan, eccentricity, argp, mo, no):
+    """
+    Writes the lines of a TLE for an object in a low Earth orbit, with its
+    epoch at <EPOCH> and without drag.
+    :param number: Catalog number of the object
+    :param inclination: Inclination (degrees)
+    :param raan: Right ascension of the ascending node (degrees)
+    :param eccentricity: Eccentricity
+    :param argp: Argument of the perigee (degrees)
+    :param mo: Mean anomaly (degrees)
+    :param no: Mean motion (revolutions per day)
+    :return: SyntheticTLE object
+    """
+    epoch = EPOCH.timetuple()
+    day = epoch.tm_yday + (
+        EPOCH - EPOCH.replace(hour=0, minute=0, second=0, microsecond=0)
+    ).total_seconds() / 86400.0
+
+    l1 = '1 %05dU %-8s %02d%012.8f  .00000000  00000-0  00000-0 0  999' % (
+        number, '16001A', epoch.tm_year % 100, day
+    )
+    l2 = '2 %05d %8.4f %8.4f %07d %8.4f %8.4f %11.8f%05d' % (
+        number, inclination, raan, int(round(eccentricity * 1e7)), argp, mo,
+        no, 1
+    )
+
+    return SyntheticTLE(
+        identifier=_PREFIX + '%05d' % number,
+        first_line=l1 + str(tle_checksum(l1)),
+        second_line=l2 + str(tle_checksum(l2))
+    )
+
+
+def synthetic_catalogue(objects, seed=0):
+    """
+    Creates a catalogue of objects in low Earth orbits with random orbital
+    elements. The same seed always yields the same catalogue.
+    :param objects: Number of objects
+    :param seed: Seed for the random generator
+    :return: List with the SyntheticTLE objects
+    """
+    rng = numpy.random.RandomState(seed)
+
+    return [
+        synthetic_tle(
+            i + 1,
+            inclination=rng.uniform(30.0, 100.0),
+            raan=rng.uniform(0.0, 360.0),
+            eccentricity=rng.uniform(1e-4, 1e-2),
+            argp=rng.uniform(0.0, 360.0),
+            mo=rng.uniform(0.0, 360.0),
+            no=rng.uniform(14.0, 15.8)
+        )
+        for i in range(objects)
+    ]
+
+
+def station_grid(stations, contact_elevation=5):
+    """
+    Distributes the given number of groundstations evenly over the Earth,
+    along a Fibonacci lattice.
+    :param stations: Number of groundstations
+    :param contact_elevation: Minimum elevation for the contacts (degrees)
+    :return: List with the GroundStationCoordinates objects
+    """
+    golden_angle = math.pi * (3.0 - math.sqrt(5.0))
+
+    return [
+        simulation.GroundStationCoordinates(
+            latitude=math.degrees(math.asin(1.0 - 2.0 * (i + 0.5) / stations)),
+            longitude=math.degrees(
+                (i * golden_angle + math.pi) % (2 * math.pi) - math.pi
+            ),
+            contact_elevation=contact_elevation,
+            altitude=0
+        )
+        for i in range(stations)
+    ]
+
+
+def time_passes(tles, stations, interval, backend=None):
+    """
+    Times the calculation of the passes of all the objects over all the
+    stations, together with their geometry, starting with an empty cache of
+    ephemerides. The results include the number of exact evaluations of the
+    propagator spent on the geometry, see
+    <services.common.simulation.OrbitalSimulator.pass_geometry>.
+    :param tles: List with the TLE objects
+    :param stations: List with the GroundStationCoordinates objects
+    :param interval: (start, end) tuple with the simulation window
+    :param backend: Name of the propagator, see <services.common.propagators>
+    :return: (results, passes) tuple with the dictionary with the results and
+                the calculated passes, one list per object and station
+    """
+    ephemeris.cache.clear()
+    simulator = simulation.OrbitalSimulator(backend=backend)
+    passes = []
+
+    t_0 = time.perf_counter()
+
+    for tle in tles:
+        simulator.set_spacecraft(tle)
+        passes.append(simulator.calculate_pass_slots(
+            stations, interval[0], interval[1], geometry=True
+        ))
+
+    seconds = time.perf_counter() - t_0
+    count = sum(len(s) for sc_slots in passes for s in sc_slots)
+
+    # Only PyEphem evaluates exactly the ends and the culmination of each
+    # pass, the other backends interpolate them from their samples.
+    evaluations = 0
+    if (backend or sn_settings.SIMULATION_PROPAGATOR) ==\
+            propagators.PyEphemPropagator.name:
+        evaluations = 2 + simulator.PASS_CULMINATION_EVALUATIONS
+
+    return {
+        'seconds': seconds,
+        'passes': count,
+        'geometry_evaluations': count * evaluations
+    }, passes
+
+
+def time_groundtracks(tles, interval, backend=None):
+    """
+    Times the calculation of the groundtracks of all the objects, including
+    their conversion into the format of the database, starting with an empty
+    cache of ephemerides.
+    :param tles: List with the TLE objects
+    :param interval: (start, end) tuple with the simulation window
+    :param backend: Name of the propagator, see <services.common.propagators>
+    :return: (results, groundtracks) tuple with the dictionary with the
+                results and the groundtracks, ready to be stored
+    """
+    ephemeris.cache.clear()
+    simulator = simulation.OrbitalSimulator(backend=backend)
+    groundtracks = []
+
+    t_0 = time.perf_counter()
+
+    for tle in tles:
+        groundtracks.append(
+            groundtrack_models.GroundTrackManager.groundtrack_to_dbarray(
+                simulator.calculate_groundtrack(tle, interval=interval)
+            )
+        )
+
+    seconds = time.perf_counter() - t_0
+
+    return {
+        'seconds': seconds,
+        'points': sum(len(gt[0]) for gt in groundtracks)
+    }, groundtracks
+
+
+class _Rollback(Exception):
+    """
+    Raised for discarding all the changes done for the benchmark.
+    """
+    pass
+
+
+def time_persistence(tles, stations, passes, groundtracks, interval):
+    """
+    Times the storage of the passes and of the groundtracks in the database.
+    The spacecraft and the groundstations are created in bulk, so that none
+    of the simulations triggered by their signals are executed, and all the
+    changes are rolled back at the end.
+    :param tles: List with the TLE objects
+    :param stations: List with the GroundStationCoordinates objects
+    :param passes: Passes, as returned by <time_passes>
+    :param groundtracks: Groundtracks, as returned by <time_groundtracks>
+    :param interval: (start, end) tuple with the simulation window
+    :return: Dictionary with the results
+    """
+    results = {}
+
+    try:
+        with transaction.atomic():
+
+            user = account_models.UserProfile.objects.create(
+                username=_PREFIX.lower() + 'user', country='US',
+                organization='SATNet'
+            )
+            tle_models.TwoLineElement.objects.bulk_create([
+                tle_models.TwoLineElement(
+                    identifier=t.identifier, timestamp=0, source='benchmark',
+                    first_line=t.first_line, second_line=t.second_line
+                )
+                for t in tles
+            ])
+            segment_models.Spacecraft.objects.bulk_create([
+                segment_models.Spacecraft(
+                    user=user, identifier=t.identifier, callsign='BENCH',
+                    tle=t
+                )
+                for t in tle_models.TwoLineElement.objects.filter(
+                    identifier__startswith=_PREFIX
+                )
+            ])
+            segment_models.GroundStation.objects.bulk_create([
+                segment_models.GroundStation(
+                    user=user, identifier=_PREFIX + '%05d' % i,
+                    callsign='BENCH', contact_elevation=s.contact_elevation,
+                    latitude=s.latitude, longitude=s.longitude,
+                    altitude=s.altitude
+                )
+                for i, s in enumerate(stations)
+            ])
+
+            spacecraft = list(segment_models.Spacecraft.objects.filter(
+                identifier__startswith=_PREFIX
+            ).select_related('tle').order_by('identifier'))
+            groundstations = list(segment_models.GroundStation.objects.filter(
+                identifier__startswith=_PREFIX
+            ).order_by('identifier'))
+
+            t_0 = time.perf_counter()
+            stored = pass_models.PassSlots.objects._store_passes([
+                (sc, gs, slots, interval[1])
+                for sc, sc_slots in zip(spacecraft, passes)
+                for gs, slots in zip(groundstations, sc_slots)
+            ])
+            results['passes'] = {
+                'seconds': time.perf_counter() - t_0,
+                'rows': len(stored)
+            }
+
+            t_0 = time.perf_counter()
+            groundtrack_models.GroundTrack.objects.bulk_create([
+                groundtrack_models.GroundTrack(spacecraft=sc, tle=sc.tle)
+                for sc in spacecraft
+            ])
+            chunks = [
+                c
+                for gt, points in zip(
+                    groundtrack_models.GroundTrack.objects.filter(
+                        spacecraft__in=spacecraft
+                    ).order_by('spacecraft__identifier'),
+                    groundtracks
+                )
+                for c in groundtrack_models.GroundTrackChunkManager.chunks(
+                    gt, *points
+                )
+            ]
+            groundtrack_models.GroundTrackChunk.objects.bulk_create(chunks)
+            results['groundtracks'] = {
+                'seconds': time.perf_counter() - t_0,
+                'rows': len(chunks)
+            }
+
+            raise _Rollback()
+
+    except _Rollback:
+        pass
+
+    return results
+
+
+def run(objects, stations, days=1, backend=None, seed=0, persistence=True):
+    """
+    Runs the benchmark for a synthetic scenario.
+    :param objects: Number of objects of the catalogue
+    :param stations: Number of groundstations
+    :param days: Duration of the simulation window (days)
+    :param backend: Name of the propagator, see <services.common.propagators>
+    :param seed: Seed for the generation of the catalogue
+    :param persistence: Flag that enables the benchmark of the storage of the
+                        results in the database
+    :return: JSON-like serializable dictionary with the results
+    """
+    if not 0 < objects <= MAX_OBJECTS:
+        raise ValueError(
+            'objects must be within (0, ' + str(MAX_OBJECTS) + ']'
+        )
+    if not 0 < stations <= MAX_STATIONS:
+        raise ValueError(
+            'stations must be within (0, ' + str(MAX_STATIONS) + ']'
+        )
+
+    tles = synthetic_catalogue(objects, seed=seed)
+    grid = station_grid(stations)
+    interval = (EPOCH, EPOCH + datetime.timedelta(days=days))
+
+    logger.info(
+        '>>> @benchmark.run, objects = ' + str(objects) +
+        ', stations = ' + str(stations)
+    )
+
+    result = {
+        'objects': objects,
+        'stations': stations,
+        'days': days,
+        'backend': backend or sn_settings.SIMULATION_PROPAGATOR,
+        'seed': seed
+    }
+    result['passes'], passes = time_passes(tles, grid, interval, backend)
+    result['groundtracks'], groundtracks = time_groundtracks(
+        tles, interval, backend
+    )
+
+    if persistence:
+        result['persistence'] = time_persistence(
+            tles, grid, passes, groundtracks, interval
+        )
+
+    return result
@@ -0,0 +1,139 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import csv
+import json
+import logging
+import uuid
+from django.db import connection, transaction
+
+from services.configuration.jrpc.serializers import segments as \
+    segment_serializers
+from services.scheduling.jrpc.serializers import availability as \
+    availability_serializers
+from services.simulation.jrpc.serializers import passes as pass_serializers
+from services.simulation.models import passes as pass_models
+
+logger = logging.getLogger('simulation')
+
+# Formats for the export of the passes.
+FORMAT_NDJSON = 'ndjson'
+FORMAT_CSV = 'csv'
+
+# Number of rows read from the database at once.
+BATCH_SIZE = 2000
+
+# Columns of the exported rows, with the same keys as the JRPC responses.
+COLUMNS = (
+    segment_serializers.SC_ID_K,
+    segment_serializers.GS_ID_K,
+    availability_serializers.DATE_START_K,
+    availability_serializers.DATE_END_K,
+    pass_serializers.MAX_ELEVATION_K,
+    pass_serializers.CULMINATION_K,
+    pass_serializers.AOS_AZIMUTH_K,
+    pass_serializers.LOS_AZIMUTH_K
+)
+_FIELDS = (
+    'spacecraft__identifier', 'groundstation__identifier', 'start', 'end',
+    'max_elevation', 'culmination', 'aos_azimuth', 'los_azimuth'
+)
+
+
+def read_passes(start, end, batch_size=BATCH_SIZE):
+    """
+    Reads all the passes for all the pairs that overlap with the given window,
+    ordered by their start. The rows are read through a server-side cursor,
+    "batch_size" rows at a time, so that the memory used does not depend on
+    the number of passes.
+
+    :param start: Start of the window (datetime, UTC)
+    :param end: End of the window (datetime, UTC)
+    :param batch_size: Number of rows read from the database at once
+    :return: Generator with one tuple per pass, with the values of COLUMNS
+    """
+    sql, params = pass_models.PassSlots.objects.overlapping(
+        start, end
+    ).order_by('start', 'pk').values_list(*_FIELDS).query.sql_with_params()
+
+    with transaction.atomic():
+
+        connection.ensure_connection()
+        cursor = connection.connection.cursor(
+            name='passes_export_' + uuid.uuid4().hex
+        )
+        cursor.itersize = batch_size
+
+        try:
+            cursor.execute(sql, params)
+            for row in cursor:
+                yield row
+        finally:
+            cursor.close()
+
+
+def _serialize_value(value):
+    """
+    Converts the value of a column of a row into a JSON-like serializable one.
+    :param value: Value of the column
+    :return: The value, with the datetime objects in ISO-8601 format
+    """
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def to_ndjson(rows):
+    """
+    Writes the rows as newline-delimited JSON objects, one per line.
+    :param rows: Iterable with the rows, as returned by <read_passes>
+    :return: Generator with the lines
+    """
+    for row in rows:
+        yield json.dumps(dict(
+            (k, _serialize_value(v)) for k, v in zip(COLUMNS, row)
+        )) + '\n'
+
+
+class _Echo(object):
+    """
+    File-like object whose "write" method returns the written value, so that
+    a csv.writer returns each line instead of buffering it.
+    """
+
+    def write(self, value):
+        return value
+
+
+def to_csv(rows):
+    """
+    Writes the rows as CSV lines, preceded by a header with the columns.
+    :param rows: Iterable with the rows, as returned by <read_passes>
+    :return: Generator with the lines
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(COLUMNS)
+
+    for row in rows:
+        yield writer.writerow([
+            '' if v is None else _serialize_value(v) for v in row
+        ])
+
+
+# Writer and MIME type for each one of the formats.
+FORMATS = {
+    FORMAT_NDJSON: (to_ndjson, 'application/x-ndjson'),
+    FORMAT_CSV: (to_csv, 'text/csv')
+}
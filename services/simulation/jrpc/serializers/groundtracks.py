@@ -16,7 +16,10 @@
 __author__ = 'rtubiopa@calpoly.edu'
 
 import datetime
+from services.common import decimation as sn_decimation
 from services.common import misc
+from services.common import serialization as sn_serialization
+from services.simulation.models import groundtracks as groundtrack_models
 
 
 class SimulationSerializer(object):
@@ -24,54 +27,160 @@ class SimulationSerializer(object):
     Serializer for the Simulation-related objects from the database.
     """
 
-    _DECIMATION_RATE = 1
     _PERIOD = datetime.timedelta(hours=8)
 
     TIMESTAMP_K = 'timestamp'
     LATITUDE_K = 'latitude'
     LONGITUDE_K = 'longitude'
+    FORMAT_K = 'format'
+    PRECISION_K = 'precision'
+
+    # Number of decimal digits of the coordinates for the columnar format.
+    COORDINATES_PRECISION = 5
+
+    # Parameters for the decimation of the groundtracks, for instance:
+    # { 'mode': 'error', 'value': 0.1 }
+    DECIMATION_MODE_K = 'mode'
+    DECIMATION_VALUE_K = 'value'
+    # Fixed step in between two points (seconds).
+    DECIMATION_STEP = 'step'
+    # Maximum number of points, evenly spread.
+    DECIMATION_POINTS = 'points'
+    # Maximum deviation of the simplified track (degrees).
+    DECIMATION_ERROR = 'error'
 
     @staticmethod
-    def serialize_groundtrack(groundtrack):
+    def deserialize_decimation(decimation):
+        """
+        Reads the parameters for the decimation of a groundtrack.
+        :param decimation: JSON-like object with the parameters, None for no
+                            decimation
+        :return: (mode, value) tuple, (None, None) for no decimation
+        """
+        if not decimation:
+            return None, None
+
+        mode = decimation.get(SimulationSerializer.DECIMATION_MODE_K)
+        if mode not in (
+            SimulationSerializer.DECIMATION_STEP,
+            SimulationSerializer.DECIMATION_POINTS,
+            SimulationSerializer.DECIMATION_ERROR
+        ):
+            raise Exception(
+                'Decimation mode <' + str(mode) + '> not supported.'
+            )
+
+        try:
+            value = float(decimation[SimulationSerializer.DECIMATION_VALUE_K])
+        except (KeyError, TypeError, ValueError):
+            raise Exception(
+                'Parameter not provided, key = ' +
+                SimulationSerializer.DECIMATION_VALUE_K
+            )
+        if value <= 0:
+            raise Exception('Decimation value must be positive.')
+        if mode == SimulationSerializer.DECIMATION_POINTS and (
+            value < 2 or value != int(value)
+        ):
+            raise ValueError(
+                'Decimation by points requires an integer value >= 2.'
+            )
+
+        return mode, value
+
+    @staticmethod
+    def serialize_columns(timestamps, latitudes, longitudes, response_format):
+        """
+        Serializes the points of a groundtrack as parallel arrays: the
+        timestamps are delta-encoded and the coordinates are either
+        fixed-precision integers or base64-packed float32 values.
+        :param timestamps: List with the timestamps (integer seconds)
+        :param latitudes: List with the latitudes (degrees)
+        :param longitudes: List with the longitudes (degrees)
+        :param response_format: Either FORMAT_COLUMNAR or FORMAT_COLUMNAR_B64
+        :return: Object with the arrays
+        """
+        result = {
+            SimulationSerializer.FORMAT_K: response_format,
+            SimulationSerializer.TIMESTAMP_K: sn_serialization.delta_encode(
+                timestamps
+            )
+        }
+
+        if response_format == sn_serialization.FORMAT_COLUMNAR_B64:
+            result[SimulationSerializer.LATITUDE_K] = \
+                sn_serialization.float32_encode(latitudes)
+            result[SimulationSerializer.LONGITUDE_K] = \
+                sn_serialization.float32_encode(longitudes)
+        else:
+            precision = SimulationSerializer.COORDINATES_PRECISION
+            result[SimulationSerializer.PRECISION_K] = precision
+            result[SimulationSerializer.LATITUDE_K] = \
+                sn_serialization.fixed_encode(latitudes, precision)
+            result[SimulationSerializer.LONGITUDE_K] = \
+                sn_serialization.fixed_encode(longitudes, precision)
+
+        return result
+
+    @staticmethod
+    def serialize_groundtrack(
+        spacecraft, decimation=None, response_format=None
+    ):
         """JSON-RPC method.
         JSON remotelly invokable method that returns the estimated groundtrack
-        for a given spacecraft.
-        :param groundtrack: The estimated groundtrack.
+        for a given spacecraft. Only the points within the next _PERIOD are
+        read from the database, the current instant itself being excluded.
+        The track can be decimated with either a fixed step (applied by the
+        database), a maximum number of points or a maximum deviation of the
+        simplified track.
+        :param spacecraft: The spacecraft whose groundtrack is serialized.
+        :param decimation: JSON-like object with the parameters for the
+                            decimation, see <deserialize_decimation>
+        :param response_format: Format of the response, see
+                            <services.common.serialization.FORMATS>
         :return: Array containing objects of the type
-                    { 'timestamp', 'latitude', 'longitude' }.
+                    { 'timestamp', 'latitude', 'longitude' } or, for the
+                    columnar formats, an object with the parallel arrays,
+                    see <serialize_columns>.
+        :raises GroundTrack.DoesNotExist: if the spacecraft has no groundtrack
         """
-        result = []
-        index = 0
-        gt_length = len(groundtrack.timestamp)
+        mode, value = SimulationSerializer.deserialize_decimation(decimation)
+        response_format = sn_serialization.read_format(response_format)
         start_date = misc.get_now_utc()
         end_date = start_date + SimulationSerializer._PERIOD
-        start_ts = start_date.timestamp()
-        end_ts = end_date.timestamp()
-
-        print('>>> @serialize_groundtrack.start_ts = ' + str(start_ts))
-        print('>>> @serialize_groundtrack.end_ts = ' + str(end_ts))
-
-        while index < gt_length:
-
-            ts_i = groundtrack.timestamp[index]
-
-            # print('>>> @serialize_groundtrack.ts_i = ' + str(ts_i))
 
-            if ts_i > end_ts:
-                print('>>> @serialize_groundtrack, BREAK')
-                break
-
-            if ts_i > start_ts:
-                result.append({
-                    SimulationSerializer.TIMESTAMP_K: ts_i,
-                    SimulationSerializer.LATITUDE_K: groundtrack.latitude[
-                        index
-                    ],
-                    SimulationSerializer.LONGITUDE_K: groundtrack.longitude[
-                        index
-                    ]
-                })
-
-            index += SimulationSerializer._DECIMATION_RATE
-
-        return result
+        timestamps, latitudes, longitudes = \
+            groundtrack_models.GroundTrack.objects.window(
+                spacecraft, start_date, end_date,
+                step=datetime.timedelta(seconds=value)
+                if mode == SimulationSerializer.DECIMATION_STEP else None
+            )
+
+        # The window is (start, end], whereas window() includes its start.
+        if timestamps and timestamps[0] <= start_date.timestamp():
+            timestamps, latitudes, longitudes = \
+                timestamps[1:], latitudes[1:], longitudes[1:]
+
+        if mode == SimulationSerializer.DECIMATION_POINTS:
+            indexes = sn_decimation.by_count(len(timestamps), int(value))
+        elif mode == SimulationSerializer.DECIMATION_ERROR:
+            indexes = sn_decimation.simplify(latitudes, longitudes, value)
+        else:
+            indexes = range(len(timestamps))
+
+        if response_format != sn_serialization.FORMAT_OBJECTS:
+            return SimulationSerializer.serialize_columns(
+                [timestamps[i] for i in indexes],
+                [latitudes[i] for i in indexes],
+                [longitudes[i] for i in indexes],
+                response_format
+            )
+
+        return [
+            {
+                SimulationSerializer.TIMESTAMP_K: timestamps[i],
+                SimulationSerializer.LATITUDE_K: latitudes[i],
+                SimulationSerializer.LONGITUDE_K: longitudes[i]
+            }
+            for i in indexes
+        ]
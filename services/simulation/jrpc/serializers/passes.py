@@ -15,31 +15,157 @@
 """
 __author__ = 'rtubiopa@calpoly.edu'
 
+import base64
+from services.common import serialization as sn_serialization
 from services.configuration.jrpc.serializers import segments as \
     segment_serializers
 from services.scheduling.jrpc.serializers import availability as \
     availability_serializers
 
+MAX_ELEVATION_K = 'max_elevation'
+CULMINATION_K = 'culmination'
+AOS_AZIMUTH_K = 'aos_azimuth'
+LOS_AZIMUTH_K = 'los_azimuth'
+TRACK_K = 'track'
+FORMAT_K = 'format'
+PRECISION_K = 'precision'
+
+# Number of decimal digits of the angles for the columnar format.
+ANGLES_PRECISION = 2
+
+
+def serialize_pass_geometry(pass_slot, tracks=False):
+    """
+    Serializes the geometry of a pass slot, if it was calculated.
+
+    :param pass_slot: The database model of the slot
+    :param tracks: Flag that enables the serialization of the whole track of
+                    the pass
+    :return: Dictionary with the geometry, empty if there is none
+    """
+    if pass_slot.max_elevation is None:
+        return {}
+
+    geometry = {
+        MAX_ELEVATION_K: pass_slot.max_elevation,
+        CULMINATION_K: pass_slot.culmination.isoformat(),
+        AOS_AZIMUTH_K: pass_slot.aos_azimuth,
+        LOS_AZIMUTH_K: pass_slot.los_azimuth
+    }
+    if tracks:
+        geometry[TRACK_K] = pass_slot.get_track().tolist()
+
+    return geometry
+
+
+def _timestamp_ms(dt):
+    """
+    Converts a datetime object into an integer POSIX timestamp (ms).
+    """
+    return int(round(dt.timestamp() * 1000))
+
+
+def serialize_pass_columns(pass_slots, response_format, tracks=False):
+    """
+    Serializes a list of pass slots as parallel arrays. The starts of the
+    passes are delta-encoded integer timestamps (milliseconds), the ends and
+    the culminations are offsets (milliseconds) from the starts and the
+    angles are either fixed-precision integers or base64-packed float32
+    values (NaN for the passes without geometry). On demand, the tracks are
+    included as base64-packed float32 arrays (None for the passes without
+    geometry).
+
+    :param pass_slots: Original array with the database slot models
+    :param response_format: Either FORMAT_COLUMNAR or FORMAT_COLUMNAR_B64
+    :param tracks: Flag that enables the serialization of the whole tracks
+                    of the passes
+    :return: Serializable object
+    """
+    starts = [_timestamp_ms(s.start) for s in pass_slots]
+    angles = {
+        MAX_ELEVATION_K: [s.max_elevation for s in pass_slots],
+        AOS_AZIMUTH_K: [s.aos_azimuth for s in pass_slots],
+        LOS_AZIMUTH_K: [s.los_azimuth for s in pass_slots]
+    }
+
+    result = {
+        FORMAT_K: response_format,
+        segment_serializers.SC_ID_K: [
+            s.spacecraft.identifier for s in pass_slots
+        ],
+        segment_serializers.GS_ID_K: [
+            s.groundstation.identifier for s in pass_slots
+        ],
+        availability_serializers.DATE_START_K: sn_serialization.delta_encode(
+            starts
+        ),
+        availability_serializers.DATE_END_K: [
+            _timestamp_ms(s.end) - start
+            for s, start in zip(pass_slots, starts)
+        ],
+        CULMINATION_K: [
+            None if s.culmination is None else
+            _timestamp_ms(s.culmination) - start
+            for s, start in zip(pass_slots, starts)
+        ]
+    }
+
+    if response_format == sn_serialization.FORMAT_COLUMNAR_B64:
+        for key, values in angles.items():
+            result[key] = sn_serialization.float32_encode([
+                float('nan') if v is None else v for v in values
+            ])
+    else:
+        result[PRECISION_K] = ANGLES_PRECISION
+        for key, values in angles.items():
+            result[key] = sn_serialization.fixed_encode(
+                values, ANGLES_PRECISION
+            )
+
+    if tracks:
+        result[TRACK_K] = [
+            None if s.track is None else
+            base64.b64encode(bytes(s.track)).decode('ascii')
+            for s in pass_slots
+        ]
+
+    return result
+
 
 # noinspection PyUnusedLocal
-def serialize_pass_slots(pass_slots, by_gs=True):
+def serialize_pass_slots(
+    pass_slots, by_gs=True, response_format=None, tracks=False
+):
     """
     Serializes a list of pass slots into an array of JSON-like serializable
     slot objects.
 
     :param pass_slots: Original array with the database slot models
     :param by_gs: Indicates whether the serialization should be by GS
-    :return: Serializable list
+    :param response_format: Format of the response, see
+                            <services.common.serialization.FORMATS>
+    :param tracks: Flag that enables the serialization of the whole tracks
+                    of the passes, in any of the formats
+    :return: Serializable list or, for the columnar formats, serializable
+                object (see <serialize_pass_columns>)
     """
+    response_format = sn_serialization.read_format(response_format)
+    if response_format != sn_serialization.FORMAT_OBJECTS:
+        return serialize_pass_columns(
+            list(pass_slots), response_format, tracks=tracks
+        )
+
     serial_array = []
 
     for s in pass_slots:
 
-        serial_array.append({
+        serial_slot = {
             segment_serializers.SC_ID_K: s.spacecraft.identifier,
             segment_serializers.GS_ID_K: s.groundstation.identifier,
             availability_serializers.DATE_START_K: s.start.isoformat(),
             availability_serializers.DATE_END_K: s.end.isoformat()
-        })
+        }
+        serial_slot.update(serialize_pass_geometry(s, tracks=tracks))
+        serial_array.append(serial_slot)
 
     return serial_array
@@ -18,26 +18,29 @@ __author__ = 'rtubiopa@calpoly.edu'
 import rpc4django
 
 from services.configuration.models import segments as segment_models
-from services.simulation.models import groundtracks as simulation_models
 from services.simulation.jrpc.serializers import groundtracks
 from website import settings as satnet_settings
 
 
 @rpc4django.rpcmethod(
     name='simulation.sc.groundtrack',
-    signature=['String'],
+    signature=['String', 'Object', 'String'],
     login_required=satnet_settings.JRPC_LOGIN_REQUIRED
 )
-def get_groundtrack(spacecraft_id):
+def get_groundtrack(spacecraft_id, decimation=None, response_format=None):
     """JRPC method.
     Returns the latest points of the simulated groundtrack for this spacecraft.
     :param spacecraft_id: Identifier of the spacecraft.
-    :return: Array of objects containing { timestamp, lat, lng }.
+    :param decimation: Optional object with the decimation of the track:
+                        { mode: 'step' | 'points' | 'error', value }, being
+                        the value the step in seconds, the maximum number of
+                        points or the maximum deviation in degrees.
+    :param response_format: Optional format of the response: 'objects'
+                        (default), 'columnar' or 'columnar-b64'.
+    :return: Array of objects containing { timestamp, lat, lng } or, for the
+                columnar formats, an object with parallel arrays.
     """
     return groundtracks.SimulationSerializer.serialize_groundtrack(
-        simulation_models.GroundTrack.objects.get(
-            spacecraft=segment_models.Spacecraft.objects.get(
-                identifier=spacecraft_id
-            )
-        )
+        segment_models.Spacecraft.objects.get(identifier=spacecraft_id),
+        decimation=decimation, response_format=response_format
     )
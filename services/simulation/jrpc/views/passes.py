@@ -24,54 +24,63 @@ from website import settings as satnet_settings
 
 @rpc4django.rpcmethod(
     name='simulation.sc.passes',
-    signature=['String', 'Object'],
+    signature=['String', 'Object', 'String', 'boolean'],
     login_required=satnet_settings.JRPC_LOGIN_REQUIRED
 )
-def get_sc_passes(spacecraft_id, groundstations):
+def get_sc_passes(
+    spacecraft_id, groundstations, response_format=None, tracks=False
+):
     """JRPC method
-    Returns the passes of a given spacecraft over the specified groundstations.
+    Returns the upcoming passes of a given spacecraft over the specified
+    groundstations.
 
     :param spacecraft_id: Identifier of the spacecraft
     :param groundstations: List of groundstation identifiers
+    :param response_format: Optional format of the response: 'objects'
+                            (default), 'columnar' or 'columnar-b64'
+    :param tracks: Optional flag that includes the whole track of each pass
     :return: JSON-like serializable list with the pass slots for ech
     groundstation.
     """
-    slots = {}
     spacecraft = segment_models.Spacecraft.objects.get(identifier=spacecraft_id)
 
     if not groundstations or len(groundstations) == 0:
 
-        groundstations = segment_models.GroundStation.objects.all().values_list(
-            'identifier', flat=True
-        )
-
-    for groundstation_id in groundstations:
+        groundstations = segment_models.GroundStation.objects.all(
+        ).values_list('identifier', flat=True)
 
-        slots[groundstation_id] = pass_serializer.serialize_pass_slots(
-            pass_models.PassSlots.objects.filter(
-                spacecraft=spacecraft,
-                groundstation__identifier=groundstation_id
-            )
-        )
+    slots = pass_models.PassSlots.objects.read_grouped(
+        'groundstation', groundstations, spacecraft=spacecraft
+    )
 
-    return slots
+    return dict(
+        (groundstation_id, pass_serializer.serialize_pass_slots(
+            gs_slots, response_format=response_format, tracks=tracks
+        ))
+        for groundstation_id, gs_slots in slots.items()
+    )
 
 
 @rpc4django.rpcmethod(
     name='simulation.gs.passes',
-    signature=['String', 'Object'],
+    signature=['String', 'Object', 'String', 'boolean'],
     login_required=satnet_settings.JRPC_LOGIN_REQUIRED
 )
-def get_gs_passes(groundstation_id, spacecraft):
+def get_gs_passes(
+    groundstation_id, spacecraft, response_format=None, tracks=False
+):
     """JRPC method
-    Returns the passes of the given Spacecraft over this GroundStation.
+    Returns the upcoming passes of the given Spacecraft over this
+    GroundStation.
 
     :param groundstation_id: Identifier of the groundstation
     :param spacecraft: List of spacecraft identifiers
+    :param response_format: Optional format of the response: 'objects'
+                            (default), 'columnar' or 'columnar-b64'
+    :param tracks: Optional flag that includes the whole track of each pass
     :return: JSON-like serializable list with the pass slots for each
     spacecraft.
     """
-    slots = {}
     groundstation = segment_models.GroundStation.objects.get(
         identifier=groundstation_id
     )
@@ -82,13 +91,13 @@ def get_gs_passes(groundstation_id, spacecraft):
             'identifier', flat=True
         )
 
-    for spacecraft_id in spacecraft:
-
-        slots[spacecraft_id] = pass_serializer.serialize_pass_slots(
-            pass_models.PassSlots.objects.filter(
-                spacecraft__identifier=spacecraft_id,
-                groundstation=groundstation
-            )
-        )
+    slots = pass_models.PassSlots.objects.read_grouped(
+        'spacecraft', spacecraft, groundstation=groundstation
+    )
 
-    return slots
+    return dict(
+        (spacecraft_id, pass_serializer.serialize_pass_slots(
+            sc_slots, response_format=response_format, tracks=tracks
+        ))
+        for spacecraft_id, sc_slots in slots.items()
+    )
@@ -0,0 +1,107 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import json
+from optparse import make_option
+from django.core.management import base
+
+from services.common import propagators
+from services.simulation import benchmark
+
+
+def _read_sizes(value):
+    """
+    Reads a comma separated list of sizes.
+    :param value: String with the list
+    :return: List with the sizes (int)
+    """
+    try:
+        return [int(v) for v in value.split(',') if v.strip()]
+    except ValueError:
+        raise base.CommandError('Invalid list of sizes: ' + str(value))
+
+
+class Command(base.BaseCommand):
+    """
+    Benchmark of the simulations with synthetic scenarios. For each
+    combination of catalogue and station grid sizes, the calculation of the
+    passes, the calculation of the groundtracks and their storage in the
+    database are timed separately. The results are written as JSON.
+    """
+
+    help = 'Benchmarks the simulation of passes and groundtracks over ' +\
+        'synthetic catalogues (up to ' + str(benchmark.MAX_OBJECTS) +\
+        ' objects) and groundstation grids (up to ' +\
+        str(benchmark.MAX_STATIONS) + ' stations)'
+
+    option_list = base.BaseCommand.option_list + (
+        make_option(
+            '--objects', default='10,100',
+            help='Comma separated sizes of the catalogues'
+        ),
+        make_option(
+            '--stations', default='1,10',
+            help='Comma separated sizes of the groundstation grids'
+        ),
+        make_option(
+            '--days', type='int', default=1,
+            help='Duration of the simulation window (days)'
+        ),
+        make_option(
+            '--backend', choices=sorted(propagators.BACKENDS.keys()),
+            default=None, help='Propagator, by default, the one configured'
+        ),
+        make_option(
+            '--seed', type='int', default=0,
+            help='Seed for the generation of the catalogues'
+        ),
+        make_option(
+            '--no-persistence', action='store_false', dest='persistence',
+            default=True, help='Skips the benchmark of the database'
+        ),
+        make_option(
+            '--output', default=None,
+            help='File for the results, by default, the standard output'
+        ),
+    )
+
+    def handle(self, *args, **options):
+
+        results = []
+
+        for objects in _read_sizes(options['objects']):
+            for stations in _read_sizes(options['stations']):
+
+                try:
+                    results.append(benchmark.run(
+                        objects, stations, days=options['days'],
+                        backend=options['backend'], seed=options['seed'],
+                        persistence=options['persistence']
+                    ))
+                except ValueError as ex:
+                    raise base.CommandError(str(ex))
+
+        output = json.dumps(
+            {'epoch': benchmark.EPOCH.isoformat(), 'results': results},
+            indent=2, sort_keys=True
+        )
+
+        if options['output']:
+            with open(options['output'], 'w') as f:
+                f.write(output + '\n')
+        else:
+            self.stdout.write(output)
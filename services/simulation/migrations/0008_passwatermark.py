@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('configuration', '0017_auto_20160102_1847'),
+        ('simulation', '0007_auto_20160102_1847'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PassWatermark',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('propagated_until', models.DateTimeField(verbose_name='Passes propagated until')),
+                ('groundstation', models.ForeignKey(verbose_name='GroundStation of the propagated pair', to='configuration.GroundStation')),
+                ('spacecraft', models.ForeignKey(verbose_name='Spacecraft of the propagated pair', to='configuration.Spacecraft')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='passwatermark',
+            unique_together=set([('spacecraft', 'groundstation')]),
+        ),
+    ]
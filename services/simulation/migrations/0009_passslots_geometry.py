@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simulation', '0008_passwatermark'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='passslots',
+            name='aos_azimuth',
+            field=models.FloatField(null=True, verbose_name='Azimuth at the start of the pass (degrees)', blank=True),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='passslots',
+            name='culmination',
+            field=models.DateTimeField(null=True, verbose_name='Instant of the maximum elevation', blank=True),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='passslots',
+            name='los_azimuth',
+            field=models.FloatField(null=True, verbose_name='Azimuth at the end of the pass (degrees)', blank=True),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='passslots',
+            name='max_elevation',
+            field=models.FloatField(null=True, verbose_name='Maximum elevation of the pass (degrees)', blank=True),
+            preserve_default=True,
+        ),
+        migrations.AddField(
+            model_name='passslots',
+            name='track',
+            field=models.BinaryField(null=True, verbose_name='Packed track of the pass', blank=True),
+            preserve_default=True,
+        ),
+    ]
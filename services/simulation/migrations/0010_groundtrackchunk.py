@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+import djorm_pgarray.fields
+
+# Duration (seconds) of the period of time covered by each chunk. The
+# bucketing is copied here so that this migration does not depend on the
+# current version of the models.
+CHUNK_SECONDS = 6 * 3600
+
+
+def split(timestamps):
+    """
+    Splits a sorted list of timestamps into the buckets of the chunks.
+    :param timestamps: Sorted list with the timestamps (POSIX, seconds)
+    :return: List with the (start, first, last) tuples of each bucket, being
+                [first, last) the slice of the points within it
+    """
+    buckets = []
+
+    for i, timestamp in enumerate(timestamps):
+
+        start = int(timestamp) - int(timestamp) % CHUNK_SECONDS
+        if buckets and buckets[-1][0] == start:
+            buckets[-1] = (start, buckets[-1][1], i + 1)
+        else:
+            buckets.append((start, i, i + 1))
+
+    return buckets
+
+
+def split_groundtracks(apps, schema_editor):
+    """
+    Moves the points of each groundtrack into its chunks.
+    """
+    GroundTrack = apps.get_model('simulation', 'GroundTrack')
+    GroundTrackChunk = apps.get_model('simulation', 'GroundTrackChunk')
+
+    for gt in GroundTrack.objects.all():
+        GroundTrackChunk.objects.bulk_create([
+            GroundTrackChunk(
+                groundtrack=gt, start=start,
+                timestamp=gt.timestamp[a:b], latitude=gt.latitude[a:b],
+                longitude=gt.longitude[a:b]
+            )
+            for start, a, b in split(gt.timestamp or [])
+        ])
+
+
+def join_groundtracks(apps, schema_editor):
+    """
+    Moves the points of the chunks back into their groundtracks.
+    """
+    GroundTrack = apps.get_model('simulation', 'GroundTrack')
+    GroundTrackChunk = apps.get_model('simulation', 'GroundTrackChunk')
+
+    for gt in GroundTrack.objects.all():
+
+        timestamps, latitudes, longitudes = [], [], []
+
+        for chunk in GroundTrackChunk.objects.filter(
+            groundtrack=gt
+        ).order_by('start'):
+            timestamps += chunk.timestamp
+            latitudes += chunk.latitude
+            longitudes += chunk.longitude
+
+        GroundTrack.objects.filter(pk=gt.pk).update(
+            timestamp=timestamps, latitude=latitudes, longitude=longitudes
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simulation', '0009_passslots_geometry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GroundTrackChunk',
+            fields=[
+                ('id', models.AutoField(verbose_name='ID', serialize=False, auto_created=True, primary_key=True)),
+                ('start', models.BigIntegerField(verbose_name='Start of the period of time of the chunk (POSIX)')),
+                ('latitude', djorm_pgarray.fields.FloatArrayField(dbtype='double precision', verbose_name='Latitude for the points of the chunk')),
+                ('longitude', djorm_pgarray.fields.FloatArrayField(dbtype='double precision', verbose_name='Longitude for the points of the chunk')),
+                ('timestamp', djorm_pgarray.fields.BigIntegerArrayField(dbtype='bigint', verbose_name='UTC time at which the spacecraft is going to pass over')),
+                ('groundtrack', models.ForeignKey(related_name='chunks', verbose_name='Reference to the GroundTrack that owns this chunk', to='simulation.GroundTrack')),
+            ],
+            options={
+            },
+            bases=(models.Model,),
+        ),
+        migrations.AlterUniqueTogether(
+            name='groundtrackchunk',
+            unique_together=set([('groundtrack', 'start')]),
+        ),
+        migrations.RunPython(split_groundtracks, join_groundtracks),
+        migrations.RemoveField(
+            model_name='groundtrack',
+            name='latitude',
+        ),
+        migrations.RemoveField(
+            model_name='groundtrack',
+            name='longitude',
+        ),
+        migrations.RemoveField(
+            model_name='groundtrack',
+            name='timestamp',
+        ),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import models, migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simulation', '0010_groundtrackchunk'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groundtrack',
+            name='outdated',
+            field=models.DateTimeField(null=True, verbose_name='Last change of the TLE not yet applied', blank=True),
+            preserve_default=True,
+        ),
+    ]
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simulation', '0011_groundtrack_outdated'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='passslots',
+            index_together=set([('groundstation', 'spacecraft', 'start'), ('spacecraft', 'groundstation', 'start')]),
+        ),
+    ]
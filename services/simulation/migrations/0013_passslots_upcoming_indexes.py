@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('simulation', '0012_passslots_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='passslots',
+            index_together=set([('groundstation', 'spacecraft', 'start'), ('spacecraft', 'groundstation', 'start'), ('groundstation', 'start'), ('spacecraft', 'start')]),
+        ),
+    ]
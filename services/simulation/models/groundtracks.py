@@ -20,7 +20,8 @@ from datetime import datetime as py_dt
 from datetime import timedelta as py_td
 import logging
 logger = logging.getLogger('simulation')
-from django.db import models
+import numpy
+from django.db import connection, models, transaction
 from djorm_pgarray import fields as pgarray_fields
 
 from services.common import simulation, misc, slots as sn_slots
@@ -34,6 +35,12 @@ class GroundTrackManager(models.Manager):
     process of these objects from the database.
     """
 
+    # Time step in between two consecutive points of the groundtracks.
+    TIMESTEP = py_td(seconds=20)
+    # Period without changes in their TLEs after which the outdated
+    # groundtracks are regenerated.
+    DEBOUNCE = py_td(minutes=2)
+
     def create(self, spacecraft):
         """
         Creates a new GroundTrack object within the database for the spacecraft
@@ -42,19 +49,88 @@ class GroundTrackManager(models.Manager):
         :param spacecraft: Reference to the Spacecraft object.
         :return: Reference to the newly created object.
         """
-        gt = simulation.OrbitalSimulator().calculate_groundtrack(spacecraft.tle)
+        gt = simulation.OrbitalSimulator().calculate_groundtrack(
+            spacecraft.tle, timestep=GroundTrackManager.TIMESTEP
+        )
         ts, lat, lng = GroundTrackManager.groundtrack_to_dbarray(gt)
 
-        return super(GroundTrackManager, self).create(
-            timestamp=ts, latitude=lat, longitude=lng,
+        groundtrack = super(GroundTrackManager, self).create(
             spacecraft=spacecraft, tle=spacecraft.tle
         )
+        GroundTrackChunk.objects.store(groundtrack, ts, lat, lng)
+
+        return groundtrack
+
+    def mark_outdated(self, **filters):
+        """
+        Marks the groundtracks that match the given filters as outdated, so
+        that they are regenerated by <regenerate> once their TLEs stop
+        changing. Marking an already outdated groundtrack again postpones its
+        regeneration.
+        :param filters: Filters for the groundtracks
+        :return: Number of groundtracks marked
+        """
+        return self.filter(**filters).update(outdated=misc.get_now_utc())
+
+    def regenerate(self, debounce=None):
+        """
+        Regenerates, once, each one of the outdated groundtracks whose TLE
+        has not changed during the last "debounce" period, with the current
+        TLE of their spacecraft. A groundtrack marked again while it is being
+        regenerated stays outdated for the next batch.
+        :param debounce: Timedelta object with the period, by default,
+                            GroundTrackManager.DEBOUNCE
+        :return: List with the identifiers of the spacecraft whose
+                    groundtracks were regenerated
+        """
+        if debounce is None:
+            debounce = GroundTrackManager.DEBOUNCE
+
+        simulator = simulation.OrbitalSimulator()
+        regenerated = []
+
+        for gt in self.filter(
+            outdated__lte=misc.get_now_utc() - debounce
+        ).select_related('spacecraft__tle'):
+
+            spacecraft = gt.spacecraft
+
+            try:
+                new_gt = simulator.calculate_groundtrack(
+                    spacecraft.tle, timestep=GroundTrackManager.TIMESTEP
+                )
+            except Exception as ex:
+                logger.exception(
+                    'Error regenerating groundtrack, sc = ' + str(
+                        spacecraft.identifier
+                    ) + ', ex = ' + str(ex)
+                )
+                continue
+
+            ts, lat, lng = GroundTrackManager.groundtrack_to_dbarray(new_gt)
+
+            with transaction.atomic():
+                GroundTrackChunk.objects.replace(gt, ts, lat, lng)
+                self.filter(pk=gt.pk).update(tle=spacecraft.tle)
+                self.filter(pk=gt.pk, outdated=gt.outdated).update(
+                    outdated=None
+                )
+
+            regenerated.append(spacecraft.identifier)
+
+        logger.info(
+            '>>> @groundtracks.regenerate, regenerated = ' + str(regenerated)
+        )
+
+        return regenerated
 
     @staticmethod
     def append_new(groundtrack, new_ts, new_lat, new_lng):
         """
         Appends the new points to the existing groundtrack. It does not save
-        the results in the database.
+        the results in the database; if the groundtrack is saved afterwards,
+        all its chunks are rewritten (see <GroundTrackChunkManager.append> for
+        appending only the new chunks).
 
         :param groundtrack: The groundtrack to be updated.
         :param new_ts: The new timestamps to be appended
@@ -93,99 +169,184 @@ class GroundTrackManager(models.Manager):
     @staticmethod
     def groundtrack_to_dbarray(groundtrack):
         """
-        Static method that transforms a groundtrack array composed by points
-        (lat, lng, timestamp) into three independent oArrays that can be stored
-        directly in a PostGres database.
+        Static method that transforms the (timestamps, latitudes, longitudes)
+        NumPy arrays of a groundtrack, as calculated by the simulator, into
+        the three lists that can be stored directly in a PostGres database.
 
-        :param groundtrack: The groundtrack to be split
-        :return: ([latitude], [longitude], [timestamp]), three independent
-            oArrays with the components of a given point from the groundtrack
+        :param groundtrack: The groundtrack to be converted
+        :return: ([timestamp], [latitude], [longitude]), three independent
+            lists with the components of the points of the groundtrack
         """
-        latitudes = []
-        longitudes = []
-        timestamps = []
-
-        for point in groundtrack:
+        timestamps, latitudes, longitudes = groundtrack
+
+        return numpy.rint(timestamps).astype(numpy.int64).tolist(),\
+            numpy.asarray(latitudes, dtype=numpy.float64).tolist(),\
+            numpy.asarray(longitudes, dtype=numpy.float64).tolist()
+
+    def window(self, spacecraft, start, end, step=None):
+        """Manager method
+        Reads the points of the groundtrack of the spacecraft within the
+        [start, end] interval. Only the chunks that overlap the window are
+        read and the points are selected by PostgreSQL over their arrays, no
+        matter how many days of groundtrack are stored.
+
+        If a step is given, only the first point of every period of "step"
+        seconds (counted from the epoch) is returned. Since the periods are
+        absolute, the same points are selected for overlapping windows.
+
+        :param spacecraft: The Spacecraft object
+        :param start: The datetime object (UTC) with the start of the window
+        :param end: The datetime object (UTC) with the end of the window
+        :param step: Timedelta object with the minimum step in between two
+                        points, by default, all the points are returned
+        :return: ([timestamp], [latitude], [longitude]) tuple with the lists
+                    of the components of the points within the window
+        :raises GroundTrack.DoesNotExist: if the spacecraft has no groundtrack
+        """
+        qn = connection.ops.quote_name
+        columns = GroundTrackChunkManager.columns()
+        columns['groundtrack_table'] = qn(self.model._meta.db_table)
+        columns['groundtrack_pk'] = qn(self.model._meta.pk.column)
+        columns['spacecraft'] = qn(
+            self.model._meta.get_field('spacecraft').column
+        )
 
-            timestamps.append(point['timestamp'].timestamp())
-            latitudes.append(point['latitude'])
-            longitudes.append(point['longitude'])
+        query = \
+            'SELECT array_agg(c.{timestamp}[i] ORDER BY c.{start}, i),' \
+            ' array_agg(c.{latitude}[i] ORDER BY c.{start}, i),' \
+            ' array_agg(c.{longitude}[i] ORDER BY c.{start}, i)' \
+            ' FROM {table} AS c' \
+            ' JOIN {groundtrack_table} AS g' \
+            ' ON c.{groundtrack} = g.{groundtrack_pk},' \
+            ' generate_subscripts(c.{timestamp}, 1) AS i' \
+            ' WHERE g.{spacecraft} = %s' \
+            ' AND c.{start} <= %s AND c.{start} > %s' \
+            ' AND c.{timestamp}[i] >= %s AND c.{timestamp}[i] <= %s'
+        params = [
+            spacecraft.pk,
+            end.timestamp(),
+            start.timestamp() - GroundTrackChunkManager.seconds(),
+            start.timestamp(), end.timestamp()
+        ]
+
+        if step is not None and step > GroundTrackManager.TIMESTEP:
+            query += ' AND c.{timestamp}[i] %% %s < %s'
+            params += [
+                int(step.total_seconds()),
+                int(GroundTrackManager.TIMESTEP.total_seconds())
+            ]
+
+        query = query.format(**columns)
+
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            timestamps, latitudes, longitudes = cursor.fetchone()
+
+        # An empty window is only checked against a missing groundtrack, so
+        # that the usual reads still take a single query.
+        if not timestamps and not self.filter(spacecraft=spacecraft).exists():
+            raise self.model.DoesNotExist(
+                'No groundtrack for spacecraft = ' + str(spacecraft.identifier)
+            )
 
-        return timestamps, latitudes, longitudes
+        return timestamps or [], latitudes or [], longitudes or []
 
-    def delete_older(self, threshold=misc.get_now_utc()):
+    def delete_older(self, threshold=None):
         """Filtering order
         This method implements the filtering for groundtrack timestamps older
-        than the given threshold.
+        than the given threshold. The chunks whose points are all older than
+        the threshold are deleted, whereas the ones that contain the threshold
+        are trimmed by PostgreSQL with a single UPDATE that slices their
+        arrays, so that the points are neither read nor written back from
+        Python.
 
         TODO :: get rid of djorm_pgarray
 
-        :param threshold: Threshold for the filter
+        :param threshold: Threshold for the filter, by default, the current
+                            time
         :return: Number of elements deleted from the database
         """
-        no_deleted = 0
+        if threshold is None:
+            threshold = misc.get_now_utc()
+
+        columns = GroundTrackChunkManager.columns()
+
+        delete = \
+            'DELETE FROM {table}' \
+            ' WHERE {timestamp}[array_upper({timestamp}, 1)] < %s' \
+            ' RETURNING array_length({timestamp}, 1)'
+
+        # Since the timestamps are sorted, the points to be removed are the
+        # first "n" ones of each chunk, being "n" the number of timestamps
+        # older than the threshold.
+        trim = \
+            'WITH o AS (' \
+            ' SELECT c.{pk} AS pk, (' \
+            '  SELECT count(*) FROM unnest(c.{timestamp}) AS t' \
+            '  WHERE t < %s' \
+            ' ) AS n' \
+            ' FROM {table} AS c WHERE c.{timestamp}[1] < %s' \
+            ')' \
+            ' UPDATE {table} AS c SET' \
+            ' {timestamp} = c.{timestamp}[' \
+            '  o.n + 1:array_upper(c.{timestamp}, 1)' \
+            ' ],' \
+            ' {latitude} = c.{latitude}[' \
+            '  o.n + 1:array_upper(c.{latitude}, 1)' \
+            ' ],' \
+            ' {longitude} = c.{longitude}[' \
+            '  o.n + 1:array_upper(c.{longitude}, 1)' \
+            ' ]' \
+            ' FROM o WHERE c.{pk} = o.pk' \
+            ' RETURNING o.n'
 
-        for gt in self.all():
+        no_deleted = 0
 
-            logger.info(
-                '>>> @groundtracks.delete_older, gt.sc = ' +
-                str(gt.spacecraft.identifier)
+        with connection.cursor() as cursor:
+            cursor.execute(delete.format(**columns), [threshold.timestamp()])
+            no_deleted += sum(n for n, in cursor.fetchall())
+            cursor.execute(
+                trim.format(**columns), [threshold.timestamp()] * 2
             )
+            no_deleted += sum(n for n, in cursor.fetchall())
 
-            if not gt.timestamp:
-                logger.info(
-                    '>>> @groundtracks.delete_older, EMPTY GT'
-                )
-                continue
-
-            index = bisect.bisect_left(gt.timestamp, threshold.timestamp())
-
-            ts_l = gt.timestamp
-            la_l = gt.latitude
-            lo_l = gt.longitude
-
-            gt.timestamp = ts_l[index:]
-            gt.latitude = la_l[index:]
-            gt.longitude = lo_l[index:]
-
-            gt.save()
-
-            no_deleted += index
+        logger.info(
+            '>>> @groundtracks.delete_older, no_deleted = ' + str(no_deleted)
+        )
 
         return no_deleted
 
-    def propagate(
-        self,
-        interval=simulation.OrbitalSimulator.get_update_window(),
-        threshold=py_td(days=1)
-    ):
+    def propagate(self, interval=None, threshold=py_td(days=1)):
         """
         This method propagates the points for the GroundTracks along the
         update window. This propagation should be done after the new TLE's
         had been received.
 
-        @param interval: interval for the propagation
+        @param interval: interval for the propagation, by default, the current
+                            update window of the simulator
         @param threshold: timedelta interval during which no GT is propagated
         """
+        if interval is None:
+            interval = simulation.OrbitalSimulator.get_update_window()
+
         logger.info(
             '>>> @groundtracks.propagate.interval = ' + sn_slots.string(
                 interval
             )
         )
 
-        for gt in self.all():
+        for gt in self.all().select_related('tle'):
+
+            last = GroundTrackChunk.objects.last_timestamp(gt)
 
-            if gt.timestamp:
+            if last is not None:
 
                 logger.info(
-                    '>>> @groundtracks.propagate.gt.len (BEFORE) = ' +
-                    str(len(gt.timestamp)) + ', gt.timestamp[-1] = ' +
-                    str(gt.timestamp[-1])
+                    '>>> @groundtracks.propagate, gt.timestamp[-1] = ' +
+                    str(last)
                 )
 
-                dt_ts = misc.localize_date_utc(py_dt.fromtimestamp(
-                    gt.timestamp[-1]
-                ))
+                dt_ts = misc.localize_date_utc(py_dt.fromtimestamp(last))
 
                 diff = py_td(seconds=abs((dt_ts - interval[0]).total_seconds()))
 
@@ -199,33 +360,34 @@ class GroundTrackManager(models.Manager):
             try:
 
                 new_gt = simulation.OrbitalSimulator().calculate_groundtrack(
-                    spacecraft_tle=gt.tle, interval=interval
+                    spacecraft_tle=gt.tle, interval=interval,
+                    timestep=GroundTrackManager.TIMESTEP
                 )
                 ts, lat, lng = GroundTrackManager.groundtrack_to_dbarray(new_gt)
-                gt = GroundTrackManager.append_new(gt, ts, lat, lng)
-                gt.save()
+                appended = GroundTrackChunk.objects.append(gt, ts, lat, lng)
 
-                if gt:
-                    logger.info(
-                        '>>> @groundtracks.propagate.gt.len (AFTER) = ' +
-                        str(len(gt.timestamp))
-                    )
-                else:
-                    logger.info('>>> @groundtracks.propagate.gt is None')
+                logger.info(
+                    '>>> @groundtracks.propagate.gt.appended = ' +
+                    str(appended)
+                )
 
             except Exception as ex:
 
                 logger.exception(
-                    'Error propagating groundtrack = ' + str(len(
-                        gt.timestamp
-                    )) + 'ex = ' + str(ex)
+                    'Error propagating groundtrack, sc = ' + str(
+                        gt.spacecraft_id
+                    ) + ', ex = ' + str(ex)
                 )
 
 
 class GroundTrack(models.Model):
     """
     Class that represents a GroundTrack for a given Spacecraft over the next
-    simulation period.
+    simulation period. The points are stored in chunks (see
+    <GroundTrackChunk>), although they can still be read and written through
+    the "timestamp", "latitude" and "longitude" attributes of this object:
+    they are read from the chunks on first access and, if modified, all the
+    chunks are rewritten when the object is saved.
     """
     class Meta:
         app_label = 'simulation'
@@ -243,16 +405,78 @@ class GroundTrack(models.Model):
         verbose_name='Reference to the TLE object used for this GroundTrack'
     )
 
-    latitude = pgarray_fields.FloatArrayField(
-        verbose_name='Latitude for the points of the GroundTrack'
-    )
-    longitude = pgarray_fields.FloatArrayField(
-        verbose_name='Longitude for the points of the GroundTrack'
-    )
-    timestamp = pgarray_fields.BigIntegerArrayField(
-        verbose_name='UTC time at which the spacecraft is going to pass over'
+    outdated = models.DateTimeField(
+        null=True, blank=True,
+        verbose_name='Last change of the TLE not yet applied'
     )
 
+    # (timestamps, latitudes, longitudes) read from the chunks and flag that
+    # indicates whether they have been modified since.
+    _points = None
+    _modified = False
+
+    def _read_points(self):
+        """
+        Reads all the points of this groundtrack from its chunks, only once.
+        :return: ([timestamp], [latitude], [longitude]) tuple
+        """
+        if self._points is None:
+            if self.pk is None:
+                self._points = ([], [], [])
+            else:
+                self._points = GroundTrackChunk.objects.read(self)
+        return self._points
+
+    def _write_points(self, index, values):
+        """
+        Replaces one of the components of the points of this groundtrack.
+        :param index: Index of the component within the (timestamp, latitude,
+                        longitude) tuple
+        :param values: List with the new values
+        """
+        points = list(self._read_points())
+        points[index] = list(values)
+        self._points = tuple(points)
+        self._modified = True
+
+    @property
+    def timestamp(self):
+        """UTC time at which the spacecraft is going to pass over"""
+        return self._read_points()[0]
+
+    @timestamp.setter
+    def timestamp(self, values):
+        self._write_points(0, values)
+
+    @property
+    def latitude(self):
+        """Latitude for the points of the GroundTrack"""
+        return self._read_points()[1]
+
+    @latitude.setter
+    def latitude(self, values):
+        self._write_points(1, values)
+
+    @property
+    def longitude(self):
+        """Longitude for the points of the GroundTrack"""
+        return self._read_points()[2]
+
+    @longitude.setter
+    def longitude(self, values):
+        self._write_points(2, values)
+
+    def save(self, *args, **kwargs):
+        """
+        Saves this object and, if its points have been modified, rewrites all
+        its chunks.
+        """
+        super(GroundTrack, self).save(*args, **kwargs)
+
+        if self._modified:
+            GroundTrackChunk.objects.replace(self, *self._points)
+            self._modified = False
+
     def __unicode__(self):
         """Unicode
         Returns a unicode representation of the state of this object.
@@ -273,3 +497,201 @@ class GroundTrack(models.Model):
         :return: Human readable string of the object
         """
         return self.__unicode__()
+
+
+class GroundTrackChunkManager(models.Manager):
+    """
+    Manager for the chunks with the points of the GroundTracks. Each chunk
+    holds the points of a groundtrack within a fixed period of time (bucket)
+    of DURATION, so that appending points only inserts the new chunks and
+    removing the old points only deletes the old chunks.
+    """
+
+    # Duration of the period of time covered by each chunk.
+    DURATION = py_td(hours=6)
+
+    @staticmethod
+    def seconds():
+        """
+        :return: Duration of the chunks (seconds, int)
+        """
+        return int(GroundTrackChunkManager.DURATION.total_seconds())
+
+    @staticmethod
+    def columns():
+        """
+        Quoted names of the table and of the columns of the chunks, for the
+        raw queries.
+        :return: Dictionary with the names
+        """
+        qn = connection.ops.quote_name
+        meta = GroundTrackChunk._meta
+        columns = dict(
+            (f, qn(meta.get_field(f).column))
+            for f in (
+                'groundtrack', 'start', 'timestamp', 'latitude', 'longitude'
+            )
+        )
+        columns['table'] = qn(meta.db_table)
+        columns['pk'] = qn(meta.pk.column)
+        return columns
+
+    @staticmethod
+    def split(timestamps):
+        """
+        Splits a sorted list of timestamps into the buckets of the chunks.
+        :param timestamps: Sorted list with the timestamps (POSIX, seconds)
+        :return: List with the (start, first, last) tuples of each bucket,
+                    being [first, last) the slice of the points within it
+        """
+        if not len(timestamps):
+            return []
+
+        buckets = numpy.asarray(timestamps, dtype=numpy.int64)
+        buckets -= buckets % GroundTrackChunkManager.seconds()
+        edges = numpy.concatenate((
+            [0], numpy.flatnonzero(numpy.diff(buckets)) + 1, [len(buckets)]
+        ))
+
+        return [
+            (int(buckets[a]), int(a), int(b))
+            for a, b in zip(edges[:-1], edges[1:])
+        ]
+
+    @staticmethod
+    def chunks(groundtrack, timestamps, latitudes, longitudes):
+        """
+        Creates (without saving them) the chunks for the given points.
+        :param groundtrack: The GroundTrack object that owns the points
+        :param timestamps: Sorted list with the timestamps
+        :param latitudes: List with the latitudes
+        :param longitudes: List with the longitudes
+        :return: List with the GroundTrackChunk objects
+        """
+        return [
+            GroundTrackChunk(
+                groundtrack=groundtrack, start=start,
+                timestamp=timestamps[a:b], latitude=latitudes[a:b],
+                longitude=longitudes[a:b]
+            )
+            for start, a, b in GroundTrackChunkManager.split(timestamps)
+        ]
+
+    def store(self, groundtrack, timestamps, latitudes, longitudes):
+        """
+        Stores the given points for a groundtrack that has no chunks yet.
+        :param groundtrack: The GroundTrack object
+        :param timestamps: Sorted list with the timestamps
+        :param latitudes: List with the latitudes
+        :param longitudes: List with the longitudes
+        """
+        self.bulk_create(GroundTrackChunkManager.chunks(
+            groundtrack, timestamps, latitudes, longitudes
+        ))
+
+    def replace(self, groundtrack, timestamps, latitudes, longitudes):
+        """
+        Replaces all the chunks of a groundtrack with the given points.
+        :param groundtrack: The GroundTrack object
+        :param timestamps: Sorted list with the timestamps
+        :param latitudes: List with the latitudes
+        :param longitudes: List with the longitudes
+        """
+        self.filter(groundtrack=groundtrack).delete()
+        self.store(groundtrack, timestamps, latitudes, longitudes)
+
+    def read(self, groundtrack):
+        """
+        Reads all the points of a groundtrack.
+        :param groundtrack: The GroundTrack object
+        :return: ([timestamp], [latitude], [longitude]) tuple
+        """
+        timestamps, latitudes, longitudes = [], [], []
+
+        for c in self.filter(groundtrack=groundtrack).order_by('start'):
+            timestamps += c.timestamp
+            latitudes += c.latitude
+            longitudes += c.longitude
+
+        return timestamps, latitudes, longitudes
+
+    def last_timestamp(self, groundtrack):
+        """
+        Timestamp of the last point of a groundtrack, only the last chunk is
+        read from the database.
+        :param groundtrack: The GroundTrack object
+        :return: The timestamp, None if the groundtrack has no points
+        """
+        last = self.filter(groundtrack=groundtrack).order_by('-start').first()
+        return last.timestamp[-1] if last and last.timestamp else None
+
+    def append(self, groundtrack, timestamps, latitudes, longitudes):
+        """
+        Appends the new points to a groundtrack, discarding the ones that are
+        not later than its last point. Only the last chunk is updated, in case
+        the first new points fall within its bucket, and the rest of them are
+        inserted as new chunks.
+        :param groundtrack: The GroundTrack object
+        :param timestamps: Sorted list with the new timestamps
+        :param latitudes: List with the new latitudes
+        :param longitudes: List with the new longitudes
+        :return: Number of points appended
+        """
+        last = self.filter(groundtrack=groundtrack).order_by('-start').first()
+
+        if last and last.timestamp:
+
+            position = bisect.bisect_right(timestamps, last.timestamp[-1])
+            timestamps = timestamps[position:]
+            latitudes = latitudes[position:]
+            longitudes = longitudes[position:]
+
+            end = last.start + GroundTrackChunkManager.seconds()
+            position = bisect.bisect_left(timestamps, end)
+
+            if position:
+                last.timestamp = last.timestamp + timestamps[:position]
+                last.latitude = last.latitude + latitudes[:position]
+                last.longitude = last.longitude + longitudes[:position]
+                last.save()
+
+            self.store(
+                groundtrack, timestamps[position:], latitudes[position:],
+                longitudes[position:]
+            )
+
+        else:
+            self.store(groundtrack, timestamps, latitudes, longitudes)
+
+        return len(timestamps)
+
+
+class GroundTrackChunk(models.Model):
+    """
+    Class that represents the points of a GroundTrack within the period of
+    time that starts at "start" and lasts GroundTrackChunkManager.DURATION.
+    """
+    class Meta:
+        app_label = 'simulation'
+        unique_together = ('groundtrack', 'start')
+
+    objects = GroundTrackChunkManager()
+
+    groundtrack = models.ForeignKey(
+        GroundTrack,
+        related_name='chunks',
+        verbose_name='Reference to the GroundTrack that owns this chunk'
+    )
+    start = models.BigIntegerField(
+        verbose_name='Start of the period of time of the chunk (POSIX)'
+    )
+
+    latitude = pgarray_fields.FloatArrayField(
+        verbose_name='Latitude for the points of the chunk'
+    )
+    longitude = pgarray_fields.FloatArrayField(
+        verbose_name='Longitude for the points of the chunk'
+    )
+    timestamp = pgarray_fields.BigIntegerArrayField(
+        verbose_name='UTC time at which the spacecraft is going to pass over'
+    )
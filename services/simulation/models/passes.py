@@ -1,11 +1,16 @@
 
+import bisect
+from concurrent import futures
 from datetime import timedelta as py_timedelta
-from django.db import models as django_models
+from django import dispatch as django_dispatch
+from django.db import models as django_models, transaction
 import logging
+import numpy
 
 from services.common import simulation, misc as sn_misc, slots as sn_slots
 from services.configuration.models import segments as segment_models
 from services.simulation import push as simulation_push
+from website import settings as sn_settings
 
 """
    Copyright 2013, 2014 Ricardo Tubio-Pardavila
@@ -27,8 +32,38 @@ __author__ = 'rtubiopa@calpoly.edu'
 
 logger = logging.getLogger('simulation')
 
+# Layout of the packed tracks of the passes: little-endian float32 values,
+# four columns per point.
+_TRACK_DTYPE = numpy.dtype('<f4')
+_TRACK_COLUMNS = 4
 
-class PassManager(django_models.Manager):
+
+def pack_track(track):
+    """
+    Packs the track of a pass as the raw bytes of its float32 values.
+    :param track: NumPy array with shape (n, 4)
+    :return: Bytes object
+    """
+    return numpy.ascontiguousarray(track, dtype=_TRACK_DTYPE).tobytes()
+
+
+def unpack_track(data):
+    """
+    Unpacks the track of a pass.
+    :param data: Bytes (or buffer) object, as created by <pack_track>
+    :return: NumPy array with shape (n, 4)
+    """
+    return numpy.frombuffer(
+        bytes(data), dtype=_TRACK_DTYPE
+    ).reshape(-1, _TRACK_COLUMNS)
+
+
+# Signal sent after a batch of PassSlots has been created in bulk, since no
+# post_save signals are sent for each of those objects.
+passes_bulk_created = django_dispatch.Signal(providing_args=['pass_slots'])
+
+
+class PassManager(sn_slots.SlotManager):
     """Database manager
     Manager that contains the helper methods to handle the Pass objects within
     the database.
@@ -44,6 +79,12 @@ class PassManager(django_models.Manager):
         self._simulator = simulation.OrbitalSimulator()
         super(PassManager, self).__init__()
 
+    # Tolerance for considering two passes of the same pair as duplicated.
+    _DUPLICATED_TOLERANCE = py_timedelta(seconds=30)
+    # Tolerance for considering that a pass has been cut off by the end of
+    # the simulation window.
+    _CUTOFF_TOLERANCE = py_timedelta(seconds=1)
+
     def create(self, spacecraft, groundstation, start, end, **kwargs):
         """Overriden method
         Overriden method that creates the provided pass slot in case a similar
@@ -56,12 +97,12 @@ class PassManager(django_models.Manager):
         :return: A reference to the just created object
         """
         s_range = (
-            start - py_timedelta(seconds=30),
-            start + py_timedelta(seconds=30)
+            start - PassManager._DUPLICATED_TOLERANCE,
+            start + PassManager._DUPLICATED_TOLERANCE
         )
         e_range = (
-            end - py_timedelta(seconds=30),
-            end + py_timedelta(seconds=30)
+            end - PassManager._DUPLICATED_TOLERANCE,
+            end + PassManager._DUPLICATED_TOLERANCE
         )
 
         if self.filter(
@@ -83,6 +124,135 @@ class PassManager(django_models.Manager):
             start=start, end=end, **kwargs
         )
 
+    @staticmethod
+    def _is_duplicated_slot(slots, start, end):
+        """Private method
+        Checks whether the given pass matches, within the tolerance, any of the
+        slots of the sorted list.
+        :param slots: List with (start, end) tuples, sorted by start
+        :param start: The start datetime object of the pass
+        :param end: The end datetime object of the pass
+        :return: 'True' in case the pass is duplicated
+        """
+        tolerance = PassManager._DUPLICATED_TOLERANCE
+        index = bisect.bisect_left(slots, (start - tolerance,))
+
+        while index < len(slots) and slots[index][0] <= start + tolerance:
+
+            if abs(slots[index][1] - end) <= tolerance:
+                return True
+
+            index += 1
+
+        return False
+
+    @staticmethod
+    def _geometry_fields(slot):
+        """Private method
+        Returns the values for the geometry fields of the PassSlots object
+        for the given slot.
+        :param slot: (start, end) or (start, end, geometry) tuple, see
+                        <services.common.simulation.PassGeometry>
+        :return: Dictionary with the values of the fields
+        """
+        if len(slot) < 3 or slot[2] is None:
+            return {}
+
+        geometry = slot[2]
+        return {
+            'max_elevation': geometry.max_elevation,
+            'culmination': geometry.culmination,
+            'aos_azimuth': geometry.aos_azimuth,
+            'los_azimuth': geometry.los_azimuth,
+            'track': pack_track(geometry.track)
+        }
+
+    def bulk_create_passes(self, pairs_to_slots):
+        """Manager method
+        Creates in bulk the given pass slots, discarding those that already
+        exist, with the same tolerance as the one used by "create". All the
+        existing passes for the affected pairs are read with a single query,
+        being the duplicates detected in memory. Since no post_save signals
+        are sent for the new passes, the <passes_bulk_created> signal is sent
+        once for the whole batch.
+        :param pairs_to_slots: Dictionary whose keys are (spacecraft,
+                                groundstation) tuples and whose values are
+                                lists with (start, end) or (start, end,
+                                geometry) tuples
+        :return: List with the just created PassSlots objects
+        """
+        pairs_to_slots = dict(
+            (pair, slots) for pair, slots in pairs_to_slots.items() if slots
+        )
+        if not pairs_to_slots:
+            return []
+
+        starts = [s[0] for slots in pairs_to_slots.values() for s in slots]
+        index = {}
+
+        for sc_id, gs_id, start, end in self.filter(
+            spacecraft__in=set(sc for sc, _ in pairs_to_slots),
+            groundstation__in=set(gs for _, gs in pairs_to_slots),
+            start__range=(
+                min(starts) - PassManager._DUPLICATED_TOLERANCE,
+                max(starts) + PassManager._DUPLICATED_TOLERANCE
+            )
+        ).values_list('spacecraft_id', 'groundstation_id', 'start', 'end'):
+
+            index.setdefault((sc_id, gs_id), []).append((start, end))
+
+        for slots in index.values():
+            slots.sort()
+
+        new_passes = []
+
+        for (sc, gs), slots in pairs_to_slots.items():
+
+            existing = index.setdefault((sc.pk, gs.pk), [])
+
+            for slot in slots:
+
+                start, end = slot[0], slot[1]
+
+                if PassManager._is_duplicated_slot(existing, start, end):
+                    logger.warn(
+                        '@PassManager.bulk_create_passes(), CONFLICTING SLOT:'
+                        '\n\t * slot already exists GS = ' + str(
+                            gs.identifier
+                        ) + ', start = <' + start.isoformat() + '>, end = <' +
+                        end.isoformat() + '>'
+                    )
+                    continue
+
+                bisect.insort(existing, (start, end))
+                new_passes.append(PassSlots(
+                    spacecraft=sc, groundstation=gs, start=start, end=end,
+                    **PassManager._geometry_fields(slot)
+                ))
+
+        if not new_passes:
+            return []
+
+        self.bulk_create(new_passes)
+
+        # bulk_create does not set the primary keys of the new objects, they
+        # have to be read back from the database.
+        keys = set(
+            (p.spacecraft.pk, p.groundstation.pk, p.start, p.end)
+            for p in new_passes
+        )
+        created = [
+            p for p in self.filter(
+                spacecraft__in=set(sc for sc, _ in pairs_to_slots),
+                groundstation__in=set(gs for _, gs in pairs_to_slots),
+                start__in=set(p.start for p in new_passes)
+            ).select_related('spacecraft', 'groundstation')
+            if (p.spacecraft_id, p.groundstation_id, p.start, p.end) in keys
+        ]
+
+        passes_bulk_created.send(sender=PassSlots, pass_slots=created)
+        return created
+
     def set_spacecraft(self, spacecraft):
         """
         Sets the Spacecraft for which the embeded simulator will calculate
@@ -92,6 +262,53 @@ class PassManager(django_models.Manager):
         """
         self._simulator.set_spacecraft(spacecraft.tle)
 
+    def _filter_passes(self, slots, start, end):
+        """Private method
+        Filters the passes calculated for a given pair within the [start, end]
+        window. The passes that start before "start" had already been
+        propagated, whereas the pass cut off by the end of the window is kept
+        for the next propagation, so that it is stored only once and complete.
+        :param slots: List with the (start, end, geometry) tuples of the
+                        passes
+        :param start: Start of the window that was pending for this pair
+        :param end: End of the simulation window
+        :return: (slots, watermark) tuple with the passes to be stored and the
+                    instant up to which the passes of the pair are complete
+        """
+        slots = [s for s in slots if s[0] >= start]
+
+        if not slots or self._simulator.get_debug():
+            return slots, end
+        if slots[-1][1] < end - PassManager._CUTOFF_TOLERANCE:
+            return slots, end
+
+        return slots[:-1], max(
+            start, slots[-1][0] - PassManager._DUPLICATED_TOLERANCE
+        )
+
+    def _store_passes(self, results):
+        """Private method
+        Stores in the database the passes calculated for a set of pairs,
+        advancing at the same time their watermarks.
+        :param results: List with (spacecraft, groundstation, slots,
+                        watermark) tuples
+        :return: List with all the stored pass slots
+        """
+        all_slots = []
+        pairs_to_slots = {}
+        watermarks = {}
+
+        for spacecraft, groundstation, slots, watermark in results:
+            pairs_to_slots[(spacecraft, groundstation)] = slots
+            watermarks[(spacecraft, groundstation)] = watermark
+            all_slots += slots
+
+        with transaction.atomic():
+            self.bulk_create_passes(pairs_to_slots)
+            PassWatermark.objects.advance(watermarks)
+
+        return all_slots
+
     def _calculate_passes(self, spacecraft, groundstation, window=None):
         """Private method
         Calculates all the pass slots for the given spacecraft, groundstation
@@ -101,23 +318,46 @@ class PassManager(django_models.Manager):
         :param window: Start, end tuple that define the simulation window
         :return: Array with the pass slots
         """
+        return self._calculate_passes_multi(
+            spacecraft, [groundstation], window=window
+        )
+
+    def _calculate_passes_multi(
+        self, spacecraft, groundstations, window=None, starts=None
+    ):
+        """Private method
+        Calculates all the pass slots for the given spacecraft over all the
+        given groundstations during the simulation window. The spacecraft is
+        propagated only once for all the groundstations, from the earliest of
+        the starts of the groundstations.
+        :param spacecraft: The spacecraft object
+        :param groundstations: List with the groundstation objects
+        :param window: Start, end tuple that define the simulation window
+        :param starts: List with the start of the pending window for each
+                        groundstation, by default, the start of the window
+        :return: Array with the pass slots
+        """
         all_slots = []
 
         if not window:
             window = simulation.OrbitalSimulator.get_simulation_window()
+        if not starts:
+            starts = [window[0]] * len(groundstations)
 
         try:
 
-            slots = self._simulator.calculate_pass_slot(window[0], window[1])
-
-            for s in slots:
+            gs_slots = self._simulator.calculate_pass_slots(
+                groundstations, min(starts), window[1], geometry=True
+            )
+            results = []
 
-                self.create(
-                    spacecraft=spacecraft, groundstation=groundstation,
-                    start=s[0], end=s[1]
-                )
+            for groundstation, start, slots in zip(
+                groundstations, starts, gs_slots
+            ):
+                slots, watermark = self._filter_passes(slots, start, window[1])
+                results.append((spacecraft, groundstation, slots, watermark))
 
-            all_slots += slots
+            all_slots = self._store_passes(results)
 
         except Exception as ex:
 
@@ -137,13 +377,10 @@ class PassManager(django_models.Manager):
         registered GroundStations.
         :param spacecraft: Spacecraft object
         """
-        all_slots = []
         self.set_spacecraft(spacecraft)
-
-        for groundstation in segment_models.GroundStation.objects.all():
-
-            self._simulator.set_groundstation(groundstation)
-            all_slots += self._calculate_passes(spacecraft, groundstation)
+        all_slots = self._calculate_passes_multi(
+            spacecraft, list(segment_models.GroundStation.objects.all())
+        )
 
         simulation_push.SimulationPush.trigger_passes_updated_event()
         return all_slots
@@ -165,83 +402,184 @@ class PassManager(django_models.Manager):
         simulation_push.SimulationPush.trigger_passes_updated_event()
         return all_slots
 
-    def is_duplicated(self, interval, groundstation, spacecraft):
+    def get_pending(self, interval):
         """Manager method
-        Checks whether the on-going propagation of the passes is a duplicated
-        one in the sense that the system has reloaded within the propagation.
-        This situation has to be avoided since the generated slot passes will
-        be duplicated. This check is done in a pair sc/gs basis so that in case
-        the slots where not propagated for this given pair, they do have to get
-        propagated now.
+        Returns, for each spacecraft, the groundstations whose passes have not
+        been propagated yet up to the end of the given interval, together with
+        the instant from which each one of them has to be propagated. The
+        propagation of a pair continues from its watermark (or from now, if
+        the watermark is already in the past), so that restarts and reloads
+        neither leave gaps nor repeat the propagation. Pairs without a
+        watermark are propagated from the start of the interval.
 
         :param interval: Interval for the propagation of the slots
-        :param groundstation: Groundstation object
-        :param spacecraft: Spacecraft object
-        :return: 'True' in case this interval has already been propagated.
+        :return: List with (spacecraft, [groundstations], [starts]) tuples
         """
-        last_pass = None
+        pending = []
+        now = sn_misc.get_now_utc()
+        watermarks = PassWatermark.objects.get_watermarks()
+        groundstations = list(segment_models.GroundStation.objects.all())
 
-        try:
-            last_pass = self.filter(
-                groundstation=groundstation, spacecraft=spacecraft
-            ).latest('start')
-        except PassSlots.DoesNotExist:
-            logger.info('>>> No slots found, skipping')
-            return
+        for sc in segment_models.Spacecraft.objects.all():
 
-        if not last_pass:
-            return False
+            sc_pending = []
+            sc_starts = []
 
-        if last_pass.end > interval[0]:
-            return True
-        else:
-            return False
+            for gs in groundstations:
 
-    def propagate(
-        self, interval=simulation.OrbitalSimulator.get_update_window()
-    ):
+                start = watermarks.get((sc.pk, gs.pk))
+                start = interval[0] if start is None else max(start, now)
+
+                if start < interval[1]:
+                    sc_pending.append(gs)
+                    sc_starts.append(start)
+
+            if not sc_pending:
+                logger.info(
+                    '>>> @passes.propagate, sc = ' + str(sc.identifier) +
+                    ', ALREADY PROPAGATED'
+                )
+                continue
+
+            pending.append((sc, sc_pending, sc_starts))
+
+        return pending
+
+    def propagate(self, interval=None, workers=None):
         """Manager method
         Propagates the pass slots for all the registered groundstation and
-        spacecraft pairs.
+        spacecraft pairs, only for the part of the interval that has not been
+        propagated yet for each pair.
 
-        @param interval: interval for the propagation
+        @param interval: interval for the propagation, by default, the current
+                            update window of the simulator
+        @param workers: number of worker processes for the propagation, by
+                        default, PASS_PROPAGATION_WORKERS from the settings
         """
         all_slots = []
 
+        if interval is None:
+            interval = simulation.OrbitalSimulator.get_update_window()
+        if workers is None:
+            workers = sn_settings.PASS_PROPAGATION_WORKERS
+
         logger.info(
             '>>> @passes.propagate.window = ' + sn_slots.string(interval)
         )
 
-        for gs in segment_models.GroundStation.objects.all():
-            logger.info('>>> @passes.propagate, gs = ' + str(gs.identifier))
-            self._simulator.set_groundstation(gs)
+        pending = self.get_pending(interval)
 
-            for sc in segment_models.Spacecraft.objects.all():
-                logger.info(
-                    '>>> @passes.propagate, sc = ' + str(sc.identifier)
+        if workers > 1 and not self._simulator.get_debug():
+            all_slots = self._propagate_parallel(pending, interval, workers)
+        else:
+            for sc, groundstations, starts in pending:
+                self.set_spacecraft(sc)
+                all_slots += self._calculate_passes_multi(
+                    sc, groundstations, window=interval, starts=starts
                 )
-                if not self.is_duplicated(interval, gs, sc):
-                    self.set_spacecraft(sc)
-                    all_slots += self._calculate_passes(sc, gs, interval)
-                    logger.info(
-                        sn_misc.list_2_string(
-                            all_slots, name='@passes.propagate.all_slots'
-                        )
-                    )
-                else:
-                    logger.info('>>> @passes.propagate, DUPLICATED')
+
+        logger.info(
+            sn_misc.list_2_string(
+                all_slots, name='@passes.propagate.all_slots'
+            )
+        )
 
         if all_slots:
             simulation_push.SimulationPush.trigger_passes_updated_event()
 
         return all_slots
 
+    def _propagate_parallel(self, pending, interval, workers):
+        """Private method
+        Propagates the pass slots for the given spacecraft in a pool of worker
+        processes. The workers only receive the lines of the TLE of each
+        spacecraft together with the coordinates of the groundstations, all
+        the passes being stored afterwards in the database by this process.
+        The results are processed in the same order as the given spacecraft.
+        The pairs of the spacecraft whose propagation failed are neither
+        stored nor have their watermarks advanced, so that they are
+        propagated again by the next run.
+
+        @param pending: list with (spacecraft, [groundstations], [starts])
+                        tuples, as returned by "get_pending"
+        @param interval: interval for the propagation
+        @param workers: number of worker processes
+        @return: list with all the pass slots
+        """
+        tles = [
+            simulation.OrbitalSimulator.dbtle_2_ephem_str(sc.tle)
+            for sc, _, _ in pending
+        ]
+        stations = [
+            [
+                simulation.GroundStationCoordinates(
+                    latitude=gs.latitude, longitude=gs.longitude,
+                    contact_elevation=gs.contact_elevation,
+                    altitude=gs.altitude
+                )
+                for gs in groundstations
+            ]
+            for _, groundstations, _ in pending
+        ]
+
+        with futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            sc_results = list(executor.map(
+                simulation.calculate_pass_slots_job, tles, stations,
+                [min(starts) for _, _, starts in pending],
+                [interval[1]] * len(pending)
+            ))
+
+        results = []
+
+        for (sc, groundstations, starts), gs_slots in zip(
+            pending, sc_results
+        ):
+            if gs_slots is None:
+                logger.warn(
+                    '>>> @passes.propagate, sc = ' + str(sc.identifier) +
+                    ', FAILED, to be retried'
+                )
+                continue
+
+            for gs, start, slots in zip(groundstations, starts, gs_slots):
+                slots, watermark = self._filter_passes(
+                    slots, start, interval[1]
+                )
+                results.append((sc, gs, slots, watermark))
+
+        return self._store_passes(results)
+
+    def read_grouped(self, by, identifiers, **filters):
+        """Manager method
+        Reads, with a single query, the upcoming pass slots (those that have
+        not finished yet) that match the given filters and belong to the given
+        spacecraft or groundstations, grouped by the identifier of the latter
+        and ordered by their start.
+        :param by: Either 'spacecraft' or 'groundstation'
+        :param identifiers: List with the identifiers of the objects used for
+                            grouping the slots
+        :param filters: Additional filters for the slots
+        :return: Dictionary with the list of pass slots for each identifier,
+                    empty for the identifiers without slots
+        """
+        grouped = dict((i, []) for i in identifiers)
+        filters[by + '__identifier__in'] = list(grouped.keys())
+        filters['end__gte'] = sn_misc.get_now_utc()
+
+        for s in self.filter(**filters).select_related(
+            'spacecraft', 'groundstation'
+        ).order_by('start'):
+            grouped[getattr(s, by).identifier].append(s)
+
+        return grouped
+
     def remove_pass_slots_sc(self, spacecraft):
         """Manager method
         Removes all the pass slots related to this spacecraft.
         :param spacecraft: Spacecraft object
         """
         self.filter(spacecraft=spacecraft).delete()
+        PassWatermark.objects.filter(spacecraft=spacecraft).delete()
         simulation_push.SimulationPush.trigger_passes_updated_event()
 
     def remove_pass_slots_gs(self, groundstation):
@@ -250,6 +588,7 @@ class PassManager(django_models.Manager):
         :param groundstation: Groundstation object
         """
         self.filter(groundstation=groundstation).delete()
+        PassWatermark.objects.filter(groundstation=groundstation).delete()
         simulation_push.SimulationPush.trigger_passes_updated_event()
 
 
@@ -260,6 +599,15 @@ class PassSlots(django_models.Model):
     """
     class Meta:
         app_label = 'simulation'
+        # Lookups of the passes of a pair (or of one of the segments for a
+        # list of the other ones) within a time range, and the upcoming
+        # passes of a segment ordered by their start (see read_grouped).
+        index_together = [
+            ('groundstation', 'spacecraft', 'start'),
+            ('spacecraft', 'groundstation', 'start'),
+            ('groundstation', 'start'),
+            ('spacecraft', 'start')
+        ]
 
     objects = PassManager()
 
@@ -275,8 +623,122 @@ class PassSlots(django_models.Model):
     start = django_models.DateTimeField('Slot start')
     end = django_models.DateTimeField('Slot end')
 
+    max_elevation = django_models.FloatField(
+        'Maximum elevation of the pass (degrees)', null=True, blank=True
+    )
+    culmination = django_models.DateTimeField(
+        'Instant of the maximum elevation', null=True, blank=True
+    )
+    aos_azimuth = django_models.FloatField(
+        'Azimuth at the start of the pass (degrees)', null=True, blank=True
+    )
+    los_azimuth = django_models.FloatField(
+        'Azimuth at the end of the pass (degrees)', null=True, blank=True
+    )
+    track = django_models.BinaryField(
+        'Packed track of the pass', null=True, blank=True
+    )
+
+    def get_track(self):
+        """
+        Unpacks the track of this pass.
+        :return: NumPy array whose rows are (seconds since the start of the
+                    pass, azimuth, elevation, range-rate), None if the track
+                    was not calculated
+        """
+        if self.track is None:
+            return None
+        return unpack_track(self.track)
+
     def __str__(self):
         """Unicode string
         :return: Unicode string
         """
         return u'>>> pass: ' + str(self.start) + u', ' + str(self.end)
+
+
+class PassWatermarkManager(django_models.Manager):
+    """Database manager
+    Manager for the watermarks of the propagation of the passes.
+    """
+
+    def get_watermarks(self):
+        """Manager method
+        Reads all the watermarks with a single query.
+        :return: Dictionary whose keys are (spacecraft.pk, groundstation.pk)
+                    tuples and whose values are the watermarks
+        """
+        return dict(
+            ((sc_id, gs_id), until)
+            for sc_id, gs_id, until in self.values_list(
+                'spacecraft_id', 'groundstation_id', 'propagated_until'
+            )
+        )
+
+    def advance(self, watermarks):
+        """Manager method
+        Advances the watermarks of the given pairs, creating those that do not
+        exist yet. A watermark is never moved backwards.
+        :param watermarks: Dictionary whose keys are (spacecraft,
+                            groundstation) tuples and whose values are the new
+                            watermarks
+        """
+        if not watermarks:
+            return
+
+        existing = dict(
+            ((w.spacecraft_id, w.groundstation_id), w)
+            for w in self.filter(
+                spacecraft__in=set(sc for sc, _ in watermarks),
+                groundstation__in=set(gs for _, gs in watermarks)
+            )
+        )
+        new_watermarks = []
+        updates = {}
+
+        for (sc, gs), until in watermarks.items():
+
+            w = existing.get((sc.pk, gs.pk))
+
+            if w is None:
+                new_watermarks.append(PassWatermark(
+                    spacecraft=sc, groundstation=gs, propagated_until=until
+                ))
+            elif w.propagated_until < until:
+                updates.setdefault(until, []).append(w.pk)
+
+        # Most of the pairs share the same watermark (the end of the window),
+        # so a single UPDATE is issued for all the pairs with the same value.
+        for until, pks in updates.items():
+            self.filter(pk__in=pks).update(propagated_until=until)
+
+        self.bulk_create(new_watermarks)
+
+
+class PassWatermark(django_models.Model):
+    """Database model
+    Model with the instant up to which the passes of a spacecraft over a
+    groundstation have already been propagated.
+    """
+    class Meta:
+        app_label = 'simulation'
+        unique_together = ('spacecraft', 'groundstation')
+
+    objects = PassWatermarkManager()
+
+    spacecraft = django_models.ForeignKey(
+        segment_models.Spacecraft,
+        verbose_name='Spacecraft of the propagated pair'
+    )
+    groundstation = django_models.ForeignKey(
+        segment_models.GroundStation,
+        verbose_name='GroundStation of the propagated pair'
+    )
+
+    propagated_until = django_models.DateTimeField('Passes propagated until')
+
+    def __str__(self):
+        """Unicode string
+        :return: Unicode string
+        """
+        return u'>>> watermark: ' + str(self.propagated_until)
@@ -18,6 +18,7 @@ __author__ = 'rtubiopa@calpoly.edu'
 import logging
 from periodically import decorators
 from services.common import misc
+from services.simulation import push as simulation_push
 from services.simulation.models import groundtracks as gt_models
 from services.simulation.models import passes as pass_models
 
@@ -41,19 +42,41 @@ def propagate_groundtracks():
     logger.info('>>> DONE propagating groundtracks')
 
 
+@decorators.every(minutes=1)
+def regenerate_groundtracks():
+    """Periodic groundtracks regeneration
+    Regenerates, in a single batch, the groundtracks whose TLEs have changed
+    and pushes the usual update event for each one of them.
+    """
+    try:
+        regenerated = gt_models.GroundTrack.objects.regenerate()
+    except Exception as ex:
+        logger.exception(
+            '>>> Exception regenerating groundtracks, ex = ' + str(ex), ex
+        )
+        return
+
+    for spacecraft_id in regenerated:
+        simulation_push.SimulationPush.trigger_gt_updated_event(spacecraft_id)
+
+
 @decorators.daily()
-def clean_groundtracks(threshold=misc.get_now_utc()):
+def clean_groundtracks(threshold=None):
     """Periodic groundtracks cleanup
-    @param threshold: datetime threshold to clean the old groundtracks
+    @param threshold: datetime threshold to clean the old groundtracks, by
+                        default, the current time
     """
+    if threshold is None:
+        threshold = misc.get_now_utc()
+
     logger.info('>>> Cleaning groundtracks')
 
     try:
 
-        no_deleted = gt_models.GroundTrack.objects.delete_older(
-            threshold
-        ).delete()
-        logger.debug('>>> tasks@clean_passes.filtered = ' + str(no_deleted))
+        no_deleted = gt_models.GroundTrack.objects.delete_older(threshold)
+        logger.debug(
+            '>>> tasks@clean_groundtracks.filtered = ' + str(no_deleted)
+        )
 
     except Exception as ex:
 
@@ -81,11 +104,15 @@ def propagate_passes():
 
 
 @decorators.daily()
-def clean_passes(threshold=misc.get_now_utc()):
+def clean_passes(threshold=None):
     """Periodic groundtracks cleanup
     Cleans the outdated passes from the database.
-    @param threshold: datetime threshold to clean the old passes
+    @param threshold: datetime threshold to clean the old passes, by default,
+                        the current time
     """
+    if threshold is None:
+        threshold = misc.get_now_utc()
+
     logger.info('>>> Cleaning passes, threshold = ' + str(threshold))
 
     try:
@@ -23,7 +23,6 @@ from django.db.models import signals as django_signals
 
 from services.configuration.models import segments as segment_models
 from services.configuration.models import tle as tle_models
-from services.simulation import push as simulation_push
 from services.simulation import periodictasks as simulation_tasks
 from services.simulation.models import groundtracks as groundtrack_models
 from website import signals as sn_signals
@@ -94,13 +93,7 @@ def spacecraft_updated(sender, instance, created, raw, **kwargs):
         return
 
     if instance.tle != gt.tle:
-
-        gt.delete()
-        groundtrack_models.GroundTrack.objects.create(instance)
-
-        simulation_push.SimulationPush.trigger_gt_updated_event(
-            instance.identifier
-        )
+        groundtrack_models.GroundTrack.objects.mark_outdated(pk=gt.pk)
 
 
 # noinspection PyUnusedLocal
@@ -137,7 +130,9 @@ def tle_updated(sender, instance, created, raw, **kwargs):
     """Signal handler (post_save)
     Handles the update of the groundtracks and other simulation resources that
     may change for all the registered spacecraft associated with the TLE that
-    has just changed.
+    has just changed. The groundtracks are only marked as outdated, so that
+    bursts of updates of the TLEs are coalesced and each groundtrack is
+    regenerated once by the <regenerate_groundtracks> periodic task.
     :param sender: Reference to the sender
     :param instance: Reference to the TLE that jas just been updated
     :param created: Flag that indicates that this object has just been created
@@ -147,12 +142,6 @@ def tle_updated(sender, instance, created, raw, **kwargs):
     if created or raw:
         return
 
-    for gt in groundtrack_models.GroundTrack.objects.filter(tle=instance):
-
-        spacecraft = gt.spacecraft
-        gt.delete()
-        groundtrack_models.GroundTrack.objects.create(spacecraft)
-
-        simulation_push.SimulationPush.trigger_gt_updated_event(
-            spacecraft.identifier
-        )
+    groundtrack_models.GroundTrack.objects.mark_outdated(
+        spacecraft__tle=instance
+    )
@@ -68,6 +68,52 @@ class JRPCSimulationTest(test.TestCase):
             misc.print_list(gt)
             print('gt.length = ' + str(len(gt)))
 
+        simulation_models.GroundTrack.objects.filter(
+            spacecraft__identifier=self.__sc_1_id
+        ).delete()
+        self.assertRaises(
+            simulation_models.GroundTrack.DoesNotExist,
+            simulation_jrpc.get_groundtrack, self.__sc_1_id
+        )
+
+    def test_get_groundtrack_decimation(self):
+        """JRPC test: services.simulation.groundtrack.get (decimation)
+        Tests the decimation of the GroundTracks.
+        """
+        serializer = simulation_serializer.SimulationSerializer
+        gt = simulation_jrpc.get_groundtrack(self.__sc_1_id)
+
+        for mode, value in [
+            (serializer.DECIMATION_STEP, 120),
+            (serializer.DECIMATION_POINTS, 50),
+            (serializer.DECIMATION_ERROR, 0.25)
+        ]:
+            d_gt = simulation_jrpc.get_groundtrack(self.__sc_1_id, {
+                serializer.DECIMATION_MODE_K: mode,
+                serializer.DECIMATION_VALUE_K: value
+            })
+            self.assertLess(len(d_gt), len(gt))
+            for p in d_gt:
+                self.assertIn(p, gt)
+
+        self.assertRaises(
+            Exception, simulation_jrpc.get_groundtrack, self.__sc_1_id,
+            {serializer.DECIMATION_MODE_K: 'unknown'}
+        )
+        self.assertRaises(
+            Exception, simulation_jrpc.get_groundtrack, self.__sc_1_id, {
+                serializer.DECIMATION_MODE_K: serializer.DECIMATION_ERROR,
+                serializer.DECIMATION_VALUE_K: -1
+            }
+        )
+        for value in (1, 0.5, 2.5):
+            self.assertRaises(
+                ValueError, simulation_jrpc.get_groundtrack, self.__sc_1_id, {
+                    serializer.DECIMATION_MODE_K: serializer.DECIMATION_POINTS,
+                    serializer.DECIMATION_VALUE_K: value
+                }
+            )
+
     def test_visualize_groundtracks(self):
         """UNIT test: services.simulation.groundtrack - Simulate KML
         Creates a KML output file with the generated coordinates. The name for
@@ -76,7 +122,7 @@ class JRPCSimulationTest(test.TestCase):
         simulation_models.GroundTrack.objects.propagate()
         gt_f = simulation_models.GroundTrack.objects.all()[0]
         track = simulation_serializer\
-            .SimulationSerializer().serialize_groundtrack(gt_f)
+            .SimulationSerializer().serialize_groundtrack(gt_f.spacecraft)
 
         kml = simplekml.Kml()
         for p in track:
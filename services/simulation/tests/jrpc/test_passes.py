@@ -20,10 +20,14 @@ import logging
 from django import test
 
 from services.common import helpers as db_tools
+from services.common import serialization as sn_serialization
 from services.configuration.jrpc.serializers import segments as segment_serial
 from services.configuration.jrpc.views.segments import groundstations as gs_jrpc
 from services.configuration.jrpc.views.segments import spacecraft as sc_jrpc
 from services.configuration.models import segments as segment_models
+from services.scheduling.jrpc.serializers import availability as \
+    availability_serial
+from services.simulation.jrpc.serializers import passes as pass_serial
 from services.simulation.jrpc.views import passes as pass_views
 from services.simulation.models import passes as pass_models
 
@@ -178,3 +182,146 @@ class JRPCPassesTest(test.TestCase):
         self.assertNotEquals(
             len(pass_views.get_gs_passes(self.__gs_id, [self.__sc_id])), 0
         )
+
+    def test_gs_passes_columnar(self):
+        """JRPC test: services.simulation.gs.passes - columnar formats
+        Validates that the columnar formats carry the same passes as the
+        default one.
+        """
+        gs_jrpc.create(
+            self.__gs_id, self.__gs_callsign, self.__gs_elevation,
+            self.__gs_latitude, self.__gs_longitude,
+            **{'request': self.__request}
+        )
+        sc_jrpc.create(
+            self.__sc_id, self.__sc_callsign, self.__sc_tle_1_id,
+            **{'request': self.__request}
+        )
+
+        self.assertRaises(
+            Exception,
+            pass_views.get_gs_passes, self.__gs_id, [self.__sc_id], 'xml'
+        )
+
+        slots = pass_views.get_gs_passes(self.__gs_id, [self.__sc_id])[
+            self.__sc_id
+        ]
+        columns = pass_views.get_gs_passes(
+            self.__gs_id, [self.__sc_id], sn_serialization.FORMAT_COLUMNAR
+        )[self.__sc_id]
+        packed = pass_views.get_gs_passes(
+            self.__gs_id, [self.__sc_id], sn_serialization.FORMAT_COLUMNAR_B64
+        )[self.__sc_id]
+
+        self.assertNotEquals(len(slots), 0)
+        self.assertEquals(
+            columns[pass_serial.FORMAT_K], sn_serialization.FORMAT_COLUMNAR
+        )
+
+        starts = sn_serialization.delta_decode(
+            columns[availability_serial.DATE_START_K]
+        )
+        self.assertEquals(
+            starts,
+            sn_serialization.delta_decode(
+                packed[availability_serial.DATE_START_K]
+            )
+        )
+        self.assertNotIn(pass_serial.TRACK_K, columns)
+        self.assertNotIn(pass_serial.TRACK_K, packed)
+
+        # The tracks are only included on demand, in any of the formats.
+        for response_format in (
+            sn_serialization.FORMAT_COLUMNAR,
+            sn_serialization.FORMAT_COLUMNAR_B64
+        ):
+            self.assertEquals(
+                len(pass_views.get_gs_passes(
+                    self.__gs_id, [self.__sc_id], response_format, True
+                )[self.__sc_id][pass_serial.TRACK_K]),
+                len(slots)
+            )
+
+        tracked = pass_views.get_gs_passes(
+            self.__gs_id, [self.__sc_id], tracks=True
+        )[self.__sc_id]
+        self.assertEquals(len(tracked), len(slots))
+        for slot in slots:
+            self.assertNotIn(pass_serial.TRACK_K, slot)
+        for slot in tracked:
+            self.assertEquals(
+                pass_serial.TRACK_K in slot,
+                pass_serial.MAX_ELEVATION_K in slot
+            )
+
+        by_start = {
+            pass_serial._timestamp_ms(
+                sn_serialization.deserialize_iso8601_date(
+                    slot[availability_serial.DATE_START_K]
+                )
+            ): slot
+            for slot in slots
+        }
+        self.assertEquals(sorted(starts), sorted(by_start.keys()))
+
+        scale = 10 ** columns[pass_serial.PRECISION_K]
+        elevations = sn_serialization.float32_decode(
+            packed[pass_serial.MAX_ELEVATION_K]
+        )
+
+        for start, duration, elevation, f_elevation in zip(
+            starts, columns[availability_serial.DATE_END_K],
+            columns[pass_serial.MAX_ELEVATION_K], elevations
+        ):
+            slot = by_start[start]
+            self.assertEquals(
+                start + duration, pass_serial._timestamp_ms(
+                    sn_serialization.deserialize_iso8601_date(
+                        slot[availability_serial.DATE_END_K]
+                    )
+                )
+            )
+            if elevation is not None:
+                self.assertAlmostEqual(
+                    elevation / scale, slot[pass_serial.MAX_ELEVATION_K],
+                    places=2
+                )
+                self.assertAlmostEqual(
+                    float(f_elevation), slot[pass_serial.MAX_ELEVATION_K],
+                    places=3
+                )
+
+    def test_passes_single_read(self):
+        """JRPC test: services.simulation.gs/sc.passes - single read
+        The passes for all the spacecraft (or groundstations) must be read
+        with a single query, no matter how many of them are registered.
+        """
+        gs_jrpc.create(
+            self.__gs_id, self.__gs_callsign, self.__gs_elevation,
+            self.__gs_latitude, self.__gs_longitude,
+            **{'request': self.__request}
+        )
+        sc_jrpc.create(
+            self.__sc_id, self.__sc_callsign, self.__sc_tle_1_id,
+            **{'request': self.__request}
+        )
+
+        # 1) groundstation + identifiers + passes
+        with self.assertNumQueries(3):
+            gs_slots = pass_views.get_gs_passes(self.__gs_id, [])
+        with self.assertNumQueries(3):
+            sc_slots = pass_views.get_sc_passes(self.__sc_id, [])
+
+        self.assertIn(self.__sc_id, gs_slots)
+        self.assertNotEquals(len(gs_slots[self.__sc_id]), 0)
+        self.assertEquals(gs_slots[self.__sc_id], sc_slots[self.__gs_id])
+
+        starts = [s[availability_serial.DATE_START_K] for s in sc_slots[
+            self.__gs_id
+        ]]
+        self.assertEquals(
+            [sn_serialization.deserialize_iso8601_date(s) for s in starts],
+            sorted(
+                sn_serialization.deserialize_iso8601_date(s) for s in starts
+            )
+        )
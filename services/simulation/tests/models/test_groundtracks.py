@@ -17,11 +17,15 @@ __author__ = 'rtubiopa@calpoly.edu'
 
 from datetime import timedelta as py_timedelta
 from django import test
+from pytz import utc as pytz_utc
+import datetime
 import logging
 logger = logging.getLogger('simulation')
+import numpy
 
 from services.common import helpers as sn_helpers
 from services.common import misc as sn_misc
+from services.configuration.models import tle as tle_models
 from services.simulation.models import groundtracks as groundtrack_models
 
 
@@ -97,6 +101,200 @@ class GroundTrackTests(test.TestCase):
         self.assertEquals(r_gt.latitude, x_gt['latitude'])
         self.assertEquals(r_gt.longitude, x_gt['longitude'])
 
+    def test_groundtrack_to_dbarray(self):
+        """services.simulation.models.groundtracks: test groundtrack_to_dbarray
+        """
+        ts, lat, lng = groundtrack_models.GroundTrackManager\
+            .groundtrack_to_dbarray((
+                numpy.array([1.0e9, 1.0e9 + 20]),
+                numpy.array([10.5, -10.5]),
+                numpy.array([179.0, -179.0])
+            ))
+
+        self.assertEquals(ts, [1000000000, 1000000020])
+        self.assertEquals(lat, [10.5, -10.5])
+        self.assertEquals(lng, [179.0, -179.0])
+        self.assertIsInstance(ts[0], int)
+        self.assertIsInstance(lat[0], float)
+
+    def test_window(self):
+        """services.simulation.models.groundtracks: test window
+        """
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+
+        def utc(timestamp):
+            return pytz_utc.localize(
+                datetime.datetime.utcfromtimestamp(timestamp)
+            )
+
+        ts, lat, lng = groundtrack_models.GroundTrack.objects.window(
+            self.__sc_1, utc(gt.timestamp[10]), utc(gt.timestamp[40])
+        )
+        self.assertEquals(ts, gt.timestamp[10:41])
+        self.assertEquals(lat, gt.latitude[10:41])
+        self.assertEquals(lng, gt.longitude[10:41])
+
+        ts, lat, lng = groundtrack_models.GroundTrack.objects.window(
+            self.__sc_1, utc(gt.timestamp[10]), utc(gt.timestamp[40]),
+            step=py_timedelta(minutes=1)
+        )
+        self.assertEquals(set(numpy.diff(ts)), {60})
+        self.assertEquals(ts, [t for t in gt.timestamp[10:41] if t % 60 < 20])
+        self.assertEquals(lat, [
+            l for t, l in zip(gt.timestamp[10:41], gt.latitude[10:41])
+            if t % 60 < 20
+        ])
+
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.window(
+                self.__sc_1, utc(gt.timestamp[0] - 3600),
+                utc(gt.timestamp[0] - 60)
+            ), ([], [], [])
+        )
+
+        groundtrack_models.GroundTrack.objects.filter(
+            spacecraft=self.__sc_1
+        ).delete()
+        self.assertRaises(
+            groundtrack_models.GroundTrack.DoesNotExist,
+            groundtrack_models.GroundTrack.objects.window,
+            self.__sc_1, utc(gt.timestamp[10]), utc(gt.timestamp[40])
+        )
+
+    def test_chunks(self):
+        """services.simulation.models.groundtracks: test chunks
+        """
+        seconds = groundtrack_models.GroundTrackChunkManager.seconds()
+        self.assertEquals(
+            groundtrack_models.GroundTrackChunkManager.split(
+                [0, 20, seconds - 1, seconds, 2 * seconds + 20]
+            ),
+            [(0, 0, 3), (seconds, 3, 4), (2 * seconds, 4, 5)]
+        )
+        self.assertEquals(
+            groundtrack_models.GroundTrackChunkManager.split([]), []
+        )
+
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+        chunks = groundtrack_models.GroundTrackChunk.objects.filter(
+            groundtrack=gt
+        ).order_by('start')
+        self.assertGreater(len(chunks), 1)
+        for c in chunks:
+            self.assertEquals(c.start % seconds, 0)
+            self.assertTrue(
+                all(c.start <= t < c.start + seconds for t in c.timestamp)
+            )
+
+        # 1) the points that are already stored are not appended again
+        new_ts = [gt.timestamp[-1] + 20 * i for i in range(2000)]
+        new_lat = [0.0] * len(new_ts)
+        self.assertEquals(
+            groundtrack_models.GroundTrackChunk.objects.append(
+                gt, new_ts, new_lat, new_lat
+            ),
+            len(new_ts) - 1
+        )
+        r_gt = groundtrack_models.GroundTrack.objects.get(
+            spacecraft=self.__sc_1
+        )
+        self.assertEquals(r_gt.timestamp, gt.timestamp + new_ts[1:])
+        self.assertEquals(r_gt.latitude, gt.latitude + new_lat[1:])
+
+        # 2) the points modified through the facade are stored on save
+        r_gt.timestamp = r_gt.timestamp[:10]
+        r_gt.latitude = r_gt.latitude[:10]
+        r_gt.longitude = r_gt.longitude[:10]
+        r_gt.save()
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.get(
+                spacecraft=self.__sc_1
+            ).timestamp,
+            gt.timestamp[:10]
+        )
+
+    def test_delete_older(self):
+        """services.simulation.models.groundtracks: test delete_older
+        """
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+        threshold = pytz_utc.localize(
+            datetime.datetime.utcfromtimestamp(gt.timestamp[10] - 1)
+        )
+
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.delete_older(threshold), 10
+        )
+        r_gt = groundtrack_models.GroundTrack.objects.get(
+            spacecraft=self.__sc_1
+        )
+        self.assertEquals(r_gt.timestamp, gt.timestamp[10:])
+        self.assertEquals(r_gt.latitude, gt.latitude[10:])
+        self.assertEquals(r_gt.longitude, gt.longitude[10:])
+
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.delete_older(threshold), 0
+        )
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.delete_older(
+                threshold + py_timedelta(days=30)
+            ),
+            len(gt.timestamp) - 10
+        )
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.get(
+                spacecraft=self.__sc_1
+            ).timestamp, []
+        )
+
+    def test_regenerate(self):
+        """services.simulation.models.groundtracks: test regenerate
+        """
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+        old_tle = gt.tle
+        old_lat = list(gt.latitude)
+        self.assertIsNone(gt.outdated)
+
+        # 1) the change of the TLE only marks the groundtrack as outdated
+        self.__sc_1.tle = tle_models.TwoLineElement.objects.get(
+            identifier='HUMSAT-D'
+        )
+        self.__sc_1.save()
+
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+        self.assertEquals(gt.tle, old_tle)
+        self.assertIsNotNone(gt.outdated)
+        self.assertEquals(gt.latitude, old_lat)
+
+        # 2) no regeneration before the debounce period expires
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.regenerate(), []
+        )
+
+        # 3) each outdated groundtrack is regenerated once per batch
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.mark_outdated(
+                spacecraft=self.__sc_1
+            ), 1
+        )
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.regenerate(
+                debounce=py_timedelta(0)
+            ),
+            [self.__sc_1_id]
+        )
+        self.assertEquals(
+            groundtrack_models.GroundTrack.objects.regenerate(
+                debounce=py_timedelta(0)
+            ),
+            []
+        )
+
+        gt = groundtrack_models.GroundTrack.objects.get(spacecraft=self.__sc_1)
+        self.assertEquals(gt.tle, self.__sc_1.tle)
+        self.assertIsNone(gt.outdated)
+        self.assertNotEquals(len(gt.latitude), 0)
+        self.assertNotEquals(gt.latitude, old_lat)
+
     def test_groundtracks_reboot(self):
         """UNIT test: services.simulation.models - gts generation REBOOT
         """
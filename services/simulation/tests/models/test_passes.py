@@ -18,10 +18,13 @@ __author__ = 'rtubiopa@calpoly.edu'
 from datetime import timedelta as py_timedelta
 from django import test
 import logging
+import numpy
 logger = logging.getLogger('simulation')
 
 from services.common import misc as sn_misc
 from services.common import helpers as db_tools
+from services.common import simulation
+from services.configuration.models import segments as segment_models
 from services.configuration.models import tle as tle_models
 from services.simulation.models import passes as pass_models
 
@@ -138,6 +141,78 @@ class TestModels(test.TestCase):
             )
         )
 
+    def test_bulk_create_passes(self):
+        """UNIT test: services.simulation.models.passes - bulk creation
+        This test validates that the passes created in bulk are checked for
+        duplicates both against the existing passes and against the passes of
+        the same batch.
+        """
+        slot_s = sn_misc.get_next_midnight()
+        slot_e = slot_s + py_timedelta(minutes=10)
+        hour = py_timedelta(hours=1)
+
+        pass_models.PassSlots.objects.create(
+            spacecraft=self.__sc_1, groundstation=self.__gs_1,
+            start=slot_s, end=slot_e
+        )
+
+        created = pass_models.PassSlots.objects.bulk_create_passes({
+            (self.__sc_1, self.__gs_1): [
+                (
+                    slot_s + py_timedelta(seconds=10),
+                    slot_e - py_timedelta(seconds=10)
+                ),
+                (slot_s + hour, slot_e + hour),
+                (slot_s + hour + py_timedelta(seconds=5), slot_e + hour)
+            ]
+        })
+
+        self.assertEquals(len(created), 1)
+        self.assertIsNotNone(created[0].pk)
+        self.assertEquals(created[0].start, slot_s + hour)
+        self.assertEquals(created[0].end, slot_e + hour)
+        self.assertEquals(
+            pass_models.PassSlots.objects.filter(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1,
+                start__gte=slot_s
+            ).count(), 2
+        )
+        self.assertEquals(
+            pass_models.PassSlots.objects.bulk_create_passes({
+                (self.__sc_1, self.__gs_1): [(slot_s + hour, slot_e + hour)]
+            }), []
+        )
+
+    def test_bulk_create_passes_geometry(self):
+        """UNIT test: services.simulation.models.passes - pass geometry
+        This test validates that the geometry of the passes is stored together
+        with the passes and that their tracks are unpacked back unchanged.
+        """
+        slot_s = sn_misc.get_next_midnight()
+        slot_e = slot_s + py_timedelta(minutes=10)
+        track = numpy.array([
+            [0, 200.5, 0, -6000],
+            [300, 110.25, 45.5, 0],
+            [600, 20.125, 0, 6000]
+        ], dtype=numpy.float32)
+        geometry = simulation.PassGeometry(
+            max_elevation=45.5, culmination=slot_s + py_timedelta(minutes=5),
+            aos_azimuth=200.5, los_azimuth=20.125, track=track
+        )
+
+        pass_models.PassSlots.objects.bulk_create_passes({
+            (self.__sc_1, self.__gs_1): [(slot_s, slot_e, geometry)]
+        })
+
+        pass_slot = pass_models.PassSlots.objects.get(
+            spacecraft=self.__sc_1, groundstation=self.__gs_1, start=slot_s
+        )
+        self.assertEquals(pass_slot.max_elevation, 45.5)
+        self.assertEquals(pass_slot.culmination, geometry.culmination)
+        self.assertEquals(pass_slot.aos_azimuth, 200.5)
+        self.assertEquals(pass_slot.los_azimuth, 20.125)
+        numpy.testing.assert_array_equal(pass_slot.get_track(), track)
+
     def test_firebird(self):
         """UNIT test: Firebird TLE bug
         Test carried out to find what is the problem with the Firebird TLE and
@@ -201,3 +276,260 @@ class TestModels(test.TestCase):
             spacecraft=self.__sc_1
         ).count()
         self.assertEquals(sc_passes_n_4, sc_passes_n_3)
+
+    def test_propagate_parallel(self):
+        """UNIT test: services.simulation.models - parallel propagation
+        This test validates that the passes propagated by a pool of worker
+        processes are the same as the ones propagated serially.
+        """
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=30),
+            sn_misc.get_next_midnight() + py_timedelta(days=31)
+        )
+
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassWatermark.objects.all().delete()
+        s_slots = pass_models.PassSlots.objects.propagate(
+            interval=interval, workers=1
+        )
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassWatermark.objects.all().delete()
+        p_slots = pass_models.PassSlots.objects.propagate(
+            interval=interval, workers=2
+        )
+
+        self.assertNotEqual(len(s_slots), 0)
+        self.assertEquals(s_slots, p_slots)
+
+    def test_propagate_parallel_failure(self):
+        """UNIT test: services.simulation.models - failed parallel propagation
+        This test validates that, when the propagation of a spacecraft fails
+        within a worker process, neither its passes are stored nor the
+        watermarks of its pairs are advanced, so that the next propagation
+        calculates them.
+        """
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=30),
+            sn_misc.get_next_midnight() + py_timedelta(days=31)
+        )
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassWatermark.objects.all().delete()
+
+        # A TLE that cannot be read makes the job fail within the worker.
+        tle = self.__sc_1.tle
+        tle_models.TwoLineElement.objects.filter(pk=tle.pk).update(
+            first_line='1 ' + 'X' * 67
+        )
+        pass_models.PassSlots.objects.propagate(interval=interval, workers=2)
+
+        self.assertFalse(
+            pass_models.PassSlots.objects.filter(
+                spacecraft=self.__sc_1
+            ).exists()
+        )
+        self.assertFalse(
+            pass_models.PassWatermark.objects.filter(
+                spacecraft=self.__sc_1
+            ).exists()
+        )
+
+        tle_models.TwoLineElement.objects.filter(pk=tle.pk).update(
+            first_line=tle.first_line
+        )
+        slots = pass_models.PassSlots.objects.propagate(
+            interval=interval, workers=2
+        )
+
+        self.assertNotEqual(len(slots), 0)
+        self.assertEquals(
+            pass_models.PassSlots.objects.filter(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1
+            ).count(),
+            len(slots)
+        )
+        self.assertTrue(
+            pass_models.PassWatermark.objects.filter(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1
+            ).exists()
+        )
+
+    def test_propagate_watermarks(self):
+        """UNIT test: services.simulation.models - incremental propagation
+        This test validates that the propagation only simulates the part of
+        the window that had not been propagated yet for each pair, and that
+        the passes cut off by the end of the window are not stored.
+        """
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=30),
+            sn_misc.get_next_midnight() + py_timedelta(days=31)
+        )
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassWatermark.objects.all().delete()
+
+        slots_1 = pass_models.PassSlots.objects.propagate(interval=interval)
+        watermark = pass_models.PassWatermark.objects.get(
+            spacecraft=self.__sc_1, groundstation=self.__gs_1
+        ).propagated_until
+
+        self.assertNotEqual(len(slots_1), 0)
+        self.assertLessEqual(watermark, interval[1])
+        for slot in slots_1:
+            self.assertLess(slot[1], interval[1])
+
+        self.assertEquals(
+            pass_models.PassSlots.objects.propagate(interval=interval), []
+        )
+
+        interval = (interval[0], interval[1] + py_timedelta(days=1))
+        slots_2 = pass_models.PassSlots.objects.propagate(interval=interval)
+
+        self.assertNotEqual(len(slots_2), 0)
+        for slot in slots_2:
+            self.assertGreaterEqual(slot[0], watermark)
+        self.assertEquals(
+            pass_models.PassSlots.objects.filter(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1
+            ).count(),
+            len(slots_1) + len(slots_2)
+        )
+
+    def test_propagate_default_window(self):
+        """UNIT test: services.simulation.models - default window
+        This test validates that the default window of the propagation is the
+        update window at the time of each propagation, not the one at the time
+        at which the module was imported.
+        """
+        interval = (
+            sn_misc.get_next_midnight() + py_timedelta(days=40),
+            sn_misc.get_next_midnight() + py_timedelta(days=41)
+        )
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassWatermark.objects.all().delete()
+
+        get_update_window = simulation.OrbitalSimulator.__dict__[
+            'get_update_window'
+        ]
+        simulation.OrbitalSimulator.get_update_window = staticmethod(
+            lambda: interval
+        )
+        try:
+            slots = pass_models.PassSlots.objects.propagate()
+        finally:
+            simulation.OrbitalSimulator.get_update_window = get_update_window
+
+        self.assertNotEqual(len(slots), 0)
+        for slot in slots:
+            self.assertGreaterEqual(slot[0], interval[0])
+            self.assertLessEqual(slot[1], interval[1])
+
+    def test_overlapping(self):
+        """UNIT test: services.common.slots.SlotQuerySet.overlapping
+        All the slots that overlap with the window must be selected, no
+        matter whether they exceed its limits or not.
+        """
+        start = sn_misc.get_next_midnight() + py_timedelta(days=30)
+        window = (start, start + py_timedelta(hours=1))
+        minutes = [
+            (-20, -10),     # before
+            (-10, 0),       # touching the start
+            (-10, 10),      # across the start
+            (10, 20),       # within
+            (50, 70),       # across the end
+            (-10, 70),      # across both
+            (60, 70)        # touching the end
+        ]
+        pass_models.PassSlots.objects.bulk_create([
+            pass_models.PassSlots(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1,
+                start=start + py_timedelta(minutes=s),
+                end=start + py_timedelta(minutes=e)
+            )
+            for s, e in minutes
+        ])
+
+        self.assertEquals(
+            sorted(
+                (s.start, s.end)
+                for s in pass_models.PassSlots.objects.filter(
+                    spacecraft=self.__sc_1, groundstation=self.__gs_1
+                ).overlapping(*window)
+            ),
+            sorted(
+                (
+                    start + py_timedelta(minutes=s),
+                    start + py_timedelta(minutes=e)
+                )
+                for s, e in minutes[2:6]
+            )
+        )
+
+    def test_indexes(self):
+        """UNIT test: services.simulation.models.passes - indexes
+        The lookups of the passes of a pair within a time range must be
+        resolved with the composite indexes, on a table of realistic size.
+        """
+        start = sn_misc.get_next_midnight()
+        pairs = [
+            (sc, gs)
+            for sc in segment_models.Spacecraft.objects.all()
+            for gs in segment_models.GroundStation.objects.all()
+        ]
+        pass_models.PassSlots.objects.bulk_create([
+            pass_models.PassSlots(
+                spacecraft=sc, groundstation=gs,
+                start=start + py_timedelta(minutes=100 * i),
+                end=start + py_timedelta(minutes=100 * i + 10)
+            )
+            for sc, gs in pairs
+            for i in range(20000 // len(pairs))
+        ])
+
+        sc, gs = pairs[0]
+        window = (start, start + py_timedelta(days=1))
+
+        for queryset in [
+            pass_models.PassSlots.objects.filter(
+                groundstation=gs, spacecraft=sc, start__range=window
+            ),
+            pass_models.PassSlots.objects.filter(
+                spacecraft=sc, groundstation__in=[gs], start__range=window
+            ),
+            pass_models.PassSlots.objects.filter(
+                groundstation=gs, spacecraft=sc
+            ).order_by('-start')[:1],
+            pass_models.PassSlots.objects.filter(
+                groundstation=gs, start__range=window
+            ).order_by('start'),
+            pass_models.PassSlots.objects.filter(
+                spacecraft=sc, start__range=window
+            ).order_by('start')
+        ]:
+            plan = db_tools.explain(queryset)
+            self.assertIn('Index', plan)
+            self.assertNotIn('Seq Scan', plan)
+
+    def test_read_grouped(self):
+        """UNIT test: services.simulation.models.passes - read_grouped
+        Only the upcoming passes must be read, grouped by the identifier of
+        the segment and ordered by their start.
+        """
+        now = sn_misc.get_now_utc()
+        pass_models.PassSlots.objects.all().delete()
+        pass_models.PassSlots.objects.bulk_create([
+            pass_models.PassSlots(
+                spacecraft=self.__sc_1, groundstation=self.__gs_1,
+                start=now + py_timedelta(minutes=m),
+                end=now + py_timedelta(minutes=m + 10)
+            )
+            for m in (100, -100, 0, -5)
+        ])
+
+        grouped = pass_models.PassSlots.objects.read_grouped(
+            'groundstation', [self.__gs_1_id, 'no-gs'], spacecraft=self.__sc_1
+        )
+
+        self.assertEquals(grouped['no-gs'], [])
+        self.assertEquals(
+            [s.start for s in grouped[self.__gs_1_id]],
+            [now + py_timedelta(minutes=m) for m in (-5, 0, 100)]
+        )
@@ -0,0 +1,98 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import ephem
+import logging
+from django import test
+
+from services.common import simulation
+from services.configuration.models import segments as segment_models
+from services.simulation import benchmark
+from services.simulation.models import passes as pass_models
+
+
+class BenchmarkTest(test.TestCase):
+    """UNIT tests
+    Tests for the benchmark of the simulations.
+    """
+
+    def setUp(self):
+        """Test setup
+        """
+        self.__verbose_testing = False
+
+        if not self.__verbose_testing:
+            logging.getLogger('simulation').setLevel(level=logging.CRITICAL)
+
+    def test_synthetic_catalogue(self):
+        """UNIT test: services.simulation.benchmark.synthetic_catalogue
+        The synthetic TLEs must be valid and reproducible.
+        """
+        tles = benchmark.synthetic_catalogue(50, seed=1)
+
+        self.assertEquals(len(tles), 50)
+        self.assertEquals(tles, benchmark.synthetic_catalogue(50, seed=1))
+
+        for tle in tles:
+            for line in (tle.first_line, tle.second_line):
+                self.assertEquals(len(line), 69)
+                self.assertEquals(
+                    int(line[-1]), benchmark.tle_checksum(line[:-1])
+                )
+            ephem.readtle(tle.identifier, tle.first_line, tle.second_line)
+
+        stations = benchmark.station_grid(20)
+        self.assertEquals(len(stations), 20)
+        for s in stations:
+            self.assertTrue(-90 < s.latitude < 90)
+            self.assertTrue(-180 <= s.longitude < 180)
+
+    def test_run(self):
+        """UNIT test: services.simulation.benchmark.run
+        The benchmark must time all the stages and leave the database
+        untouched.
+        """
+        result = benchmark.run(2, 3, days=1)
+
+        self.assertEquals(result['objects'], 2)
+        self.assertEquals(result['stations'], 3)
+        self.assertGreater(result['passes']['passes'], 0)
+        self.assertEquals(
+            result['passes']['geometry_evaluations'],
+            result['passes']['passes'] * (
+                2 + simulation.OrbitalSimulator.PASS_CULMINATION_EVALUATIONS
+            )
+        )
+        self.assertEquals(result['groundtracks']['points'], 2 * 4320)
+        self.assertEquals(
+            result['persistence']['passes']['rows'],
+            result['passes']['passes']
+        )
+        # One chunk every 6 hours, for each groundtrack
+        self.assertEquals(
+            result['persistence']['groundtracks']['rows'], 2 * 4
+        )
+
+        self.assertFalse(segment_models.Spacecraft.objects.filter(
+            identifier__startswith='BENCH-'
+        ).exists())
+        self.assertEquals(pass_models.PassSlots.objects.count(), 0)
+
+        self.assertRaises(ValueError, benchmark.run, 0, 1)
+        self.assertRaises(
+            ValueError, benchmark.run, 1, benchmark.MAX_STATIONS + 1
+        )
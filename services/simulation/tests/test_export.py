@@ -0,0 +1,117 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+import csv
+import json
+import logging
+from django import test
+
+from services.common import helpers as db_tools, simulation
+from services.simulation import export as simulation_export
+from services.simulation import views as simulation_views
+from services.simulation.models import passes as pass_models
+
+
+class TestExport(test.TestCase):
+    """Test class for the export of the passes.
+    """
+
+    def setUp(self):
+        """Database setup for the tests.
+        """
+        self.__verbose_testing = False
+
+        self.__user = db_tools.create_user_profile()
+
+        self.__gs_1_id = 'gs-uvigo'
+        self.__gs_1 = db_tools.create_gs(
+            user_profile=self.__user, identifier=self.__gs_1_id
+        )
+        self.__sc_1_id = 'xatcobeo-sc'
+        self.__sc_1 = db_tools.create_sc(
+            user_profile=self.__user,
+            identifier=self.__sc_1_id, tle_id='CANX-2'
+        )
+
+        self.__start, self.__end = \
+            simulation.OrbitalSimulator.get_simulation_window()
+        self.__passes = pass_models.PassSlots.objects.overlapping(
+            self.__start, self.__end
+        ).count()
+
+        if not self.__verbose_testing:
+            logging.getLogger('simulation').setLevel(level=logging.CRITICAL)
+
+    def test_read_passes(self):
+        """UNIT test: services.simulation.export.read_passes
+        All the passes must be read, ordered by their start, no matter the
+        size of the batches.
+        """
+        self.assertNotEqual(self.__passes, 0)
+
+        rows = list(simulation_export.read_passes(
+            self.__start, self.__end, batch_size=3
+        ))
+        self.assertEqual(len(rows), self.__passes)
+        self.assertEqual(
+            [r[2] for r in rows], sorted(r[2] for r in rows)
+        )
+        self.assertEqual(
+            set((r[0], r[1]) for r in rows),
+            set([(self.__sc_1_id, self.__gs_1_id)])
+        )
+
+    def test_export_formats(self):
+        """UNIT test: services.simulation.views.PassesExport
+        Both formats must contain one line per pass, with the same columns as
+        the JRPC responses.
+        """
+        view = simulation_views.PassesExport.as_view()
+
+        request = db_tools.create_request(
+            url='/simulation/passes/export', user_profile=self.__user
+        )
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), self.__passes)
+        for line in lines:
+            self.assertEqual(
+                set(json.loads(line).keys()), set(simulation_export.COLUMNS)
+            )
+
+        request = db_tools.create_request(
+            url='/simulation/passes/export?format=csv',
+            user_profile=self.__user
+        )
+        response = view(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        rows = list(csv.reader(
+            b''.join(response.streaming_content).decode().splitlines()
+        ))
+        self.assertEqual(tuple(rows[0]), simulation_export.COLUMNS)
+        self.assertEqual(len(rows), self.__passes + 1)
+
+        request = db_tools.create_request(
+            url='/simulation/passes/export?format=xml',
+            user_profile=self.__user
+        )
+        self.assertEqual(view(request).status_code, 400)
@@ -0,0 +1,69 @@
+"""
+   Copyright 2013, 2014 Ricardo Tubio-Pardavila
+
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+__author__ = 'rtubiopa@calpoly.edu'
+
+from django import http
+from django.views.generic import base as base_views
+
+from services.common import serialization as sn_serialization, simulation
+from services.simulation import export as simulation_export
+
+
+class PassesExport(base_views.View):
+    """
+    Streams all the passes for all the pairs within a window, either as
+    newline-delimited JSON (format=ndjson, default) or as CSV (format=csv).
+    The window is given by the "start" and "end" ISO-8601 parameters and it
+    defaults to the current simulation window.
+    """
+
+    # noinspection PyUnusedLocal
+    def get(self, request, *args, **kwargs):
+        """GET handler
+        :param request: HTTP request
+        :return: Streaming HTTP response with the passes
+        """
+        export_format = request.GET.get(
+            'format', simulation_export.FORMAT_NDJSON
+        )
+        if export_format not in simulation_export.FORMATS:
+            return http.HttpResponseBadRequest(
+                'Format <' + export_format + '> not supported.'
+            )
+
+        start, end = simulation.OrbitalSimulator.get_simulation_window()
+
+        try:
+            if 'start' in request.GET:
+                start = sn_serialization.deserialize_iso8601_date(
+                    request.GET['start']
+                )
+            if 'end' in request.GET:
+                end = sn_serialization.deserialize_iso8601_date(
+                    request.GET['end']
+                )
+        except ValueError as ex:
+            return http.HttpResponseBadRequest(str(ex))
+
+        writer, content_type = simulation_export.FORMATS[export_format]
+        response = http.StreamingHttpResponse(
+            writer(simulation_export.read_passes(start, end)),
+            content_type=content_type
+        )
+        response['Content-Disposition'] = \
+            'attachment; filename="passes.' + export_format + '"'
+
+        return response
@@ -399,6 +399,21 @@ USE_PUSHER = False
 # ### Username used during tests
 TEST_USERNAME = 'rtubio'
 
+# ### Number of worker processes for the propagation of the passes (values
+# ### smaller than 2 run the propagation within the calling process)
+PASS_PROPAGATION_WORKERS = 1
+
+# ### Memory budget (bytes) for the ephemerides of the spacecraft that are
+# ### shared in between the calculations of groundtracks and passes
+EPHEMERIS_CACHE_SIZE = 256 * 1024 * 1024
+
+# ### Propagator for the orbital simulations: 'pyephem' or 'sgp4' (vectorized
+# ### near-Earth SGP4, deep space orbits are still propagated with PyEphem)
+SIMULATION_PROPAGATOR = 'pyephem'
+# ### Maximum difference (seconds) in between the AOS/LOS instants calculated
+# ### with each one of the propagators for the cross-validation tests
+SIMULATION_PROPAGATOR_TOLERANCE = 1.0
+
 # ### pusher.com configuration
 PUSHER_APP_ID = pusher.PUSHER_APP_ID
 PUSHER_APP_KEY = pusher.PUSHER_APP_KEY
@@ -60,6 +60,10 @@ urlpatterns = urls.patterns(
         r'^communications/',
         urls.include('services.communications.urls')
     ),
+    urls.url(
+        r'^simulation/',
+        urls.include('services.simulation.urls')
+    ),
     urls.url(
         r'^phppgadmin/$',
         RedirectView.as_view(url='/phppgadmin'),